@@ -136,7 +136,7 @@ setup(
     #
     # For an analysis of "install_requires" vs pip's requirements files see:
     # https://packaging.python.org/discussions/install-requires-vs-requirements/
-    install_requires = [ "ijson", "event-notifier" ], # Optional
+    install_requires = [ "ijson>=3.1,<4", "event-notifier" ], # Optional
 
     # List additional groups of dependencies here (e.g. development
     # dependencies). Users will be able to install these using the "extras"
@@ -147,6 +147,7 @@ setup(
     # Similar to `install_requires` above, these must be valid existing
     # projects.
     extras_require = { # Optional
+        "statistics": [ "numpy" ],
     },
 
     # If there are data files included in your packages that need to be
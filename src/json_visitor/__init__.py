@@ -0,0 +1,30 @@
+from importlib import import_module
+import sys
+
+# The public classes are importable from the package, but their modules are only imported on first access (PEP 562), so `import json_visitor` doesn't load the adapters, the scopes or ijson.
+_LazyAttributes = {
+    "JsonVisitor": ".json_visitor",
+    "PathTracker": ".tokenizer.path_tracker",
+    "ScopeWalker": ".tokenizer.scope_walker",
+    "StageStatistics": ".tokenizer.stage_statistics",
+    "TokenProcessor": ".tokenizer.token_processor",
+}
+
+__all__ = list( _LazyAttributes )
+
+def __getattr__( name: str ):
+    module_name = _LazyAttributes.get( name, None )
+    if module_name is None:
+        raise AttributeError( f"module '{ __name__ }' has no attribute '{ name }'" )
+
+    value = getattr( import_module( module_name, __name__ ), name )
+    globals()[ name ] = value
+
+    return value
+
+def __dir__():
+    return sorted( set( globals() ) | set( _LazyAttributes ) )
+
+if sys.version_info < ( 3, 7 ): # Module `__getattr__` is not supported.
+    for _name in _LazyAttributes:
+        __getattr__( _name )
@@ -0,0 +1,5 @@
+import sys
+from .main import main as entry_point
+
+if __name__ == "__main__":
+    sys.exit( entry_point() )
@@ -0,0 +1,124 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, List
+
+import json
+import random
+
+# Each generator produces a document of approximately `size` bytes; the generators are seeded so the corpora are identical across runs.
+
+def _fill_array( size: int, make_item: Callable[ [ int, random.Random ], Any ], seed: int ) -> List[ Any ]:
+    rng = random.Random( seed )
+    items: List[ Any ] = []
+    length: int = 2
+
+    while length < size:
+        item = make_item( len( items ), rng )
+        items.append( item )
+        length += len( json.dumps( item ) ) + 2
+
+    return items
+
+def wide_object( size: int ) -> bytes:
+    """
+    A single object with many members.
+    """
+
+    rng = random.Random( 1 )
+    members: Dict[ str, Any ] = {}
+    length: int = 2
+
+    while length < size:
+        name = f"member_{ len( members ) }"
+        value = rng.choice( [ rng.randint( 0, 10 ** 6 ), f"value { len( members ) }", True, None ] )
+        members[ name ] = value
+        length += len( name ) + len( json.dumps( value ) ) + 6
+
+    return json.dumps( members ).encode( "utf-8" )
+
+def deep_nesting( size: int, depth: int = 64 ) -> bytes:
+    """
+    An array of deeply nested objects and arrays.
+    """
+
+    def make_item( index_: int, rng: random.Random ) -> Any:
+        value: Any = index_
+        for level in range( depth ):
+            value = { "child": value, "level": level } if level % 2 == 0 else [ value ]
+
+        return value
+
+    return json.dumps( _fill_array( size, make_item, 2 ) ).encode( "utf-8" )
+
+def long_scalar_array( size: int ) -> bytes:
+    """
+    A single long array of integers.
+    """
+
+    return json.dumps( _fill_array( size, lambda index_, rng: rng.randint( -10 ** 6, 10 ** 6 ), 3 ) ).encode( "utf-8" )
+
+def small_object_array( size: int ) -> bytes:
+    """
+    A long array of small objects.
+    """
+
+    def make_item( index_: int, rng: random.Random ) -> Any:
+        return { "id": index_, "name": f"item { index_ }", "active": rng.random() < 0.5, "score": rng.randint( 0, 100 ), "tags": [ "a", "b" ] }
+
+    return json.dumps( _fill_array( size, make_item, 4 ) ).encode( "utf-8" )
+
+def string_heavy( size: int ) -> bytes:
+    """
+    An array of long strings, including escaped and non-ASCII characters.
+    """
+
+    alphabet = "abcdefghijklmnopqrstuvwxyz éü中\"\\\n\t"
+
+    def make_item( index_: int, rng: random.Random ) -> Any:
+        return "".join( rng.choice( alphabet ) for _ in range( rng.randint( 50, 500 ) ) )
+
+    return json.dumps( _fill_array( size, make_item, 5 ), ensure_ascii = False ).encode( "utf-8" )
+
+def number_heavy( size: int ) -> bytes:
+    """
+    An array of arrays of non-integer numbers.
+    """
+
+    def make_item( index_: int, rng: random.Random ) -> Any:
+        return [ round( rng.uniform( -1e6, 1e6 ), rng.randint( 1, 8 ) ) for _ in range( 16 ) ]
+
+    return json.dumps( _fill_array( size, make_item, 6 ) ).encode( "utf-8" )
+
+def ndjson( size: int ) -> bytes:
+    """
+    JSON Lines: one small object per line.
+    """
+
+    rng = random.Random( 7 )
+    lines: List[ str ] = []
+    length: int = 0
+
+    while length < size:
+        line = json.dumps( { "id": len( lines ), "event": rng.choice( [ "open", "close", "read", "write" ] ), "bytes": rng.randint( 0, 65536 ), "ok": rng.random() < 0.9, "latency": round( rng.uniform( 0, 2 ), 4 ) } )
+        lines.append( line )
+        length += len( line ) + 1
+
+    return ( "\n".join( lines ) + "\n" ).encode( "utf-8" )
+
+Corpora: Dict[ str, Callable[ [ int ], bytes ] ] = {
+    "wide_object": wide_object,
+    "deep_nesting": deep_nesting,
+    "long_scalar_array": long_scalar_array,
+    "small_object_array": small_object_array,
+    "string_heavy": string_heavy,
+    "number_heavy": number_heavy,
+    "ndjson": ndjson,
+}
+"""
+The corpus generators by name.
+"""
+
+MultipleDocumentCorpora = frozenset( [ "ndjson" ] )
+"""
+The names of the corpora which contain a sequence of documents rather than a single document.
+"""
@@ -0,0 +1,164 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+import os
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from .reporting import compare_results, format_comparison, format_table, load_results, write_results
+
+Targets: Dict[ str, List[ str ] ] = {
+    "package": [ "-c", "import json_visitor" ],
+    "visitor": [ "-c", "import json_visitor.json_visitor" ],
+    "cli_module": [ "-c", "import json_visitor.main" ],
+    "cli_help": [ "-m", "json_visitor", "--help" ],
+    "cli_string": [ "-m", "json_visitor", "-I", "-s", "[1]" ],
+    "cli_stats": [ "-m", "json_visitor", "--stats", "-s", "[1]" ],
+}
+"""
+The interpreter arguments of each benchmarked start-up by name.
+"""
+
+def _get_package_parent() -> str:
+    return os.path.dirname( os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) ) )
+
+def parse_import_times( output: str ) -> List[ Tuple[ str, int, int, int ] ]:
+    """
+    Parses the `-X importtime` report.
+
+    Parameters:
+        `output`: the standard error of the interpreter.
+
+    Returns:
+        List of `( module, nesting depth, self microseconds, cumulative microseconds )` tuples in the order the imports completed.
+    """
+
+    imports = []
+
+    for line in output.splitlines():
+        if not line.startswith( "import time:" ):
+            continue
+
+        fields = line[ len( "import time:" ): ].split( "|" )
+        if len( fields ) != 3 or not fields[ 0 ].strip().isdigit():
+            continue # The header line.
+
+        # The module name is indented by two spaces per nesting level after the separating space.
+        name = fields[ 2 ][ 1: ].rstrip()
+        depth = ( len( name ) - len( name.lstrip() ) ) // 2
+
+        imports.append( ( name.strip(), depth, int( fields[ 0 ] ), int( fields[ 1 ] ) ) )
+
+    return imports
+
+def measure( arguments: List[ str ] ) -> Dict[ str, Any ]:
+    """
+    Starts an interpreter with `-X importtime` and the arguments, measuring the import times and the wall time.
+
+    Returns:
+        Dictionary with the wall time in seconds, the total import time and the import time of the package's modules in microseconds, the modules imported and their cumulative import times.
+    """
+
+    environment = dict( os.environ )
+    environment[ "PYTHONPATH" ] = os.pathsep.join( path for path in [ _get_package_parent(), environment.get( "PYTHONPATH", "" ) ] if path )
+
+    start = time.perf_counter()
+    completed = subprocess.run( [ sys.executable, "-X", "importtime" ] + arguments, stdout = subprocess.DEVNULL, stderr = subprocess.PIPE, env = environment, universal_newlines = True )
+    wall_seconds = time.perf_counter() - start
+
+    imports = parse_import_times( completed.stderr )
+
+    return {
+        "wall_seconds": wall_seconds,
+        # Top-level entries are the imports not nested in another import; their cumulative times add up to the total.
+        "import_us": sum( cumulative_us for _, depth, _, cumulative_us in imports if depth == 0 ),
+        "package_import_us": sum( cumulative_us for name, depth, _, cumulative_us in imports if depth == 0 and name.split( "." )[ 0 ] == "json_visitor" ),
+        "modules": [ name for name, _, _, _ in imports ],
+        "cumulative_us": { name: cumulative_us for name, _, _, cumulative_us in imports },
+    }
+
+def run_benchmark( target_names: Iterable[ str ], repeat: int ) -> List[ Dict[ str, Any ] ]:
+    """
+    Runs the import time benchmark.
+
+    Parameters:
+        `target_names`: the names of the start-ups to measure.
+        `repeat`: the number of measured start-ups per target; the fastest start-up is reported. An unmeasured start-up precedes them to populate the bytecode caches.
+
+    Returns:
+        List of result records.
+    """
+
+    results = []
+
+    for target_name in target_names:
+        measure( Targets[ target_name ] )
+
+        measurements = [ measure( Targets[ target_name ] ) for _ in range( repeat ) ]
+        fastest = min( measurements, key = lambda measurement: measurement[ "import_us" ] )
+
+        results.append( {
+            "target": target_name,
+            "wall_ms": min( measurement[ "wall_seconds" ] for measurement in measurements ) * 1e3,
+            "import_ms": fastest[ "import_us" ] / 1e3,
+            "package_import_ms": fastest[ "package_import_us" ] / 1e3,
+            "module_count": len( fastest[ "modules" ] ),
+            "slowest_imports": sorted( fastest[ "cumulative_us" ].items(), key = lambda item: -item[ 1 ] )[ :10 ],
+            "package_modules": [ name for name in fastest[ "modules" ] if name.split( "." )[ 0 ] == "json_visitor" ],
+            "ijson_imported": "ijson" in fastest[ "modules" ],
+        } )
+
+    return results
+
+def add_arguments( parser: ArgumentParser ) -> None:
+    """
+    Adds the benchmark's command line arguments to the parser.
+    """
+
+    parser.add_argument( "--target", dest = "targets", action = "append", choices = sorted( Targets ), help = "Start-up to measure; may be repeated. All start-ups are measured by default." )
+    parser.add_argument( "--repeat", type = int, default = 5, help = "Number of measured start-ups; the fastest is reported. The default is 5.", metavar = "N" )
+    parser.add_argument( "--verbose", action = "store_true", help = "Lists the slowest imports and the package modules imported by each start-up." )
+    parser.add_argument( "--output", help = "Writes the results as JSON to the given path.", metavar = "<file path>" )
+    parser.add_argument( "--baseline", help = "Compares the results against the results JSON at the given path; the exit code is 1 if any result regressed.", metavar = "<file path>" )
+    parser.add_argument( "--tolerance", type = float, default = 0.2, help = "Relative import time increase, as a fraction, tolerated before a result is a regression. The default is 0.2.", metavar = "<fraction>" )
+
+def run( arguments: Namespace ) -> int:
+    """
+    Runs the benchmark with the parsed command line arguments.
+
+    Returns:
+        The exit code: 0 on success, 1 if a regression against the baseline was found.
+    """
+
+    target_names = arguments.targets or list( Targets )
+
+    results = run_benchmark( target_names, max( arguments.repeat, 1 ) )
+
+    print( format_table(
+        ( "target", "wall ms", "import ms", "package import ms", "modules", "package modules", "ijson" ),
+        [ ( result[ "target" ], f"{ result[ 'wall_ms' ]:.1f}", f"{ result[ 'import_ms' ]:.1f}", f"{ result[ 'package_import_ms' ]:.1f}", result[ "module_count" ], len( result[ "package_modules" ] ), "yes" if result[ "ijson_imported" ] else "no" ) for result in results ],
+    ) )
+
+    if arguments.verbose:
+        for result in results:
+            print()
+            print( format_table( ( f"{ result[ 'target' ] }: slowest imports", "cumulative ms" ), [ ( name, f"{ cumulative_us / 1e3:.2f}" ) for name, cumulative_us in result[ "slowest_imports" ] ] ) )
+            print( f"Package modules: { ', '.join( result[ 'package_modules' ] ) }" )
+
+    if arguments.output:
+        write_results( arguments.output, "import_time", results, repeat = arguments.repeat )
+
+    exit_code = 0
+
+    if arguments.baseline:
+        comparisons = compare_results( results, load_results( arguments.baseline )[ "results" ], ( "target", ), "import_ms", False, arguments.tolerance )
+
+        print()
+        print( format_comparison( comparisons, "import ms" ) )
+
+        if any( is_regression for *_, is_regression in comparisons ):
+            exit_code = 1
+
+    return exit_code
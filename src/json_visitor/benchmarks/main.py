@@ -0,0 +1,52 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict
+
+import sys
+from argparse import ArgumentParser, Namespace
+from . import __name__ as PackageName
+from . import import_time, memory, throughput, walker
+
+# Benchmark name to the module implementing it; each module provides `add_arguments( parser )` and `run( arguments ) -> int`.
+_Benchmarks: Dict[ str, Any ] = {
+    "throughput": throughput,
+    "walker": walker,
+    "memory": memory,
+    "import-time": import_time,
+}
+
+_Descriptions: Dict[ str, str ] = {
+    "throughput": "Measures end-to-end throughput over synthetic JSON corpora.",
+    "walker": "Measures scope walker and adapter dispatch cost by replaying pre-tokenized corpora.",
+    "memory": "Measures the memory footprint of scope tracking over growing documents.",
+    "import-time": "Measures the package import and command line start-up times with -X importtime.",
+}
+
+def _build_argument_parser() -> ArgumentParser:
+    parser: ArgumentParser = ArgumentParser( description = "Runs the json_visitor benchmarks.", prog = PackageName )
+
+    subparsers = parser.add_subparsers( dest = "benchmark", metavar = "<benchmark>" )
+    subparsers.required = True
+
+    for name, module in _Benchmarks.items():
+        module.add_arguments( subparsers.add_parser( name, help = _Descriptions[ name ], description = _Descriptions[ name ] ) )
+
+    return parser
+
+def main( args = None ) -> int:
+    """
+    Runs the selected benchmark.
+
+    Parameters:
+        `args`: input parameters to parse. If `None`, parameters are read from `sys.argv`.
+
+    Returns:
+        Integer representing the exit code of the benchmark.
+    """
+
+    if args is None:
+        args = sys.argv[ 1: ]
+
+    processed_args: Namespace = _build_argument_parser().parse_args( args )
+
+    return _Benchmarks[ processed_args.benchmark ].run( processed_args )
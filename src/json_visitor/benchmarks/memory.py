@@ -0,0 +1,183 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List
+
+import gc
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from collections import Counter
+from io import BytesIO
+
+import ijson
+from ..contextual_adapters.base_adapter import BaseAdapter as ContextualBaseAdapter
+from ..json_visitor import JsonVisitor
+from ..scoping.scope import Scope
+from ..simple_adapters.base_adapter import BaseAdapter as SimpleBaseAdapter
+from ..simple_adapters.composite_adapter import CompositeAdapter
+from ..simple_adapters.scope_adapter import ScopeAdapter
+from .corpora import Corpora, MultipleDocumentCorpora
+from .reporting import format_table, write_results
+
+Configurations: Dict[ str, Callable[ [], SimpleBaseAdapter ] ] = {
+    "contextual_base_adapter": ContextualBaseAdapter,
+    "scope_adapter": ScopeAdapter,
+}
+"""
+The benchmarked adapter configurations by name.
+"""
+
+_NodeTokens = frozenset( [ "start_map", "start_array", "number", "string", "boolean", "null" ] )
+
+def _count_live_scopes() -> Dict[ str, int ]:
+    return dict( Counter( type( value ).__qualname__ for value in gc.get_objects() if isinstance( value, Scope ) ) )
+
+class _ScopeCensusAdapter( SimpleBaseAdapter ):
+    """
+    Counts the live scope objects by class just before the end of each document, when the scope tree is complete.
+    """
+
+    def __init__( self ):
+        self.scope_counts: Dict[ str, int ] = {}
+
+    def before_document_end( self ) -> None:
+        super().before_document_end()
+
+        self.scope_counts = _count_live_scopes()
+
+def _count_nodes( data: bytes, is_multiple: bool ) -> int:
+    return sum( 1 for event, _ in ijson.basic_parse( BytesIO( data ), multiple_values = is_multiple ) if event in _NodeTokens )
+
+def measure( data: bytes, is_multiple: bool, make_adapter: Callable[ [], SimpleBaseAdapter ], use_float: bool = False, key_intern_limit: int = 4096 ) -> Dict[ str, Any ]:
+    """
+    Visits the data with a new adapter, measuring the memory used.
+
+    Parameters:
+        `data`: the JSON data.
+        `is_multiple`: `True` if the data contains a sequence of documents, `False` otherwise.
+        `make_adapter`: the factory of the adapter to measure.
+        `use_float`: `True` to parse non-integer numbers as `float`, `False` to parse them as `decimal.Decimal`.
+        `key_intern_limit`: the member key intern table size of the visitor; 0 disables the interning.
+
+    Returns:
+        Dictionary with the `tracemalloc` peak and retained bytes and the live scope counts by class.
+    """
+
+    adapter = make_adapter()
+    census = _ScopeCensusAdapter()
+    visitor = JsonVisitor( CompositeAdapter( adapter, census ), use_float = use_float, key_intern_limit = key_intern_limit )
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+
+        if is_multiple:
+            visitor.visit_documents( BytesIO( data ) )
+        else:
+            visitor.visit( BytesIO( data ) )
+
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # The adapter is referenced until here so the retained memory includes everything it holds after the end of the document.
+    retained_scope_counts = _count_live_scopes()
+    del adapter
+
+    return {
+        "peak_bytes": peak - baseline,
+        "retained_bytes": retained - baseline,
+        "scope_counts": census.scope_counts,
+        "retained_scope_counts": retained_scope_counts,
+    }
+
+def run_benchmark( corpus_names: Iterable[ str ], configuration_names: Iterable[ str ], sizes: Iterable[ int ], use_float: bool = False, key_intern_limit: int = 4096 ) -> List[ Dict[ str, Any ] ]:
+    """
+    Runs the memory benchmark.
+
+    Parameters:
+        `corpus_names`: the names of the corpora to generate.
+        `configuration_names`: the names of the adapter configurations to measure.
+        `sizes`: the approximate corpus sizes, in bytes; each corpus is generated at each size.
+        `use_float`: `True` to parse non-integer numbers as `float`, `False` to parse them as `decimal.Decimal`.
+        `key_intern_limit`: the member key intern table size of the visitor; 0 disables the interning.
+
+    Returns:
+        List of result records.
+    """
+
+    results = []
+    configuration_names = list( configuration_names )
+    sizes = sorted( sizes )
+
+    for corpus_name in corpus_names:
+        is_multiple = corpus_name in MultipleDocumentCorpora
+
+        for size in sizes:
+            data = Corpora[ corpus_name ]( size )
+            node_count = _count_nodes( data, is_multiple )
+
+            for configuration_name in configuration_names:
+                measurement = measure( data, is_multiple, Configurations[ configuration_name ], use_float, key_intern_limit )
+
+                results.append( {
+                    "corpus": corpus_name,
+                    "configuration": configuration_name,
+                    "bytes": len( data ),
+                    "nodes": node_count,
+                    "peak_bytes": measurement[ "peak_bytes" ],
+                    "retained_bytes": measurement[ "retained_bytes" ],
+                    "peak_bytes_per_node": measurement[ "peak_bytes" ] / node_count if node_count > 0 else None,
+                    "retained_bytes_per_node": measurement[ "retained_bytes" ] / node_count if node_count > 0 else None,
+                    "peak_bytes_per_input_byte": measurement[ "peak_bytes" ] / len( data ) if len( data ) > 0 else None,
+                    "scope_counts": measurement[ "scope_counts" ],
+                    "retained_scope_counts": measurement[ "retained_scope_counts" ],
+                } )
+
+    return results
+
+def add_arguments( parser: ArgumentParser ) -> None:
+    """
+    Adds the benchmark's command line arguments to the parser.
+    """
+
+    parser.add_argument( "--corpus", dest = "corpora", action = "append", choices = sorted( Corpora ), help = "Corpus to measure; may be repeated. All corpora are measured by default." )
+    parser.add_argument( "--configuration", dest = "configurations", action = "append", choices = sorted( Configurations ), help = "Adapter configuration to measure; may be repeated. All configurations are measured by default." )
+    parser.add_argument( "--size", dest = "sizes", type = int, action = "append", help = "Approximate corpus size in bytes; may be repeated to measure growth. The default is 25000, 50000 and 100000.", metavar = "<bytes>" )
+    parser.add_argument( "--use-float", dest = "use_float", action = "store_true", help = "Parses non-integer numbers as floats rather than decimals." )
+    parser.add_argument( "--key-intern-limit", dest = "key_intern_limit", type = int, default = 4096, help = "Member key intern table size of the visitor; 0 disables the interning. The default is 4096.", metavar = "N" )
+    parser.add_argument( "--output", help = "Writes the results as JSON to the given path.", metavar = "<file path>" )
+
+def run( arguments: Namespace ) -> int:
+    """
+    Runs the benchmark with the parsed command line arguments.
+
+    Returns:
+        The exit code, always 0.
+    """
+
+    corpus_names = arguments.corpora or list( Corpora )
+    configuration_names = arguments.configurations or list( Configurations )
+    sizes = arguments.sizes or [ 25000, 50000, 100000 ]
+
+    results = run_benchmark( corpus_names, configuration_names, sizes, arguments.use_float, arguments.key_intern_limit )
+
+    print( format_table(
+        ( "corpus/configuration", "bytes", "nodes", "peak", "retained", "peak/node", "retained/node", "peak/input byte" ),
+        [ ( f"{ result[ 'corpus' ] }/{ result[ 'configuration' ] }", result[ "bytes" ], result[ "nodes" ], result[ "peak_bytes" ], result[ "retained_bytes" ], f"{ result[ 'peak_bytes_per_node' ] or 0:.1f}", f"{ result[ 'retained_bytes_per_node' ] or 0:.1f}", f"{ result[ 'peak_bytes_per_input_byte' ] or 0:.2f}" ) for result in results ],
+    ) )
+
+    scope_names = sorted( set( name for result in results for name in result[ "scope_counts" ] ) )
+    if len( scope_names ) > 0:
+        print()
+        print( format_table(
+            ( "live scopes at document end", ) + tuple( scope_names ),
+            [ ( f"{ result[ 'corpus' ] }/{ result[ 'configuration' ] }/{ result[ 'bytes' ] }", ) + tuple( result[ "scope_counts" ].get( name, 0 ) for name in scope_names ) for result in results ],
+        ) )
+
+    if arguments.output:
+        write_results( arguments.output, "memory", results, sizes = sizes, use_float = arguments.use_float, key_intern_limit = arguments.key_intern_limit )
+
+    return 0
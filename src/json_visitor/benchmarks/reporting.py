@@ -0,0 +1,128 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import json
+import platform
+import sys
+import time
+
+def get_metadata( **kwargs: Dict[ str, Any ] ) -> Dict[ str, Any ]:
+    """
+    Gets the metadata describing the benchmark environment.
+
+    Keyword Arguments:
+        Additional metadata entries.
+
+    Returns:
+        Dictionary of the benchmark metadata.
+    """
+
+    try:
+        import ijson
+        ijson_backend = ijson.backend
+    except ImportError:
+        ijson_backend = None
+
+    metadata = {
+        "timestamp": time.strftime( "%Y-%m-%dT%H:%M:%S%z" ),
+        "python": sys.version.split()[ 0 ],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "ijson_backend": ijson_backend,
+    }
+    metadata.update( kwargs )
+
+    return metadata
+
+def write_results( path: str, benchmark: str, results: List[ Dict[ str, Any ] ], **metadata: Dict[ str, Any ] ) -> None:
+    """
+    Writes the benchmark results as JSON.
+
+    Parameters:
+        `path`: the path of the results file.
+        `benchmark`: the name of the benchmark.
+        `results`: the result records.
+
+    Keyword Arguments:
+        Additional metadata entries.
+    """
+
+    with open( path, "w", encoding = "utf-8" ) as results_file:
+        json.dump( { "benchmark": benchmark, "metadata": get_metadata( **metadata ), "results": results }, results_file, indent = 2 )
+        results_file.write( "\n" )
+
+def load_results( path: str ) -> Dict[ str, Any ]:
+    """
+    Loads benchmark results written by `write_results`.
+
+    Parameters:
+        `path`: the path of the results file.
+
+    Returns:
+        The benchmark results document.
+    """
+
+    with open( path, "r", encoding = "utf-8" ) as results_file:
+        return json.load( results_file )
+
+def compare_results( results: Iterable[ Dict[ str, Any ] ], baseline: Iterable[ Dict[ str, Any ] ], key_fields: Sequence[ str ], metric: str, higher_is_better: bool, tolerance: float ) -> List[ Tuple[ Tuple[ Any ], float, float, float, bool ] ]:
+    """
+    Compares benchmark results against baseline results.
+
+    Parameters:
+        `results`: the current result records.
+        `baseline`: the baseline result records.
+        `key_fields`: the fields identifying matching records.
+        `metric`: the field compared.
+        `higher_is_better`: `True` if a higher metric value is an improvement, `False` if a lower value is an improvement.
+        `tolerance`: the relative change, as a fraction, beyond which a change for the worse is a regression.
+
+    Returns:
+        List of `( key, baseline value, current value, relative change, is regression )` tuples for the records present in both; a positive relative change is an improvement.
+    """
+
+    baseline_by_key = { tuple( record.get( field ) for field in key_fields ): record for record in baseline }
+    comparisons = []
+
+    for record in results:
+        key = tuple( record.get( field ) for field in key_fields )
+        baseline_record = baseline_by_key.get( key, None )
+
+        if baseline_record is None or not baseline_record.get( metric ) or record.get( metric ) is None:
+            continue
+
+        old_value = baseline_record[ metric ]
+        new_value = record[ metric ]
+        change = ( new_value - old_value ) / old_value
+        if not higher_is_better:
+            change = -change
+
+        comparisons.append( ( key, old_value, new_value, change, change < -tolerance ) )
+
+    return comparisons
+
+def format_comparison( comparisons: List[ Tuple[ Tuple[ Any ], float, float, float, bool ] ], metric: str ) -> str:
+    """
+    Formats the comparisons returned by `compare_results` as a text table.
+    """
+
+    rows = [ ( "/".join( str( part ) for part in key ), f"{ old_value:.4g}", f"{ new_value:.4g}", f"{ change * 100:+.1f}%", "REGRESSION" if is_regression else "" ) for key, old_value, new_value, change, is_regression in comparisons ]
+
+    return format_table( ( "benchmark", f"baseline { metric }", f"current { metric }", "change", "" ), rows )
+
+def format_table( headers: Sequence[ str ], rows: Iterable[ Sequence[ str ] ] ) -> str:
+    """
+    Formats the rows as a text table; the first column is left-aligned and the other columns are right-aligned.
+    """
+
+    cells = [ tuple( headers ) ] + [ tuple( str( cell ) for cell in row ) for row in rows ]
+    widths = [ max( len( row[ column ] ) for row in cells ) for column in range( len( headers ) ) ]
+
+    lines = []
+    for row_index, row in enumerate( cells ):
+        lines.append( "  ".join( cell.ljust( widths[ column ] ) if column == 0 else cell.rjust( widths[ column ] ) for column, cell in enumerate( row ) ).rstrip() )
+        if row_index == 0:
+            lines.append( "  ".join( "-" * width for width in widths ) )
+
+    return "\n".join( lines )
@@ -0,0 +1,176 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List
+
+import gc
+import json
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from io import BytesIO
+
+import ijson
+from ..contextual_adapters.base_adapter import BaseAdapter as ContextualBaseAdapter
+from ..json_visitor import JsonVisitor
+from ..simple_adapters.base_adapter import BaseAdapter as SimpleBaseAdapter
+from ..simple_adapters.scope_adapter import ScopeAdapter
+from ..subscription.contextual_subscription import ContextualSubscription
+from .corpora import Corpora, MultipleDocumentCorpora
+from .reporting import compare_results, format_comparison, format_table, load_results, write_results
+
+def _make_subscription() -> ContextualSubscription:
+    subscription = ContextualSubscription()
+    subscription.register( "default_process", lambda *args, **kwargs: None )
+
+    return subscription
+
+def _visit_with( adapter_factory: Callable[ [], SimpleBaseAdapter ], use_float: bool = False, number_mode: str = "value" ) -> Callable[ [ bytes, bool ], None ]:
+    def run( data: bytes, is_multiple: bool ) -> None:
+        visitor = JsonVisitor( adapter_factory(), use_float = use_float, number_mode = number_mode )
+
+        if is_multiple:
+            visitor.visit_documents( BytesIO( data ) )
+        else:
+            visitor.visit( BytesIO( data ) )
+
+    return run
+
+def _json_loads( data: bytes, is_multiple: bool ) -> None:
+    if is_multiple:
+        for line in data.splitlines():
+            if line.strip():
+                json.loads( line )
+    else:
+        json.loads( data )
+
+def _ijson_items( data: bytes, is_multiple: bool ) -> None:
+    for _ in ijson.items( BytesIO( data ), "", multiple_values = is_multiple ):
+        pass
+
+Targets: Dict[ str, Callable[ [ bytes, bool ], None ] ] = {
+    "simple_base_adapter": _visit_with( SimpleBaseAdapter ),
+    "scope_adapter": _visit_with( ScopeAdapter ),
+    "contextual_base_adapter": _visit_with( ContextualBaseAdapter ),
+    "contextual_subscription": _visit_with( _make_subscription ),
+    "scope_adapter_float": _visit_with( ScopeAdapter, use_float = True ),
+    "contextual_base_adapter_float": _visit_with( ContextualBaseAdapter, use_float = True ),
+    "scope_adapter_number_lexemes": _visit_with( ScopeAdapter, number_mode = "lexeme" ),
+    "scope_adapter_lazy_numbers": _visit_with( ScopeAdapter, number_mode = "lazy" ),
+    "json_loads": _json_loads,
+    "ijson_items": _ijson_items,
+}
+"""
+The benchmarked processing targets by name; the `_float` targets parse non-integer numbers as `float`, the `_number_lexemes` and `_lazy_numbers` targets publish unconverted numbers and `json_loads` and `ijson_items` are the baselines.
+"""
+
+def _count_tokens( data: bytes ) -> int:
+    return sum( 1 for _ in ijson.basic_parse( BytesIO( data ), multiple_values = True ) )
+
+def _measure_peak_memory( target: Callable[ [ bytes, bool ], None ], data: bytes, is_multiple: bool ) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        target( data, is_multiple )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak - baseline
+
+def run_benchmark( corpus_names: Iterable[ str ], target_names: Iterable[ str ], size: int, repeat: int, measure_memory: bool = True ) -> List[ Dict[ str, Any ] ]:
+    """
+    Runs the throughput benchmark.
+
+    Parameters:
+        `corpus_names`: the names of the corpora to generate.
+        `target_names`: the names of the targets to run against each corpus.
+        `size`: the approximate size of each corpus, in bytes.
+        `repeat`: the number of timed runs per corpus and target; the fastest run is reported.
+        `measure_memory`: `True` to measure the peak memory with an additional `tracemalloc` run, `False` otherwise.
+
+    Returns:
+        List of result records.
+    """
+
+    results = []
+    target_names = list( target_names )
+
+    for corpus_name in corpus_names:
+        data = Corpora[ corpus_name ]( size )
+        is_multiple = corpus_name in MultipleDocumentCorpora
+        token_count = _count_tokens( data )
+
+        for target_name in target_names:
+            target = Targets[ target_name ]
+
+            durations = []
+            for _ in range( repeat ):
+                gc.collect()
+                start = time.perf_counter()
+                target( data, is_multiple )
+                durations.append( time.perf_counter() - start )
+
+            seconds = min( durations )
+
+            results.append( {
+                "corpus": corpus_name,
+                "target": target_name,
+                "bytes": len( data ),
+                "tokens": token_count,
+                "seconds": seconds,
+                "mb_per_second": len( data ) / 1e6 / seconds if seconds > 0 else None,
+                "events_per_second": token_count / seconds if seconds > 0 else None,
+                "peak_memory_bytes": _measure_peak_memory( target, data, is_multiple ) if measure_memory else None,
+            } )
+
+    return results
+
+def add_arguments( parser: ArgumentParser ) -> None:
+    """
+    Adds the benchmark's command line arguments to the parser.
+    """
+
+    parser.add_argument( "--corpus", dest = "corpora", action = "append", choices = sorted( Corpora ), help = "Corpus to benchmark; may be repeated. All corpora are benchmarked by default." )
+    parser.add_argument( "--target", dest = "targets", action = "append", choices = sorted( Targets ), help = "Target to benchmark; may be repeated. All targets are benchmarked by default." )
+    parser.add_argument( "--size", type = int, default = 250000, help = "Approximate size of each corpus in bytes. The default is 250000.", metavar = "<bytes>" )
+    parser.add_argument( "--repeat", type = int, default = 3, help = "Number of timed runs; the fastest run is reported. The default is 3.", metavar = "N" )
+    parser.add_argument( "--no-memory", dest = "measure_memory", action = "store_false", help = "Skips the peak memory measurement." )
+    parser.add_argument( "--output", help = "Writes the results as JSON to the given path.", metavar = "<file path>" )
+    parser.add_argument( "--baseline", help = "Compares the results against the results JSON at the given path; the exit code is 1 if any result regressed.", metavar = "<file path>" )
+    parser.add_argument( "--tolerance", type = float, default = 0.1, help = "Relative throughput loss, as a fraction, tolerated before a result is a regression. The default is 0.1.", metavar = "<fraction>" )
+
+def run( arguments: Namespace ) -> int:
+    """
+    Runs the benchmark with the parsed command line arguments.
+
+    Returns:
+        The exit code: 0 on success, 1 if a regression against the baseline was found.
+    """
+
+    corpus_names = arguments.corpora or list( Corpora )
+    target_names = arguments.targets or list( Targets )
+
+    results = run_benchmark( corpus_names, target_names, arguments.size, max( arguments.repeat, 1 ), arguments.measure_memory )
+
+    print( format_table(
+        ( "corpus/target", "bytes", "tokens", "seconds", "MB/s", "events/s", "peak memory" ),
+        [ ( f"{ result[ 'corpus' ] }/{ result[ 'target' ] }", result[ "bytes" ], result[ "tokens" ], f"{ result[ 'seconds' ]:.4f}", f"{ result[ 'mb_per_second' ] or 0:.2f}", f"{ result[ 'events_per_second' ] or 0:.0f}", result[ "peak_memory_bytes" ] if result[ "peak_memory_bytes" ] is not None else "-" ) for result in results ],
+    ) )
+
+    if arguments.output:
+        write_results( arguments.output, "throughput", results, size = arguments.size, repeat = arguments.repeat )
+
+    exit_code = 0
+
+    if arguments.baseline:
+        comparisons = compare_results( results, load_results( arguments.baseline )[ "results" ], ( "corpus", "target" ), "mb_per_second", True, arguments.tolerance )
+
+        print()
+        print( format_comparison( comparisons, "MB/s" ) )
+
+        if any( is_regression for *_, is_regression in comparisons ):
+            exit_code = 1
+
+    return exit_code
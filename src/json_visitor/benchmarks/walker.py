@@ -0,0 +1,211 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import gc
+import time
+from argparse import ArgumentParser, Namespace
+from io import BytesIO
+
+import ijson
+from ..contextual_adapters.base_adapter import BaseAdapter as ContextualBaseAdapter
+from ..contextual_adapters.composite_adapter import CompositeAdapter as ContextualCompositeAdapter
+from ..contextual_adapters.inspector_adapter import InspectionAdapter
+from ..simple_adapters.base_adapter import BaseAdapter as SimpleBaseAdapter
+from ..simple_adapters.composite_adapter import CompositeAdapter as SimpleCompositeAdapter
+from ..simple_adapters.event_adapter import EventAdapter
+from ..simple_adapters.scope_adapter import ScopeAdapter
+from ..tokenizer.scope_walker import ScopeWalker
+from ..tokenizer.token_processor import TokenProcessor
+from .corpora import Corpora, MultipleDocumentCorpora
+from .reporting import compare_results, format_comparison, format_table, load_results, write_results
+
+class _NullSink:
+    def write( self, text: str ) -> int:
+        return len( text )
+
+def _make_silent_inspection_adapter() -> InspectionAdapter:
+    # The events are still formatted; only the writes are discarded.
+    return InspectionAdapter( _NullSink() )
+
+def _make_nested_simple_composite() -> SimpleCompositeAdapter:
+    return SimpleCompositeAdapter( SimpleCompositeAdapter( SimpleBaseAdapter(), ScopeAdapter() ), SimpleBaseAdapter() )
+
+def _make_nested_contextual_composite() -> ContextualCompositeAdapter:
+    return ContextualCompositeAdapter( ContextualCompositeAdapter( ContextualBaseAdapter(), ContextualBaseAdapter() ), ContextualBaseAdapter() )
+
+class _TestedTypeCounter( SimpleBaseAdapter ):
+    """
+    Counts the values by type, testing the type of each value.
+    """
+
+    def __init__( self ):
+        self.counts: List[ int ] = [ 0, 0, 0, 0 ]
+
+    def process_value( self, value: Any ) -> None:
+        if isinstance( value, str ):
+            self.counts[ 0 ] += 1
+        elif value is None:
+            self.counts[ 3 ] += 1
+        elif isinstance( value, bool ):
+            self.counts[ 2 ] += 1
+        else:
+            self.counts[ 1 ] += 1
+
+class _TypedHookCounter( SimpleBaseAdapter ):
+    """
+    Counts the values by type with the typed callbacks.
+    """
+
+    def __init__( self ):
+        self.counts: List[ int ] = [ 0, 0, 0, 0 ]
+
+    def process_string( self, value: str ) -> None:
+        self.counts[ 0 ] += 1
+
+    def process_number( self, value: Any ) -> None:
+        self.counts[ 1 ] += 1
+
+    def process_boolean( self, value: bool ) -> None:
+        self.counts[ 2 ] += 1
+
+    def process_null( self, value: None ) -> None:
+        self.counts[ 3 ] += 1
+
+Configurations: Dict[ str, Callable[ [], SimpleBaseAdapter ] ] = {
+    "empty_base_adapter": SimpleBaseAdapter,
+    "scope_adapter": ScopeAdapter,
+    "contextual_base_adapter": ContextualBaseAdapter,
+    "silent_inspection_adapter": _make_silent_inspection_adapter,
+    "nested_simple_composite": _make_nested_simple_composite,
+    "nested_contextual_composite": _make_nested_contextual_composite,
+    "tested_type_counter": _TestedTypeCounter,
+    "typed_hook_counter": _TypedHookCounter,
+}
+"""
+The benchmarked adapter configurations by name.
+"""
+
+class _EventCounter( EventAdapter ):
+    def __init__( self ):
+        self.count: int = 0
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        self.count += 1
+
+def record_tokens( data: bytes, is_multiple: bool ) -> List[ Tuple[ str, Any ] ]:
+    """
+    Tokenizes the data into an in-memory token list which can be replayed without the tokenizer.
+
+    Parameters:
+        `data`: the JSON data.
+        `is_multiple`: `True` if the data contains a sequence of documents, `False` otherwise.
+
+    Returns:
+        List of `( event, value )` tuples.
+    """
+
+    return list( ijson.basic_parse( BytesIO( data ), multiple_values = is_multiple ) )
+
+def replay_tokens( tokens: List[ Tuple[ str, Any ] ], adapter: SimpleBaseAdapter, is_multiple: bool ) -> None:
+    """
+    Replays recorded tokens through a `ScopeWalker` publishing to the adapter.
+    """
+
+    TokenProcessor( ScopeWalker( adapter ) ).process_tokens( tokens, multiple_documents = is_multiple )
+
+def run_benchmark( corpus_names: Iterable[ str ], configuration_names: Iterable[ str ], size: int, repeat: int ) -> List[ Dict[ str, Any ] ]:
+    """
+    Runs the walker benchmark.
+
+    Parameters:
+        `corpus_names`: the names of the corpora to generate and pre-tokenize.
+        `configuration_names`: the names of the adapter configurations to replay each corpus into.
+        `size`: the approximate size of each corpus, in bytes.
+        `repeat`: the number of timed replays per corpus and configuration; the fastest replay is reported.
+
+    Returns:
+        List of result records.
+    """
+
+    results = []
+    configuration_names = list( configuration_names )
+
+    for corpus_name in corpus_names:
+        is_multiple = corpus_name in MultipleDocumentCorpora
+        tokens = record_tokens( Corpora[ corpus_name ]( size ), is_multiple )
+
+        counter = _EventCounter()
+        replay_tokens( tokens, counter, is_multiple )
+
+        for configuration_name in configuration_names:
+            make_adapter = Configurations[ configuration_name ]
+
+            durations = []
+            for _ in range( repeat ):
+                adapter = make_adapter()
+                gc.collect()
+                start = time.perf_counter_ns()
+                replay_tokens( tokens, adapter, is_multiple )
+                durations.append( time.perf_counter_ns() - start )
+
+            elapsed_ns = min( durations )
+
+            results.append( {
+                "corpus": corpus_name,
+                "configuration": configuration_name,
+                "tokens": len( tokens ),
+                "adapter_events": counter.count,
+                "elapsed_ns": elapsed_ns,
+                "ns_per_token": elapsed_ns / len( tokens ) if len( tokens ) > 0 else None,
+                "ns_per_adapter_event": elapsed_ns / counter.count if counter.count > 0 else None,
+            } )
+
+    return results
+
+def add_arguments( parser: ArgumentParser ) -> None:
+    """
+    Adds the benchmark's command line arguments to the parser.
+    """
+
+    parser.add_argument( "--corpus", dest = "corpora", action = "append", choices = sorted( Corpora ), help = "Corpus to replay; may be repeated. All corpora are replayed by default." )
+    parser.add_argument( "--configuration", dest = "configurations", action = "append", choices = sorted( Configurations ), help = "Adapter configuration to benchmark; may be repeated. All configurations are benchmarked by default." )
+    parser.add_argument( "--size", type = int, default = 100000, help = "Approximate size of each corpus in bytes. The default is 100000.", metavar = "<bytes>" )
+    parser.add_argument( "--repeat", type = int, default = 5, help = "Number of timed replays; the fastest replay is reported. The default is 5.", metavar = "N" )
+    parser.add_argument( "--output", help = "Writes the results as JSON to the given path.", metavar = "<file path>" )
+    parser.add_argument( "--baseline", help = "Compares the results against the results JSON at the given path; the exit code is 1 if any result regressed.", metavar = "<file path>" )
+    parser.add_argument( "--tolerance", type = float, default = 0.1, help = "Relative ns/token increase, as a fraction, tolerated before a result is a regression. The default is 0.1.", metavar = "<fraction>" )
+
+def run( arguments: Namespace ) -> int:
+    """
+    Runs the benchmark with the parsed command line arguments.
+
+    Returns:
+        The exit code: 0 on success, 1 if a regression against the baseline was found.
+    """
+
+    corpus_names = arguments.corpora or list( Corpora )
+    configuration_names = arguments.configurations or list( Configurations )
+
+    results = run_benchmark( corpus_names, configuration_names, arguments.size, max( arguments.repeat, 1 ) )
+
+    print( format_table(
+        ( "corpus/configuration", "tokens", "adapter events", "ms", "ns/token", "ns/adapter event" ),
+        [ ( f"{ result[ 'corpus' ] }/{ result[ 'configuration' ] }", result[ "tokens" ], result[ "adapter_events" ], f"{ result[ 'elapsed_ns' ] / 1e6:.3f}", f"{ result[ 'ns_per_token' ] or 0:.1f}", f"{ result[ 'ns_per_adapter_event' ] or 0:.1f}" ) for result in results ],
+    ) )
+
+    if arguments.output:
+        write_results( arguments.output, "walker", results, size = arguments.size, repeat = arguments.repeat )
+
+    exit_code = 0
+
+    if arguments.baseline:
+        comparisons = compare_results( results, load_results( arguments.baseline )[ "results" ], ( "corpus", "configuration" ), "ns_per_token", False, arguments.tolerance )
+
+        print()
+        print( format_comparison( comparisons, "ns/token" ) )
+
+        if any( is_regression for *_, is_regression in comparisons ):
+            exit_code = 1
+
+    return exit_code
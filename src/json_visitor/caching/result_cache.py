@@ -0,0 +1,348 @@
+__version__ = r"1.0.0"
+
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, Tuple
+
+import os
+import pickle
+import struct
+import hashlib
+from ..simple_adapters.base_adapter import BaseAdapter
+from ..simple_adapters.event_adapter import EventAdapter, replay_events
+from ..simple_adapters.event_codec import decode_events, encode_event
+from ..tokenizer.path_tracker import PathTracker, track_events
+from ..tokenizer.token_processor import TokenProcessor
+
+CacheStores = ( "events", "state" )
+"""
+What a cache entry stores: `events` records the event stream of the visit, which is replayed through the adapter, and `state` the state snapshot of the adapter from its `get_state`, which is restored with its `set_state`.
+"""
+
+CacheKeyModes = ( "content", "stat" )
+"""
+How a file is identified: `content` by the hash of its content and `stat` by its path, size and modification time, which doesn't read the file.
+"""
+
+# Entry layout, little-endian: the header, then the payload: the event stream as chunks of encoded events, each preceded by its length, or the pickled adapter state.
+_Magic = b"JVRC"
+_FormatVersion: int = 1
+_Header = struct.Struct( "<4sHBQ32s" ) # Magic, version, store, payload length, SHA-256 digest of the payload.
+_ChunkLength = struct.Struct( "<I" )
+_EntrySuffix: str = ".jvcache"
+
+_ChunkSize: int = 256 * 1024
+_ReadSize: int = 1024 * 1024
+
+class _EventRecorder( EventAdapter ):
+    """
+    Encodes the events into chunks written to the entry file as they fill up, so the event stream of a large input is not held in memory.
+    """
+
+    def __init__( self, entry_file: BinaryIO ):
+        self._entry_file: BinaryIO = entry_file
+        self._buffer: bytearray = bytearray()
+        self.digest = hashlib.sha256()
+        self.length: int = 0
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        encode_event( self._buffer, event_name, args )
+
+        if len( self._buffer ) >= _ChunkSize:
+            self.flush()
+
+    def flush( self ) -> None:
+        if len( self._buffer ) > 0:
+            for data in ( _ChunkLength.pack( len( self._buffer ) ), self._buffer ):
+                self._entry_file.write( data )
+                self.digest.update( data )
+                self.length += len( data )
+
+            self._buffer = bytearray()
+
+class ResultCache( object ):
+    """
+    An on-disk cache of the results of visits, so an unchanged input is not parsed again.
+
+    An entry is keyed by the identity of the input, the visitor options which change the events, and, for the `state` store, the identity of the adapter from its `get_cache_identity`. Entries are written to a temporary file and renamed, and carry the SHA-256 digest of their payload; an entry which fails the integrity check is removed and treated as a miss. Hits refresh the modification time of the entry, and when the cache exceeds its limits the least recently used entries are evicted.
+
+    Parameters:
+        `cache_dir`: the directory of the cache; it is created when missing.
+        `store`: one of `CacheStores`. The default is `events`, which works with any adapter; `state` skips the adapter as well but requires the adapter to implement `get_state` and `set_state`.
+        `key_mode`: one of `CacheKeyModes`, for the inputs read from files; in-memory inputs are always identified by their content. The default is `content`.
+        `max_bytes`: the maximum total size of the entries, or `None` for no limit.
+        `max_entries`: the maximum number of entries, or `None` for no limit.
+
+    Notes:
+        - `state` entries are unpickled, so the cache directory must only be writable by trusted users.
+    """
+
+    def __init__( self, cache_dir: str, store: str = "events", key_mode: str = "content", max_bytes: int = None, max_entries: int = None ):
+        if store not in CacheStores:
+            raise ValueError( f"Invalid cache store '{ store }': it must be one of { ', '.join( CacheStores ) }" )
+        if key_mode not in CacheKeyModes:
+            raise ValueError( f"Invalid cache key mode '{ key_mode }': it must be one of { ', '.join( CacheKeyModes ) }" )
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError( "Maximum cache size must be at least 0." )
+        if max_entries is not None and max_entries < 0:
+            raise ValueError( "Maximum cache entry count must be at least 0." )
+
+        self._cache_dir: str = os.path.abspath( cache_dir )
+        self._store: str = store
+        self._key_mode: str = key_mode
+        self._max_bytes: int = max_bytes
+        self._max_entries: int = max_entries
+
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.invalid_count: int = 0
+
+        os.makedirs( self._cache_dir, exist_ok = True )
+
+    @property
+    def cache_dir( self ) -> str:
+        """
+        Gets the directory of the cache.
+        """
+
+        return self._cache_dir
+
+    @property
+    def store( self ) -> str:
+        """
+        Gets what the entries store; one of `CacheStores`.
+        """
+
+        return self._store
+
+    def visit( self, token_processor: TokenProcessor, input_source: Any, documents: bool = False ) -> bool:
+        """
+        Publishes the events of the input to the adapter of the token processor from the cache entry of the input, or processes the input and stores its entry.
+
+        Parameters:
+            `token_processor`: the token processor of the visitor.
+            `input_source`: the input source, as accepted by `TokenProcessor.process`.
+            `documents`: `True` to process the input as a sequence of documents.
+
+        Returns:
+            `True` if the entry was found, `False` if the input was processed.
+        """
+
+        scope_walker = token_processor._internal_scope_walker
+        source_key, input_source = self._get_source_key( input_source )
+
+        options = ( token_processor._use_float, token_processor._number_mode, documents )
+        if self._store == "state":
+            options += tuple( adapter.get_cache_identity() for adapter in scope_walker._adapters )
+
+        key = hashlib.sha256( repr( ( _FormatVersion, self._store, source_key, options ) ).encode( "utf-8" ) ).hexdigest()
+        entry_path = os.path.join( self._cache_dir, key[ :2 ], key[ 2: ] + _EntrySuffix )
+
+        if os.path.isfile( entry_path ) and self._load_entry( entry_path, scope_walker._adapters, scope_walker.path_tracker ):
+            self.hit_count += 1
+            return True
+
+        self.miss_count += 1
+
+        process: Callable[ [ Any ], None ] = token_processor.process_documents if documents else token_processor.process
+
+        os.makedirs( os.path.dirname( entry_path ), exist_ok = True )
+        temporary_path = f"{ entry_path }.{ os.getpid() }.tmp"
+
+        try:
+            with open( temporary_path, "wb" ) as entry_file:
+                entry_file.write( b"\0" * _Header.size ) # The header is written once the payload digest is known.
+
+                if self._store == "events":
+                    recorder = _EventRecorder( entry_file )
+                    adapters = scope_walker._adapters
+
+                    scope_walker._adapters = adapters + ( recorder, )
+                    try:
+                        process( input_source )
+                    finally:
+                        scope_walker._adapters = adapters
+
+                    recorder.flush()
+                    digest, length = recorder.digest.digest(), recorder.length
+                else:
+                    process( input_source )
+
+                    payload = pickle.dumps( tuple( adapter.get_state() for adapter in scope_walker._adapters ), protocol = pickle.HIGHEST_PROTOCOL )
+                    entry_file.write( payload )
+                    digest, length = hashlib.sha256( payload ).digest(), len( payload )
+
+                entry_file.seek( 0 )
+                entry_file.write( _Header.pack( _Magic, _FormatVersion, CacheStores.index( self._store ), length, digest ) )
+
+            os.replace( temporary_path, entry_path )
+        finally:
+            if os.path.isfile( temporary_path ):
+                os.remove( temporary_path )
+
+        self.evict()
+
+        return False
+
+    def _get_source_key( self, input_source: Any ) -> Tuple[ Any, Any ]:
+        """
+        Gets the identity of the input, and the input to process: an input which can't be read twice is read into memory.
+        """
+
+        if isinstance( input_source, str ):
+            return ( "content", hashlib.sha256( input_source.encode( "utf-8" ) ).hexdigest() ), input_source
+        elif isinstance( input_source, ( bytes, bytearray, memoryview ) ):
+            return ( "content", hashlib.sha256( input_source ).hexdigest() ), input_source
+
+        if self._key_mode == "stat":
+            try:
+                stat = os.fstat( input_source.fileno() )
+            except ( AttributeError, OSError, ValueError ):
+                stat = None
+
+            name = getattr( input_source, "name", None )
+            if stat is not None and isinstance( name, str ) and os.path.isfile( name ):
+                return ( "stat", os.path.realpath( name ), stat.st_size, stat.st_mtime_ns, input_source.tell() ), input_source
+
+        seekable = getattr( input_source, "seekable", None )
+        if seekable is None or not seekable():
+            return self._get_source_key( input_source.read() )
+
+        start = input_source.tell()
+        digest = hashlib.sha256()
+
+        while True:
+            data = input_source.read( _ReadSize )
+            if not data:
+                break
+
+            digest.update( data.encode( "utf-8" ) if isinstance( data, str ) else data )
+
+        input_source.seek( start )
+
+        return ( "content", digest.hexdigest() ), input_source
+
+    def _load_entry( self, entry_path: str, adapters: Tuple[ BaseAdapter, ... ], path_tracker: PathTracker ) -> bool:
+        """
+        Publishes the entry to the adapters after checking its integrity, updating the path tracker of the walk as the events are replayed; removes an invalid entry.
+
+        Returns:
+            `True` if the entry was valid, `False` otherwise.
+        """
+
+        with open( entry_path, "rb" ) as entry_file:
+            header = entry_file.read( _Header.size )
+            valid = len( header ) == _Header.size
+
+            if valid:
+                magic, version, store, length, digest = _Header.unpack( header )
+                valid = magic == _Magic and version == _FormatVersion and store == CacheStores.index( self._store )
+
+            if valid:
+                # The whole payload is checked before any event is published, so a damaged entry never publishes part of a document.
+                payload_digest = hashlib.sha256()
+                payload_length: int = 0
+
+                while True:
+                    data = entry_file.read( _ReadSize )
+                    if not data:
+                        break
+
+                    payload_digest.update( data )
+                    payload_length += len( data )
+
+                valid = payload_length == length and payload_digest.digest() == digest
+
+            if valid:
+                entry_file.seek( _Header.size )
+
+                if self._store == "events":
+                    while True:
+                        chunk_length = entry_file.read( _ChunkLength.size )
+                        if not chunk_length:
+                            break
+
+                        replay_events( track_events( path_tracker, decode_events( entry_file.read( _ChunkLength.unpack( chunk_length )[ 0 ] ) ) ), *adapters )
+                else:
+                    for adapter, adapter_state in zip( adapters, pickle.loads( entry_file.read() ) ):
+                        adapter.set_state( adapter_state )
+
+        if not valid:
+            self.invalid_count += 1
+            os.remove( entry_path )
+        else:
+            # The modification time orders the entries for the least recently used eviction.
+            os.utime( entry_path )
+
+        return valid
+
+    def _get_entries( self ) -> List[ Tuple[ int, int, str ] ]:
+        """
+        Gets the `( modification time, size, path )` of the entries.
+        """
+
+        entries = []
+
+        for directory, _, file_names in os.walk( self._cache_dir ):
+            for name in file_names:
+                if name.endswith( _EntrySuffix ):
+                    path = os.path.join( directory, name )
+
+                    try:
+                        stat = os.stat( path )
+                    except OSError: # Removed by another process.
+                        continue
+
+                    entries.append( ( stat.st_mtime_ns, stat.st_size, path ) )
+
+        return entries
+
+    def evict( self ) -> int:
+        """
+        Removes the least recently used entries until the cache is within its limits.
+
+        Returns:
+            The number of removed entries.
+        """
+
+        if self._max_bytes is None and self._max_entries is None:
+            return 0
+
+        entries = sorted( self._get_entries() )
+        total_size = sum( size for _, size, _ in entries )
+        removed_count: int = 0
+
+        for _, size, path in entries:
+            if ( self._max_bytes is None or total_size <= self._max_bytes ) and ( self._max_entries is None or len( entries ) - removed_count <= self._max_entries ):
+                break
+
+            try:
+                os.remove( path )
+            except OSError:
+                pass
+
+            total_size -= size
+            removed_count += 1
+
+        return removed_count
+
+    def clear( self ) -> None:
+        """
+        Removes every entry.
+        """
+
+        for _, _, path in self._get_entries():
+            os.remove( path )
+
+    def get_info( self ) -> Dict[ str, int ]:
+        """
+        Gets the entry count and total size of the cache, and the hits, misses and invalid entries found by this cache object.
+        """
+
+        entries = self._get_entries()
+
+        return {
+            "entries": len( entries ),
+            "bytes": sum( size for _, size, _ in entries ),
+            "hits": self.hit_count,
+            "misses": self.miss_count,
+            "invalid": self.invalid_count,
+        }
@@ -0,0 +1,98 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Tuple
+
+import os
+import pickle
+
+CheckpointModes = ( "list_items", "documents" )
+"""
+The checkpointed visit modes: `list_items` checkpoints between the items of a top-level list and `documents` between the documents of a sequence of documents, such as JSON Lines.
+"""
+
+_FormatVersion: int = 1
+
+class Checkpoint( object ):
+    """
+    The resumable state of a checkpointed visit at a safe boundary: between two items of the top-level list, or between two documents.
+
+    Attributes:
+        `mode`: the visit mode; one of `CheckpointModes`.
+        `source_path`: the absolute path of the visited file.
+        `source_size`: the size of the visited file, to detect a changed file.
+        `source_mtime_ns`: the modification time of the visited file in nanoseconds, to detect a changed file.
+        `offset`: the byte offset the visit resumes from: just after the separator following the last visited list item, or just after the last visited document.
+        `item_count`: the number of list items or documents visited.
+        `scope_stack`: the names of the `ScopeTypes` on the scope walker's stack.
+        `adapter_state`: the state snapshot returned by the adapter's `get_state`.
+    """
+
+    def __init__( self, mode: str, source_path: str, source_size: int, source_mtime_ns: int, offset: int, item_count: int, scope_stack: Tuple[ str, ... ], adapter_state: Any ):
+        if mode not in CheckpointModes:
+            raise ValueError( f"Invalid checkpoint mode '{ mode }': it must be one of { ', '.join( CheckpointModes ) }" )
+
+        self.mode: str = mode
+        self.source_path: str = source_path
+        self.source_size: int = source_size
+        self.source_mtime_ns: int = source_mtime_ns
+        self.offset: int = offset
+        self.item_count: int = item_count
+        self.scope_stack: Tuple[ str, ... ] = tuple( scope_stack )
+        self.adapter_state: Any = adapter_state
+
+    @property
+    def path( self ) -> Tuple[ int ]:
+        """
+        Gets the path of the next list item, or the number of the next document.
+        """
+
+        return ( self.item_count, )
+
+    def is_valid_for( self, source_path: str ) -> bool:
+        """
+        `True` if the file has the size and modification time recorded in the checkpoint; `False` if it has changed since the checkpoint was saved.
+        """
+
+        stat = os.stat( source_path )
+
+        return stat.st_size == self.source_size and stat.st_mtime_ns == self.source_mtime_ns
+
+    def save( self, checkpoint_path: str ) -> None:
+        """
+        Writes the checkpoint with `pickle`, replacing the previous checkpoint atomically so an interruption while saving leaves the previous checkpoint intact.
+        """
+
+        temporary_path = f"{ checkpoint_path }.tmp"
+
+        with open( temporary_path, "wb" ) as checkpoint_file:
+            pickle.dump( ( _FormatVersion, self.__dict__ ), checkpoint_file, protocol = pickle.HIGHEST_PROTOCOL )
+            checkpoint_file.flush()
+            os.fsync( checkpoint_file.fileno() )
+
+        os.replace( temporary_path, checkpoint_path )
+
+    @classmethod
+    def load( cls, checkpoint_path: str ) -> "Checkpoint":
+        """
+        Reads a checkpoint written by `save`; the adapter state is unpickled, so checkpoints must only be loaded from trusted locations.
+
+        Raises:
+            `ValueError` if the file is not a checkpoint of a supported version.
+        """
+
+        with open( checkpoint_path, "rb" ) as checkpoint_file:
+            try:
+                version, attributes = pickle.load( checkpoint_file )
+            except ( pickle.UnpicklingError, EOFError, TypeError, ValueError ) as error:
+                raise ValueError( f"'{ checkpoint_path }' is not a checkpoint file: { error }" ) from error
+
+        if version != _FormatVersion:
+            raise ValueError( f"Unsupported checkpoint format version { version }." )
+
+        checkpoint = cls.__new__( cls )
+        checkpoint.__dict__.update( attributes )
+
+        return checkpoint
+
+    def __repr__( self ):
+        return f"{ type( self ).__name__ }(mode = { self.mode !r}, source_path = { self.source_path !r}, offset = { self.offset }, item_count = { self.item_count })"
@@ -0,0 +1,150 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterator
+
+import os
+from time import monotonic
+from ..indexing.index_io import FramedReader, SpanReader
+from ..indexing.line_index import iter_record_spans
+from ..indexing.structural_scanner import find_root_list, iter_list_items
+from ..tokenizer.scope_walker import ScopeTypes
+from ..tokenizer.token_processor import TokenProcessor
+from .checkpoint import Checkpoint, CheckpointModes
+
+_ListStart = b"["
+_ListEnd: int = ord( "]" )
+
+def _get_boundaries( mode: str, data: Any, position: int ) -> Iterator[ int ]:
+    """
+    Gets the byte position of the boundary after each list item or document, from the given position.
+    """
+
+    if mode == "list_items":
+        return ( next_position for _, _, next_position in iter_list_items( data, position ) )
+    else:
+        return ( offset + length for offset, length in iter_record_spans( data, position ) )
+
+def visit_checkpointed( token_processor: TokenProcessor, source_path: str, checkpoint_path: str, interval_seconds: float, mode: str, checkpoint: Checkpoint = None ) -> None:
+    """
+    Visits the items of the top-level list of a file, or the documents of a sequence of documents, saving a checkpoint at the first boundary after each interval; resumes from the checkpoint if one is given.
+
+    The visit tokenizes the file as one stream from the start or the checkpoint offset. The byte offset of a boundary is only needed when a checkpoint is saved, so the structure of the file is scanned lazily, up to the boundary of the checkpoint, rather than for every item.
+
+    Parameters:
+        `token_processor`: the token processor publishing the events.
+        `source_path`: the path of the file.
+        `checkpoint_path`: the path of the checkpoint file; it is replaced by each checkpoint and removed when the visit completes.
+        `interval_seconds`: the minimum time between two checkpoints.
+        `mode`: one of `CheckpointModes`.
+        `checkpoint`: the checkpoint to resume from, or `None` to visit from the start.
+    """
+
+    import mmap
+
+    if mode not in CheckpointModes:
+        raise ValueError( f"Invalid checkpoint mode '{ mode }': it must be one of { ', '.join( CheckpointModes ) }" )
+
+    source_path = os.path.abspath( source_path )
+    scope_walker = token_processor._internal_scope_walker
+    event_handlers = token_processor._event_handlers
+    is_list = mode == "list_items"
+
+    with open( source_path, "rb" ) as source_file:
+        stat = os.fstat( source_file.fileno() )
+        if stat.st_size == 0:
+            raise ValueError( "The file is empty." )
+
+        with mmap.mmap( source_file.fileno(), 0, access = mmap.ACCESS_READ ) as data:
+            if checkpoint is None:
+                position = find_root_list( data ) if is_list else 0
+                item_count = 0
+            else:
+                if checkpoint.mode != mode:
+                    raise ValueError( f"The checkpoint is of a '{ checkpoint.mode }' visit, not a '{ mode }' visit." )
+                elif not checkpoint.is_valid_for( source_path ):
+                    raise ValueError( "The checkpoint is stale: the file has changed since the checkpoint was saved." )
+
+                position = checkpoint.offset
+                item_count = checkpoint.item_count
+
+                scope_walker._scope_stack = [ ScopeTypes[ name ] for name in checkpoint.scope_stack ]
+
+                # A resumed list visit is inside the root list, before the item following the checkpoint; a resumed documents visit is between documents.
+                path_tracker = scope_walker.path_tracker
+                path_tracker.reset()
+                if is_list:
+                    path_tracker.enter_list()
+                    path_tracker.set_next_item_index( item_count )
+
+                for adapter, adapter_state in zip( scope_walker._adapters, checkpoint.adapter_state ):
+                    adapter.set_state( adapter_state )
+
+            boundaries = _get_boundaries( mode, data, position )
+
+            try:
+                reader = SpanReader( source_file, position, stat.st_size - position )
+
+                if is_list:
+                    tokens = iter( token_processor._tokenize( FramedReader( _ListStart, reader ) ) )
+                    boundary_depth = 1
+
+                    # The opening bracket read before the items is the list start of a new visit; a resumed visit is already inside the list.
+                    event, value = next( tokens )
+                    if checkpoint is None:
+                        scope_walker.process_document_start()
+                        event_handlers[ event ]( value )
+                else:
+                    tokens = token_processor._tokenize( reader, multiple_values = True )
+                    boundary_depth = 0
+
+                depth: int = boundary_depth
+                unscanned_count: int = 0
+                boundary: int = position
+                next_checkpoint: float = monotonic() + interval_seconds
+
+                for event, value in tokens:
+                    if depth == 0:
+                        scope_walker.process_document_start()
+
+                    handler = event_handlers.get( event, None )
+                    if handler is not None:
+                        handler( value )
+
+                    if event == "start_map" or event == "start_array":
+                        depth += 1
+                    elif event == "end_map" or event == "end_array":
+                        depth -= 1
+
+                    if depth == boundary_depth:
+                        # A list item or a document ended; the end of the list leaves the depth below the boundary depth.
+                        if not is_list:
+                            scope_walker.process_document_end()
+
+                        item_count += 1
+                        unscanned_count += 1
+
+                        if monotonic() >= next_checkpoint:
+                            for _ in range( unscanned_count ):
+                                boundary = next( boundaries )
+                            unscanned_count = 0
+
+                            # No checkpoint is needed after the last list item.
+                            if not is_list or data[ boundary - 1 ] != _ListEnd:
+                                _save_checkpoint( checkpoint_path, mode, source_path, stat, boundary, item_count, scope_walker )
+
+                            next_checkpoint = monotonic() + interval_seconds
+
+                if is_list:
+                    scope_walker.process_document_end()
+            finally:
+                # The scan holds a view of the memory map, which can't be closed while the view exists.
+                boundaries.close()
+
+    if os.path.isfile( checkpoint_path ):
+        os.remove( checkpoint_path )
+
+def _save_checkpoint( checkpoint_path: str, mode: str, source_path: str, stat: os.stat_result, offset: int, item_count: int, scope_walker: Any ) -> None:
+    adapter_state = tuple( adapter.get_state() for adapter in scope_walker._adapters )
+    scope_stack = [ scope_type.name for scope_type in scope_walker._scope_stack ]
+
+    Checkpoint( mode, source_path, stat.st_size, stat.st_mtime_ns, offset, item_count, scope_stack, adapter_state ).save( checkpoint_path )
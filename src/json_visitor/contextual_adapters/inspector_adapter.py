@@ -1,12 +1,27 @@
 __version__ = r"1.0.0"
 
-from typing import Any, Iterable, Tuple
+from typing import Any, Iterable, TextIO, Tuple
 
 from ..scoping.root_scope import RootScope
 from .base_adapter import BaseAdapter
 from ..simple_adapters.scope_inspector_adapter import ScopeInspectionAdapter
 
 class InspectionAdapter( BaseAdapter, ScopeInspectionAdapter ):
+    """
+    An adapter which writes each visitation event, including the contextual events, to a sink; see `ScopeInspectionAdapter` for the parameters.
+    """
+
+    def __init__( self, sink: TextIO = None, output_format: str = "text", max_value_length: int = None, buffer_size: int = 8192 ):
+        super().__init__()
+
+        self._configure_output( sink, output_format, max_value_length, buffer_size )
+
+    def after_document_end( self ) -> None:
+        super().after_document_end()
+
+        # The document events are published after the scope inspection adapter flushed its buffer.
+        self.flush()
+
     def process_document( self, root_scope: RootScope ) -> None:
         super().process_document( root_scope )
 
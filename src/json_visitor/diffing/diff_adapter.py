@@ -0,0 +1,81 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, Iterable, Tuple, Union
+
+Path = Tuple[ Union[ str, int ], ... ]
+
+class DiffAdapter( object ):
+    """
+    Implements a base adapter to inherit from for diffing visitation: the adapter is only driven over the paths which differ between two versions of a document.
+
+    A path is a tuple of member keys and list indices from the root value; `()` is the root value. The values are the Python values of the subtrees: `dict`, `list` and scalar values. The paths of removed list items are their indices in the old document, and the paths of added and changed items their indices in the new document.
+    """
+
+    def default_before( self, *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
+        """
+        Default callback invoked before the differences are processed.
+        """
+
+        pass
+
+    def default_process( self, *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
+        """
+        Default callback invoked when processing a difference.
+        """
+
+        pass
+
+    def default_after( self, *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
+        """
+        Default callback invoked after the differences are processed.
+        """
+
+        pass
+
+    def before_diff( self ) -> None:
+        """
+        Callback invoked before processing the differences.
+        """
+
+        self.default_before()
+
+    def process_added( self, path: Path, value: Any ) -> None:
+        """
+        Callback invoked when processing a value which is only in the new document.
+
+        Parameters:
+            `path`: the path of the value in the new document.
+            `value`: the added value.
+        """
+
+        self.default_process( path, value )
+
+    def process_removed( self, path: Path, old_value: Any ) -> None:
+        """
+        Callback invoked when processing a value which is only in the old document.
+
+        Parameters:
+            `path`: the path of the value in the old document.
+            `old_value`: the removed value; `None` if the old hash tree was stored without its values.
+        """
+
+        self.default_process( path, old_value )
+
+    def process_changed( self, path: Path, old_value: Any, new_value: Any ) -> None:
+        """
+        Callback invoked when processing a value which was replaced: a scalar value which changed, or a value whose type changed. Objects and lists of the same type are not reported as changed themselves; their differing children are.
+
+        Parameters:
+            `path`: the path of the value in the new document.
+            `old_value`: the old value; `None` if the old hash tree was stored without its values.
+            `new_value`: the new value.
+        """
+
+        self.default_process( path, old_value, new_value )
+
+    def after_diff( self ) -> None:
+        """
+        Callback invoked after processing the differences.
+        """
+
+        self.default_after()
@@ -0,0 +1,88 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict
+
+from difflib import SequenceMatcher
+from .diff_adapter import DiffAdapter, Path
+from .hash_tree import HashNode, HashTree
+
+def _get_value( node: HashNode, has_values: bool ) -> Any:
+    return node.to_value() if has_values else None
+
+def _diff_nodes( old_node: HashNode, new_node: HashNode, path: Path, old_has_values: bool, adapter: DiffAdapter ) -> None:
+    """
+    Publishes the differences between two subtrees; subtrees with the same digest are skipped without being walked.
+    """
+
+    if old_node.digest == new_node.digest:
+        return
+
+    if old_node.is_object and new_node.is_object:
+        old_children = old_node.children
+        new_children = new_node.children
+
+        for key, old_child in old_children.items():
+            if key not in new_children:
+                adapter.process_removed( path + ( key, ), _get_value( old_child, old_has_values ) )
+
+        for key, new_child in new_children.items():
+            old_child = old_children.get( key, None )
+
+            if old_child is None:
+                adapter.process_added( path + ( key, ), new_child.to_value() )
+            else:
+                _diff_nodes( old_child, new_child, path + ( key, ), old_has_values, adapter )
+    elif old_node.is_list and new_node.is_list:
+        old_items = old_node.children
+        new_items = new_node.children
+
+        # The items are aligned on their digests, so an item inserted or removed in the middle of a list doesn't change the items after it.
+        matcher = SequenceMatcher( None, [ item.digest for item in old_items ], [ item.digest for item in new_items ], autojunk = False )
+
+        for operation, old_start, old_stop, new_start, new_stop in matcher.get_opcodes():
+            if operation == "equal":
+                continue
+
+            # Replaced items are diffed pairwise; the rest of the longer run is removed or added.
+            paired_count = min( old_stop - old_start, new_stop - new_start )
+            for offset in range( paired_count ):
+                _diff_nodes( old_items[ old_start + offset ], new_items[ new_start + offset ], path + ( new_start + offset, ), old_has_values, adapter )
+
+            for old_index in range( old_start + paired_count, old_stop ):
+                adapter.process_removed( path + ( old_index, ), _get_value( old_items[ old_index ], old_has_values ) )
+
+            for new_index in range( new_start + paired_count, new_stop ):
+                adapter.process_added( path + ( new_index, ), new_items[ new_index ].to_value() )
+    else:
+        adapter.process_changed( path, _get_value( old_node, old_has_values ), new_node.to_value() )
+
+def visit_diff( old: Any, new: Any, adapter: DiffAdapter, **kwargs: Dict[ str, Any ] ) -> HashTree:
+    """
+    Compares two versions of a JSON document by their hash trees and publishes only the differences to the adapter: the added, removed and changed values.
+
+    The hash tree of the new version is returned, so it can be stored and compared with the next version without visiting the current version again.
+
+    Parameters:
+        `old`: the old version: a `HashTree`, such as one loaded with `HashTree.load`, or a JSON input source as accepted by `JsonVisitor.visit`.
+        `new`: the new version: a `HashTree` or a JSON input source.
+        `adapter`: the adapter the differences are published to.
+        `kwargs`: the options of the `JsonVisitor` the input sources are visited with; the hash trees must be built with the same number options to be compared.
+
+    Returns:
+        The hash tree of the new version.
+    """
+
+    if not isinstance( adapter, DiffAdapter ):
+        raise ValueError( f"Adapter must be an instance of { DiffAdapter.__qualname__ }." )
+
+    old_tree = old if isinstance( old, HashTree ) else HashTree.build( old, **kwargs )
+    new_tree = new if isinstance( new, HashTree ) else HashTree.build( new, **kwargs )
+
+    if not new_tree.has_values:
+        raise ValueError( "The hash tree of the new version must keep its values." )
+
+    adapter.before_diff()
+    _diff_nodes( old_tree.root, new_tree.root, (), old_tree.has_values, adapter )
+    adapter.after_diff()
+
+    return new_tree
@@ -0,0 +1,214 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, List, Union
+
+import pickle
+import struct
+from hashlib import blake2b
+from ..simple_adapters.base_adapter import BaseAdapter
+
+_DigestSize: int = 16
+_Length = struct.Struct( "<I" )
+
+_FormatVersion: int = 1
+
+class HashNode( object ):
+    """
+    A node of a hash tree: the digest of a value and its children.
+
+    Attributes:
+        `digest`: the digest of the value; equal values, including objects with the same members in any order, have the same digest.
+        `children`: the member nodes of an object by key, the item nodes of a list, or `None` for a scalar value.
+        `value`: the value of a scalar, or `None` for an object or a list, or when the values are not kept.
+    """
+
+    __slots__ = ( "digest", "children", "value" )
+
+    def __init__( self, digest: bytes, children: Union[ Dict[ str, "HashNode" ], List[ "HashNode" ] ] = None, value: Any = None ):
+        self.digest: bytes = digest
+        self.children: Union[ Dict[ str, HashNode ], List[ HashNode ] ] = children
+        self.value: Any = value
+
+    @property
+    def is_object( self ) -> bool:
+        return isinstance( self.children, dict )
+
+    @property
+    def is_list( self ) -> bool:
+        return isinstance( self.children, list )
+
+    def to_value( self ) -> Any:
+        """
+        Rebuilds the Python value of the subtree.
+        """
+
+        if self.is_object:
+            return { key: child.to_value() for key, child in self.children.items() }
+        elif self.is_list:
+            return [ child.to_value() for child in self.children ]
+        else:
+            return self.value
+
+def _hash_scalar( value: Any ) -> bytes:
+    if value is None:
+        data = b"n"
+    elif value is True:
+        data = b"t"
+    elif value is False:
+        data = b"f"
+    elif type( value ) is str:
+        data = b"s" + value.encode( "utf-8" )
+    else: # A number: `int`, `float`, `Decimal` or one of the raw number types.
+        data = b"d" + str( value ).encode( "utf-8" )
+
+    return blake2b( data, digest_size = _DigestSize ).digest()
+
+class HashTreeAdapter( BaseAdapter ):
+    """
+    Builds the hash tree of the visited document bottom-up: the digest of each value is computed when the value ends, from the digests of its children.
+
+    The members of an object are hashed in key order, so the digest of an object doesn't depend on the order of its members, while the items of a list are hashed in order.
+    """
+
+    def __init__( self, keep_values: bool = True ):
+        super().__init__()
+
+        self._keep_values: bool = keep_values
+        self._stack: List[ HashNode ] = []
+        self._keys: List[ str ] = []
+        self.root: HashNode = None
+
+    def _attach( self, node: HashNode ) -> None:
+        if len( self._stack ) == 0:
+            self.root = node
+        else:
+            parent = self._stack[ -1 ]
+
+            if parent.is_object:
+                parent.children[ self._keys.pop() ] = node
+            else:
+                parent.children.append( node )
+
+    def process_document_start( self ) -> None:
+        super().process_document_start()
+
+        self._stack = []
+        self._keys = []
+        self.root = None
+
+    def process_object_start( self ) -> None:
+        super().process_object_start()
+
+        self._stack.append( HashNode( None, {} ) )
+
+    def process_object_end( self ) -> None:
+        super().process_object_end()
+
+        node = self._stack.pop()
+        digest = blake2b( b"o", digest_size = _DigestSize )
+
+        for key in sorted( node.children ):
+            data = key.encode( "utf-8" )
+            digest.update( _Length.pack( len( data ) ) )
+            digest.update( data )
+            digest.update( node.children[ key ].digest )
+
+        node.digest = digest.digest()
+        self._attach( node )
+
+    def process_list_start( self ) -> None:
+        super().process_list_start()
+
+        self._stack.append( HashNode( None, [] ) )
+
+    def process_list_end( self ) -> None:
+        super().process_list_end()
+
+        node = self._stack.pop()
+        digest = blake2b( b"l", digest_size = _DigestSize )
+
+        for child in node.children:
+            digest.update( child.digest )
+
+        node.digest = digest.digest()
+        self._attach( node )
+
+    def process_member_key( self, name: str ) -> None:
+        super().process_member_key( name )
+
+        self._keys.append( name )
+
+    def process_value( self, value: Any ) -> None:
+        super().process_value( value )
+
+        self._attach( HashNode( _hash_scalar( value ), None, value if self._keep_values else None ) )
+
+class HashTree( object ):
+    """
+    The structural hash tree of a JSON document: the digest of every subtree, so two versions of a document can be compared without comparing their unchanged subtrees.
+
+    Parameters:
+        `root`: the node of the root value.
+        `has_values`: `True` if the scalar values are kept, so the values of the old document can be reported when it is diffed.
+    """
+
+    def __init__( self, root: HashNode, has_values: bool = True ):
+        self.root: HashNode = root
+        self.has_values: bool = has_values
+
+    @classmethod
+    def build( cls, input_source: Any, keep_values: bool = True, **kwargs: Dict[ str, Any ] ) -> "HashTree":
+        """
+        Visits a JSON document and builds its hash tree.
+
+        Parameters:
+            `input_source`: the JSON input source, as accepted by `JsonVisitor.visit`.
+            `keep_values`: `True` (the default) to keep the scalar values in the tree; `False` to keep only the digests, for a smaller stored tree.
+            `kwargs`: the options of the `JsonVisitor`; the number options change the published values, so the trees of two documents must be built with the same options to be compared.
+
+        Returns:
+            The hash tree.
+        """
+
+        from ..json_visitor import JsonVisitor
+
+        adapter = HashTreeAdapter( keep_values )
+        JsonVisitor( adapter, **kwargs ).visit( input_source )
+
+        return cls( adapter.root, keep_values )
+
+    @property
+    def digest( self ) -> bytes:
+        """
+        Gets the digest of the whole document.
+        """
+
+        return self.root.digest
+
+    def save( self, tree_path: str ) -> None:
+        """
+        Writes the tree with `pickle`.
+        """
+
+        with open( tree_path, "wb" ) as tree_file:
+            pickle.dump( ( _FormatVersion, self.has_values, self.root ), tree_file, protocol = pickle.HIGHEST_PROTOCOL )
+
+    @classmethod
+    def load( cls, tree_path: str ) -> "HashTree":
+        """
+        Reads a tree written by `save`; the tree is unpickled, so trees must only be loaded from trusted locations.
+
+        Raises:
+            `ValueError` if the file is not a hash tree of a supported version.
+        """
+
+        with open( tree_path, "rb" ) as tree_file:
+            try:
+                version, has_values, root = pickle.load( tree_file )
+            except ( pickle.UnpicklingError, EOFError, TypeError, ValueError ) as error:
+                raise ValueError( f"'{ tree_path }' is not a hash tree file: { error }" ) from error
+
+        if version != _FormatVersion:
+            raise ValueError( f"Unsupported hash tree format version { version }." )
+
+        return cls( root, has_values )
@@ -0,0 +1,275 @@
+__version__ = r"1.0.0"
+
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Tuple, TypeVar
+
+import os
+import sys
+from array import array
+from io import BytesIO
+
+Unknown: int = -1
+"""
+The source size or modification time recorded when it isn't known, such as the modification time of an in-memory source.
+"""
+
+def get_source_stat( source: Any ) -> Tuple[ int, int ]:
+    """
+    Gets the size and the modification time in nanoseconds of a file path or a file object; the modification time is unknown for in-memory sources.
+    """
+
+    if isinstance( source, ( str, os.PathLike ) ):
+        stat = os.stat( source )
+    elif isinstance( source, ( bytes, bytearray, memoryview ) ):
+        return len( source ), Unknown
+    else:
+        try:
+            stat = os.fstat( source.fileno() )
+        except ( AttributeError, OSError, ValueError ):
+            position = source.tell()
+            size = source.seek( 0, os.SEEK_END )
+            source.seek( position )
+
+            return size, Unknown
+
+    return stat.st_size, stat.st_mtime_ns
+
+def write_array( index_file: BinaryIO, values: array ) -> None:
+    """
+    Writes an array of unsigned 64-bit integers in little-endian byte order.
+    """
+
+    if sys.byteorder != "little":
+        values = array( "Q", values )
+        values.byteswap()
+
+    index_file.write( values.tobytes() )
+
+def read_array( index_file: BinaryIO, count: int ) -> array:
+    """
+    Reads an array of unsigned 64-bit integers written by `write_array`.
+    """
+
+    values = array( "Q" )
+    values.frombytes( read_exactly( index_file, count * values.itemsize ) )
+
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    return values
+
+def read_exactly( index_file: BinaryIO, size: int ) -> bytes:
+    """
+    Reads the given number of bytes.
+
+    Raises:
+        `ValueError` if the file ends first.
+    """
+
+    data = index_file.read( size )
+    if len( data ) != size:
+        raise ValueError( "The index file is truncated." )
+
+    return data
+
+_Result = TypeVar( "_Result" )
+
+def scan_source( input_source: Any, scan: Callable[ [ Any ], _Result ] ) -> _Result:
+    """
+    Calls `scan` with the bytes of the source: a bytes-like object as is, and a file path or a binary file object memory-mapped, so a large file is not read into memory; a file which can't be mapped is read.
+    """
+
+    if isinstance( input_source, ( bytes, bytearray, memoryview ) ):
+        return scan( input_source )
+    elif isinstance( input_source, ( str, os.PathLike ) ):
+        with open( input_source, "rb" ) as source_file:
+            return scan_source( source_file, scan )
+
+    import mmap
+
+    try:
+        mapped = mmap.mmap( input_source.fileno(), 0, access = mmap.ACCESS_READ )
+    except ( AttributeError, OSError, ValueError ): # Not a regular file, or an empty file which can't be mapped.
+        input_source.seek( 0 )
+        return scan( input_source.read() )
+
+    try:
+        return scan( mapped )
+    finally:
+        mapped.close()
+
+def get_source_path( input_source: Any ) -> str:
+    """
+    Gets the path of the file of a source, used to find its sidecar index; `None` for an in-memory source or a file object without a file path.
+    """
+
+    if isinstance( input_source, ( str, os.PathLike ) ):
+        return os.fspath( input_source )
+
+    name = getattr( input_source, "name", None )
+
+    return name if isinstance( name, str ) and os.path.isfile( name ) else None
+
+class SpanReader( object ):
+    """
+    A binary file-like object reading one byte span of a source, so a value can be tokenized without reading the rest of the source.
+    """
+
+    def __init__( self, input_source: Any, offset: int, length: int ):
+        if isinstance( input_source, ( bytes, bytearray, memoryview ) ):
+            self._source_file: BinaryIO = BytesIO( input_source )
+            self._owns_file: bool = True
+        elif isinstance( input_source, ( str, os.PathLike ) ):
+            self._source_file = open( input_source, "rb" )
+            self._owns_file = True
+        else:
+            self._source_file = input_source
+            self._owns_file = False
+
+        self._source_file.seek( offset )
+        self._remaining: int = length
+
+    def read( self, size: int = -1 ) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+
+        data = self._source_file.read( size )
+        self._remaining -= len( data )
+
+        return data
+
+    def close( self ) -> None:
+        if self._owns_file:
+            self._source_file.close()
+
+    def __enter__( self ) -> "SpanReader":
+        return self
+
+    def __exit__( self, *args: Iterable[ Any ] ) -> None:
+        self.close()
+
+class FramedReader( object ):
+    """
+    A binary file-like object reading a prefix, the data of another reader and a suffix, so a range of list items can be tokenized as a list by framing it with brackets.
+    """
+
+    def __init__( self, prefix: bytes, reader: Any, suffix: bytes = b"" ):
+        self._prefix: bytes = prefix
+        self._reader: Any = reader
+        self._suffix: bytes = suffix
+
+    def read( self, size: int = -1 ) -> bytes:
+        if size == 0: # The tokenizer reads 0 bytes to detect a binary file.
+            return b""
+
+        data = self._prefix
+        self._prefix = b""
+
+        if size < 0:
+            data += self._reader.read()
+        elif len( data ) < size:
+            data += self._reader.read( size - len( data ) )
+
+        if len( data ) == 0 or size < 0:
+            # The suffix follows the end of the data of the reader.
+            data += self._suffix
+            self._suffix = b""
+
+        return data
+
+class SourceIndex( object ):
+    """
+    The base class of the indexes of a source, which record the size and the modification time of the source so an index of a changed source is detected.
+
+    A derived class provides `build( input_source, **kwargs )` and `load( index_path )` class methods, `save( index_path )`, and the `sidecar_suffix` appended to the path of a file to get the path of its sidecar index.
+    """
+
+    sidecar_suffix: str = ".jvindex"
+    index_kind: str = "source"
+
+    def __init__( self, source_size: int = Unknown, source_mtime_ns: int = Unknown ):
+        self._source_size: int = source_size
+        self._source_mtime_ns: int = source_mtime_ns
+
+    @classmethod
+    def get_sidecar_path( cls, source_path: str ) -> str:
+        """
+        Gets the path of the sidecar index of a file.
+        """
+
+        return os.fspath( source_path ) + cls.sidecar_suffix
+
+    @property
+    def source_size( self ) -> int:
+        """
+        Gets the size of the indexed source in bytes.
+        """
+
+        return self._source_size
+
+    @property
+    def source_mtime_ns( self ) -> int:
+        """
+        Gets the modification time of the indexed source file in nanoseconds; -1 if the source was not a file.
+        """
+
+        return self._source_mtime_ns
+
+    def is_valid_for( self, input_source: Any ) -> bool:
+        """
+        `True` if the index matches the size and, for files, the modification time of the source; `False` if the source has changed since the index was built.
+        """
+
+        size, mtime_ns = get_source_stat( input_source )
+
+        return size == self._source_size and ( mtime_ns == self._source_mtime_ns or Unknown in ( mtime_ns, self._source_mtime_ns ) )
+
+    @classmethod
+    def load_sidecar( cls, input_source: Any ) -> "SourceIndex":
+        """
+        Loads the sidecar index of a source file.
+
+        Parameters:
+            `input_source`: the path of the file or a binary file object.
+
+        Returns:
+            The sidecar index, or `None` if the source is not a file, the file has no sidecar index or the index is stale.
+        """
+
+        source_path = get_source_path( input_source )
+        if source_path is None:
+            return None
+
+        sidecar_path = cls.get_sidecar_path( source_path )
+        if not os.path.isfile( sidecar_path ):
+            return None
+
+        sidecar_index = cls.load( sidecar_path )
+
+        return sidecar_index if sidecar_index.is_valid_for( input_source ) else None
+
+    @classmethod
+    def for_source( cls, input_source: Any, index: Any = None, **kwargs: Dict[ str, Any ] ) -> "SourceIndex":
+        """
+        Gets the index to read the source with.
+
+        Parameters:
+            `input_source`: the path of the file, a binary file object or a bytes-like object.
+            `index`: the index, or the path of an index file; if `None`, the sidecar index of the source file is loaded when it exists and is current, otherwise the source is scanned into an in-memory index.
+            `kwargs`: the options of `build` when there is no sidecar index.
+
+        Raises:
+            `ValueError` if the given index doesn't match the source.
+        """
+
+        if index is None:
+            sidecar_index = cls.load_sidecar( input_source )
+
+            return sidecar_index if sidecar_index is not None else cls.build( input_source, **kwargs )
+
+        if not isinstance( index, cls ):
+            index = cls.load( index )
+
+        if not index.is_valid_for( input_source ):
+            raise ValueError( f"The { cls.index_kind } index is stale: the source has changed since the index was built." )
+
+        return index
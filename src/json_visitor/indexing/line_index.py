@@ -0,0 +1,219 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterable, Iterator, List, Tuple
+
+import re
+import struct
+from array import array
+from bisect import bisect_left
+from .index_io import SourceIndex, Unknown, get_source_stat, read_array, read_exactly, scan_source, write_array
+
+# File layout, little-endian: the header, then the record offsets followed by the source size as an array of unsigned 64-bit integers.
+_Magic = b"JVLI"
+_FormatVersion: int = 1
+_Header = struct.Struct( "<4sHqqQ" ) # Magic, version, source size, source modification time (ns), record count.
+
+# The rest of a line from its first non-whitespace byte; the search for the next record resumes at the line terminator, so blank lines and indentation are skipped by the regular expression engine.
+_RecordPattern = re.compile( rb"[^ \t\r\n][^\n]*" )
+
+def iter_record_spans( data: Any, position: int = 0 ) -> Iterator[ Tuple[ int, int ] ]:
+    """
+    Scans the records of a JSON Lines source lazily, skipping blank lines.
+
+    Parameters:
+        `data`: the bytes-like object holding the UTF-8 encoded source.
+        `position`: the byte position to scan from, at the start of a line or at the end of a record.
+
+    Returns:
+        Iterator of `( offset, length )` byte spans of the records, excluding the line terminators.
+    """
+
+    for match in _RecordPattern.finditer( data, position ):
+        start = match.start()
+        yield start, match.end() - start
+
+def _scan_records( data: Any ) -> array:
+    offsets = array( "Q" )
+    offsets.extend( match.start() for match in _RecordPattern.finditer( data ) )
+
+    return offsets
+
+class LineIndex( SourceIndex ):
+    """
+    Maps the record numbers of a JSON Lines (NDJSON) source, counting the non-blank lines from 0, to their byte offsets, so records can be read without scanning the lines before them.
+
+    The offsets are kept as an array of unsigned 64-bit integers ending with the source size, which is also the on-disk format, so the index costs 8 bytes per record. Record `n` spans from its offset to the offset of record `n + 1`, including the line terminator and any blank lines after it.
+    """
+
+    sidecar_suffix: str = ".jvlines"
+    index_kind: str = "line"
+
+    def __init__( self, offsets: array, source_size: int, source_mtime_ns: int = Unknown ):
+        super().__init__( source_size, source_mtime_ns )
+
+        self._offsets: array = offsets
+        if len( offsets ) == 0 or offsets[ -1 ] != source_size:
+            self._offsets.append( source_size )
+
+    @classmethod
+    def build( cls, input_source: Any ) -> "LineIndex":
+        """
+        Builds the line index of a JSON Lines source.
+
+        Parameters:
+            `input_source`: the path of the file, a binary file object or a bytes-like object; files are memory-mapped when possible, so they are not read into memory.
+
+        Returns:
+            The line index, recording the size and the modification time of the source file so a stale index can be detected.
+        """
+
+        source_size, source_mtime_ns = get_source_stat( input_source )
+
+        return cls( scan_source( input_source, _scan_records ), source_size, source_mtime_ns )
+
+    @property
+    def offsets( self ) -> array:
+        """
+        Gets the byte offsets of the records, followed by the source size.
+        """
+
+        return self._offsets
+
+    def __len__( self ) -> int:
+        return len( self._offsets ) - 1
+
+    def get_span( self, start: int, stop: int = None ) -> Tuple[ int, int ]:
+        """
+        Gets the `( offset, length )` byte span of the records in `[start, stop)`, or of record `start` if `stop` is `None`.
+
+        Raises:
+            `IndexError` if the range is outside of the records.
+        """
+
+        if stop is None:
+            stop = start + 1
+
+        if not 0 <= start <= stop <= len( self ):
+            raise IndexError( f"Record range [{ start }, { stop }) is outside of the { len( self ) } records." )
+
+        offset = self._offsets[ start ]
+
+        return offset, self._offsets[ stop ] - offset
+
+    def get_runs( self, records: Iterable[ int ] ) -> List[ Tuple[ int, int ] ]:
+        """
+        Groups ascending record numbers into runs of consecutive records, so each run can be read as one span.
+
+        Parameters:
+            `records`: the record numbers, a `range` or an iterable of ascending numbers.
+
+        Returns:
+            List of `[start, stop)` record ranges.
+        """
+
+        if isinstance( records, range ) and records.step == 1:
+            return [ ( records.start, records.stop ) ] if len( records ) > 0 else []
+
+        runs: List[ Tuple[ int, int ] ] = []
+        start = stop = None
+
+        for record in records:
+            if record == stop:
+                stop += 1
+                continue
+            elif stop is not None and record < stop:
+                raise ValueError( f"Record numbers must be ascending: { record } follows { stop - 1 }." )
+
+            if start is not None:
+                runs.append( ( start, stop ) )
+
+            start, stop = record, record + 1
+
+        if start is not None:
+            runs.append( ( start, stop ) )
+
+        return runs
+
+    def sample( self, count: int, seed: Any = None ) -> List[ int ]:
+        """
+        Draws a uniform random sample of record numbers without replacement.
+
+        Parameters:
+            `count`: the sample size; all records are returned if there are fewer.
+            `seed`: the seed of the random number generator, for a reproducible sample.
+
+        Returns:
+            The ascending record numbers of the sample.
+        """
+
+        from random import Random
+
+        return sorted( Random( seed ).sample( range( len( self ) ), min( count, len( self ) ) ) )
+
+    def shard( self, count: int ) -> List[ Tuple[ int, int ] ]:
+        """
+        Splits the records into contiguous ranges of about the same size in bytes, to distribute the records between workers.
+
+        Parameters:
+            `count`: the number of shards; fewer shards are returned if there are fewer records.
+
+        Returns:
+            List of non-empty `[start, stop)` record ranges covering all records in order.
+        """
+
+        if count < 1:
+            raise ValueError( f"Invalid shard count { count }: it must be at least 1." )
+
+        offsets = self._offsets
+        record_count = len( self )
+        if record_count == 0:
+            return []
+
+        first_offset = offsets[ 0 ]
+        total_size = offsets[ -1 ] - first_offset
+
+        shards: List[ Tuple[ int, int ] ] = []
+        start = 0
+
+        for shard_index in range( 1, count ):
+            # The shard ends at the first record starting at or after its share of the bytes.
+            stop = bisect_left( offsets, first_offset + total_size * shard_index // count, start + 1, record_count )
+
+            if stop > start:
+                shards.append( ( start, stop ) )
+                start = stop
+
+        if start < record_count:
+            shards.append( ( start, record_count ) )
+
+        return shards
+
+    def save( self, index_path: str ) -> None:
+        """
+        Writes the index to a file in the compact binary line index format.
+        """
+
+        with open( index_path, "wb" ) as index_file:
+            index_file.write( _Header.pack( _Magic, _FormatVersion, self._source_size, self._source_mtime_ns, len( self ) ) )
+            write_array( index_file, self._offsets )
+
+    @classmethod
+    def load( cls, index_path: str ) -> "LineIndex":
+        """
+        Reads an index written by `save`.
+
+        Raises:
+            `ValueError` if the file is not a line index or is truncated.
+        """
+
+        with open( index_path, "rb" ) as index_file:
+            magic, version, source_size, source_mtime_ns, record_count = _Header.unpack( read_exactly( index_file, _Header.size ) )
+
+            if magic != _Magic:
+                raise ValueError( f"'{ index_path }' is not a line index file." )
+            elif version != _FormatVersion:
+                raise ValueError( f"Unsupported line index format version { version }." )
+
+            offsets = read_array( index_file, record_count + 1 )
+
+        return cls( offsets, source_size, source_mtime_ns )
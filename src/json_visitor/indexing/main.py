@@ -0,0 +1,126 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict
+
+import os
+import sys
+import time
+from argparse import ArgumentParser, Namespace
+from . import __name__ as PackageName
+from .line_index import LineIndex
+from .path_index import PathIndex
+
+def _build_index( index_class: Any, arguments: Namespace, **kwargs: Dict[ str, Any ] ) -> Any:
+    start = time.perf_counter()
+    index = index_class.build( arguments.source_path, **kwargs )
+    elapsed = time.perf_counter() - start
+
+    index_path = arguments.output_path or index_class.get_sidecar_path( arguments.source_path )
+    index.save( index_path )
+
+    print( f"Index: { index_path }" )
+    print( f"Source bytes: { index.source_size }" )
+    print( f"Build time: { elapsed * 1e3:.1f} ms ({ index.source_size / elapsed / 1e6 if elapsed > 0 else 0:.1f} MB/s)" )
+    print( f"Index bytes: { os.path.getsize( index_path ) }" )
+
+    return index
+
+def _run_lines( arguments: Namespace ) -> int:
+    index = _build_index( LineIndex, arguments )
+
+    print( f"Records: { len( index ) }" )
+
+    return 0
+
+def _run_paths( arguments: Namespace ) -> int:
+    index = _build_index( PathIndex, arguments, depth = arguments.depth )
+
+    print( f"Indexed values: { len( index ) } (depth { index.depth })" )
+
+    return 0
+
+def _run_info( arguments: Namespace ) -> int:
+    found = False
+
+    for index_class in ( LineIndex, PathIndex ):
+        index_path = index_class.get_sidecar_path( arguments.source_path )
+        if not os.path.isfile( index_path ):
+            continue
+
+        found = True
+        index = index_class.load( index_path )
+
+        print( f"{ index_class.index_kind.capitalize() } index: { index_path }" )
+        print( f"  Current: { 'yes' if index.is_valid_for( arguments.source_path ) else 'no, the source has changed' }" )
+        print( f"  Source bytes: { index.source_size }" )
+
+        if isinstance( index, LineIndex ):
+            print( f"  Records: { len( index ) }" )
+        else:
+            print( f"  Indexed values: { len( index ) } (depth { index.depth })" )
+
+    if not found:
+        print( f"No index found for '{ arguments.source_path }'.", file = sys.stderr )
+
+    return 0 if found else 1
+
+def _run_shards( arguments: Namespace ) -> int:
+    index = LineIndex.for_source( arguments.source_path )
+
+    print( "start\tstop\toffset\tlength" )
+
+    for start, stop in index.shard( arguments.count ):
+        offset, length = index.get_span( start, stop )
+        print( f"{ start }\t{ stop }\t{ offset }\t{ length }" )
+
+    return 0
+
+def _build_argument_parser() -> ArgumentParser:
+    parser: ArgumentParser = ArgumentParser( description = "Builds and inspects the sidecar indexes of JSON and JSON Lines files.", prog = PackageName )
+
+    subparsers = parser.add_subparsers( dest = "command", metavar = "<command>" )
+    subparsers.required = True
+
+    lines_parser = subparsers.add_parser( "lines", help = "Builds the line-offset index of a JSON Lines file.", description = f"Builds the line-offset index of a JSON Lines file, by default in the sidecar file <file>{ LineIndex.sidecar_suffix }." )
+    lines_parser.set_defaults( run = _run_lines )
+
+    paths_parser = subparsers.add_parser( "paths", help = "Builds the path index of a JSON file.", description = f"Builds the byte-offset path index of a JSON file, by default in the sidecar file <file>{ PathIndex.sidecar_suffix }." )
+    paths_parser.add_argument( "--depth", type = int, default = 1, help = "Depth of the deepest indexed values: 1 indexes the items of a top-level list or the members of a top-level object. The default is 1.", metavar = "N" )
+    paths_parser.set_defaults( run = _run_paths )
+
+    for subparser in ( lines_parser, paths_parser ):
+        subparser.add_argument( "source_path", help = "The file to index.", metavar = "<file path>" )
+        subparser.add_argument( "-o", "--output", dest = "output_path", help = "Writes the index to the given path instead of the sidecar file.", metavar = "<file path>" )
+
+    info_parser = subparsers.add_parser( "info", help = "Describes the sidecar indexes of a file.", description = "Describes the sidecar indexes of a file and whether they are current." )
+    info_parser.add_argument( "source_path", help = "The indexed file.", metavar = "<file path>" )
+    info_parser.set_defaults( run = _run_info )
+
+    shards_parser = subparsers.add_parser( "shards", help = "Splits a JSON Lines file into record ranges of equal size.", description = "Splits the records of a JSON Lines file into contiguous ranges of about the same size in bytes, using the sidecar line index when it is current." )
+    shards_parser.add_argument( "source_path", help = "The JSON Lines file.", metavar = "<file path>" )
+    shards_parser.add_argument( "-n", "--count", type = int, default = os.cpu_count() or 1, help = "Number of shards. The default is the CPU count.", metavar = "N" )
+    shards_parser.set_defaults( run = _run_shards )
+
+    return parser
+
+def main( args = None ) -> int:
+    """
+    Runs the selected indexing command.
+
+    Parameters:
+        `args`: input parameters to parse. If `None`, parameters are read from `sys.argv`.
+
+    Returns:
+        Integer representing the exit code: 0 on success, 1 if the command failed.
+    """
+
+    if args is None:
+        args = sys.argv[ 1: ]
+
+    processed_args: Namespace = _build_argument_parser().parse_args( args )
+
+    try:
+        return processed_args.run( processed_args )
+    except ( OSError, ValueError ) as error:
+        print( f"Error: { error }", file = sys.stderr )
+        return 1
@@ -0,0 +1,251 @@
+__version__ = r"1.0.0"
+
+from typing import Any, BinaryIO, Dict, Iterable, Tuple, Union
+
+import struct
+from .index_io import SourceIndex, Unknown, get_source_stat, read_array, read_exactly, scan_source, write_array
+from .structural_scanner import ContainerSpans, Path, PathComponent, scan_structure
+
+
+# File layout, little-endian: the header, then each container: its path, its kind, its child count, the keys of an object, and the child offsets and lengths as arrays of unsigned 64-bit integers.
+_Magic = b"JVPI"
+_FormatVersion: int = 1
+_Header = struct.Struct( "<4sHHqqQQQ" ) # Magic, version, depth, source size, source modification time (ns), root offset, root length, container count.
+_Count = struct.Struct( "<Q" )
+_Length = struct.Struct( "<I" )
+_ObjectKind: int = 1
+_ListKind: int = 0
+_KeyTag: int = 1
+_IndexTag: int = 0
+
+def _write_text( index_file: BinaryIO, text: str ) -> None:
+    data = text.encode( "utf-8" )
+
+    index_file.write( _Length.pack( len( data ) ) )
+    index_file.write( data )
+
+def _read_text( index_file: BinaryIO ) -> str:
+    length, = _Length.unpack( read_exactly( index_file, _Length.size ) )
+
+    return read_exactly( index_file, length ).decode( "utf-8" )
+
+def normalize_path( path: Union[ PathComponent, Iterable[ PathComponent ] ] ) -> Path:
+    """
+    Normalizes a path to a tuple of member keys and list indices; a single key or index is a path of one component.
+    """
+
+    if isinstance( path, ( str, int ) ):
+        path = ( path, )
+    else:
+        path = tuple( path )
+
+    for component in path:
+        if isinstance( component, bool ) or not isinstance( component, ( str, int ) ):
+            raise ValueError( f"Invalid path component '{ component }': it must be a member key string or a list index integer." )
+
+    return path
+
+class PathIndex( SourceIndex ):
+    """
+    Maps the paths of the values of a JSON document, down to a fixed depth, to their byte offsets and lengths, so a value can be read without scanning the document before it.
+
+    The index stores the children of each indexed object and list together: the member keys of an object and the offsets and lengths of the children as arrays of unsigned 64-bit integers, so an index of a large list costs 16 bytes per item in memory and on disk.
+
+    When an object has duplicate member keys, the path of the key addresses the last member, as when the document is loaded.
+    """
+
+    sidecar_suffix: str = ".jvpath"
+    index_kind: str = "path"
+
+    def __init__( self, root_span: Tuple[ int, int ], containers: Iterable[ ContainerSpans ], depth: int = 1, source_size: int = Unknown, source_mtime_ns: int = Unknown ):
+        super().__init__( source_size, source_mtime_ns )
+
+        self._root_span: Tuple[ int, int ] = tuple( root_span )
+        self._containers: Dict[ Path, ContainerSpans ] = { container.path: container for container in containers }
+        self._key_positions: Dict[ Path, Dict[ str, int ] ] = {}
+        self._depth: int = depth
+
+    @classmethod
+    def build( cls, input_source: Any, depth: int = 1 ) -> "PathIndex":
+        """
+        Builds the path index of a JSON document by scanning its structure; the values are not tokenized.
+
+        Parameters:
+            `input_source`: the path of the JSON file, a binary file object or a bytes-like object; files are memory-mapped when possible, so they are not read into memory.
+            `depth`: the depth of the deepest values indexed: 1 (the default) indexes the items of a root list or the members of a root object, 2 also indexes their children, and so on.
+
+        Returns:
+            The path index, recording the size and the modification time of the source file so a stale index can be detected.
+        """
+
+        source_size, source_mtime_ns = get_source_stat( input_source )
+
+        root_span, containers = scan_source( input_source, lambda data: scan_structure( data, depth ) )
+
+        return cls( root_span, containers, depth, source_size, source_mtime_ns )
+
+    @property
+    def depth( self ) -> int:
+        """
+        Gets the depth of the deepest indexed values.
+        """
+
+        return self._depth
+
+    @property
+    def root_span( self ) -> Tuple[ int, int ]:
+        """
+        Gets the `( offset, length )` span of the root value.
+        """
+
+        return self._root_span
+
+    def __len__( self ) -> int:
+        return sum( len( container ) for container in self._containers.values() )
+
+    def __contains__( self, path: Any ) -> bool:
+        try:
+            self.get_span( path )
+        except ( KeyError, ValueError ):
+            return False
+
+        return True
+
+    def paths( self ) -> Iterable[ Path ]:
+        """
+        Gets the indexed paths, excluding the root path `()`; the children of each container are in document order.
+        """
+
+        for container in self._containers.values():
+            if container.keys is not None:
+                for key in container.keys:
+                    yield container.path + ( key, )
+            else:
+                for index_ in range( len( container ) ):
+                    yield container.path + ( index_, )
+
+    def get_children( self, path: Union[ PathComponent, Iterable[ PathComponent ] ] = () ) -> ContainerSpans:
+        """
+        Gets the child spans of the indexed object or list at the path.
+
+        Raises:
+            `KeyError` if the children of the path are not indexed.
+        """
+
+        path = normalize_path( path )
+
+        container = self._containers.get( path, None )
+        if container is None:
+            raise KeyError( f"The children of path { list( path ) } are not indexed." )
+
+        return container
+
+    def get_span( self, path: Union[ PathComponent, Iterable[ PathComponent ] ] ) -> Tuple[ int, int ]:
+        """
+        Gets the `( offset, length )` byte span of the value at the path.
+
+        Parameters:
+            `path`: the member keys and list indices leading from the root value to the value; `()` is the root value.
+
+        Raises:
+            `KeyError` if the path is not in the index, because the value doesn't exist or is deeper than the indexed depth.
+        """
+
+        path = normalize_path( path )
+
+        if len( path ) == 0:
+            return self._root_span
+
+        parent_path = path[ :-1 ]
+        component = path[ -1 ]
+
+        container = self._containers.get( parent_path, None )
+        if container is None:
+            raise KeyError( f"Path { list( path ) } is not indexed." )
+
+        if container.keys is not None:
+            if not isinstance( component, str ):
+                raise KeyError( f"Path { list( path ) } is not indexed: the value at { list( parent_path ) } is an object." )
+
+            key_positions = self._key_positions.get( parent_path, None )
+            if key_positions is None:
+                # Built on first use, as most lookups address few objects; later duplicate keys replace earlier ones.
+                key_positions = { key: position for position, key in enumerate( container.keys ) }
+                self._key_positions[ parent_path ] = key_positions
+
+            position = key_positions.get( component, None )
+        elif isinstance( component, int ) and 0 <= component < len( container ):
+            position = component
+        else:
+            position = None
+
+        if position is None:
+            raise KeyError( f"Path { list( path ) } is not indexed." )
+
+        return container.offsets[ position ], container.lengths[ position ]
+
+    def save( self, index_path: str ) -> None:
+        """
+        Writes the index to a file in the compact binary path index format.
+        """
+
+        with open( index_path, "wb" ) as index_file:
+            index_file.write( _Header.pack( _Magic, _FormatVersion, self._depth, self._source_size, self._source_mtime_ns, self._root_span[ 0 ], self._root_span[ 1 ], len( self._containers ) ) )
+
+            for container in self._containers.values():
+                index_file.write( _Count.pack( len( container.path ) ) )
+
+                for component in container.path:
+                    if isinstance( component, str ):
+                        index_file.write( bytes( ( _KeyTag, ) ) )
+                        _write_text( index_file, component )
+                    else:
+                        index_file.write( bytes( ( _IndexTag, ) ) )
+                        index_file.write( _Count.pack( component ) )
+
+                index_file.write( bytes( ( _ObjectKind if container.keys is not None else _ListKind, ) ) )
+                index_file.write( _Count.pack( len( container ) ) )
+
+                if container.keys is not None:
+                    for key in container.keys:
+                        _write_text( index_file, key )
+
+                write_array( index_file, container.offsets )
+                write_array( index_file, container.lengths )
+
+    @classmethod
+    def load( cls, index_path: str ) -> "PathIndex":
+        """
+        Reads an index written by `save`.
+
+        Raises:
+            `ValueError` if the file is not a path index or is truncated.
+        """
+
+        with open( index_path, "rb" ) as index_file:
+            magic, version, depth, source_size, source_mtime_ns, root_offset, root_length, container_count = _Header.unpack( read_exactly( index_file, _Header.size ) )
+
+            if magic != _Magic:
+                raise ValueError( f"'{ index_path }' is not a path index file." )
+            elif version != _FormatVersion:
+                raise ValueError( f"Unsupported path index format version { version }." )
+
+            containers = []
+
+            for _ in range( container_count ):
+                component_count, = _Count.unpack( read_exactly( index_file, _Count.size ) )
+                path = []
+
+                for _ in range( component_count ):
+                    if read_exactly( index_file, 1 )[ 0 ] == _KeyTag:
+                        path.append( _read_text( index_file ) )
+                    else:
+                        path.append( _Count.unpack( read_exactly( index_file, _Count.size ) )[ 0 ] )
+
+                is_object = read_exactly( index_file, 1 )[ 0 ] == _ObjectKind
+                child_count, = _Count.unpack( read_exactly( index_file, _Count.size ) )
+                keys = [ _read_text( index_file ) for _ in range( child_count ) ] if is_object else None
+
+                containers.append( ContainerSpans( tuple( path ), keys, read_array( index_file, child_count ), read_array( index_file, child_count ) ) )
+
+        return cls( ( root_offset, root_length ), containers, depth, source_size, source_mtime_ns )
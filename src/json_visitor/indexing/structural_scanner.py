@@ -0,0 +1,256 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterator, List, Tuple, Union
+
+import json
+import re
+from array import array
+
+# A whole string, so the structural characters inside strings are skipped by the regular expression engine rather than byte by byte, or a structural character.
+_TokenPattern = re.compile( rb'"[^"\\]*(?:\\.[^"\\]*)*"|[][{},:]' )
+# Below the indexed depth only the nesting matters: everything up to the next bracket outside of a string is matched in one step.
+_NestingPattern = re.compile( rb'[^][{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^][{}"]*)*[][{}]' )
+_WhitespacePattern = re.compile( rb"[ \t\r\n]*" )
+
+_Whitespace = frozenset( b" \t\r\n" )
+_Quote: int = ord( '"' )
+_ObjectStart: int = ord( "{" )
+_ObjectEnd: int = ord( "}" )
+_ListStart: int = ord( "[" )
+_ListEnd: int = ord( "]" )
+_Colon: int = ord( ":" )
+
+PathComponent = Union[ str, int ]
+Path = Tuple[ PathComponent, ... ]
+
+class ContainerSpans( object ):
+    """
+    The byte spans of the children of an object or a list.
+
+    Attributes:
+        `path`: the path of the container from the root value.
+        `keys`: the member keys of an object, in document order; `None` for a list, whose children are addressed by their index.
+        `offsets`: the byte offset of each child value.
+        `lengths`: the byte length of each child value.
+    """
+
+    __slots__ = ( "path", "keys", "offsets", "lengths" )
+
+    def __init__( self, path: Path, keys: List[ str ] = None, offsets: array = None, lengths: array = None ):
+        self.path: Path = path
+        self.keys: List[ str ] = keys
+        self.offsets: array = offsets if offsets is not None else array( "Q" )
+        self.lengths: array = lengths if lengths is not None else array( "Q" )
+
+    @property
+    def is_object( self ) -> bool:
+        return self.keys is not None
+
+    def __len__( self ) -> int:
+        return len( self.offsets )
+
+class _Frame( object ):
+    __slots__ = ( "spans", "value_start", "key", "expects_key" )
+
+    def __init__( self, spans: ContainerSpans, value_start: int ):
+        self.spans: ContainerSpans = spans
+        self.value_start: int = value_start
+        self.key: str = None
+        self.expects_key: bool = spans.is_object
+
+def _decode_key( raw: bytes ) -> str:
+    if b"\\" in raw:
+        return json.loads( b'"' + raw + b'"' )
+    else:
+        return raw.decode( "utf-8" )
+
+def _add_child( data: Any, frame: _Frame, end: int ) -> None:
+    start = _WhitespacePattern.match( data, frame.value_start ).end()
+    while end > start and data[ end - 1 ] in _Whitespace:
+        end -= 1
+
+    if end > start: # An empty container has no child.
+        spans = frame.spans
+
+        if spans.keys is not None:
+            spans.keys.append( frame.key )
+            frame.key = None
+
+        spans.offsets.append( start )
+        spans.lengths.append( end - start )
+
+def scan_structure( data: Any, depth: int = 1 ) -> Tuple[ Tuple[ int, int ], List[ ContainerSpans ] ]:
+    """
+    Scans the structure of a JSON document at the byte level, without tokenizing its values, recording the byte span of every value down to the given depth.
+
+    The scan only checks the nesting of the document; a malformed value is not detected until the value is visited.
+
+    Parameters:
+        `data`: the bytes-like object holding the UTF-8 encoded document; a memory-mapped file can be scanned without reading it into memory.
+        `depth`: the depth of the deepest values recorded: 1 records the children of the root value, 2 also records the children of those children, and so on.
+
+    Returns:
+        The `( offset, length )` span of the root value and the child spans of every object and list whose children are recorded, the innermost containers first.
+    """
+
+    if depth < 1:
+        raise ValueError( f"Invalid depth { depth }: it must be at least 1." )
+
+    root_start = _WhitespacePattern.match( data, 0 ).end()
+    if root_start >= len( data ):
+        raise ValueError( "The document is empty." )
+
+    if data[ root_start ] not in ( _ObjectStart, _ListStart ):
+        # A scalar root value has no children.
+        end = len( data )
+        while end > root_start and data[ end - 1 ] in _Whitespace:
+            end -= 1
+
+        return ( root_start, end - root_start ), []
+
+    containers: List[ ContainerSpans ] = []
+    frames: List[ _Frame ] = []
+    skipped_depth: int = 0
+
+    search_token = _TokenPattern.search
+    match_nesting = _NestingPattern.match
+    position: int = root_start
+
+    while True:
+        if skipped_depth > 0:
+            match = match_nesting( data, position )
+            if match is None:
+                raise ValueError( "The document ends inside an object or a list." )
+
+            position = match.end()
+            character = data[ position - 1 ]
+
+            if character == _ObjectStart or character == _ListStart:
+                skipped_depth += 1
+            else:
+                skipped_depth -= 1
+
+            continue
+
+        match = search_token( data, position )
+        if match is None:
+            raise ValueError( "The document ends inside an object or a list." )
+
+        start = match.start()
+        position = match.end()
+        character = data[ start ]
+
+        if character == _Quote:
+            frame = frames[ -1 ]
+            if frame.expects_key:
+                frame.key = _decode_key( data[ start + 1:position - 1 ] )
+                frame.expects_key = False
+        elif character == _ObjectStart or character == _ListStart:
+            if len( frames ) < depth:
+                if len( frames ) == 0:
+                    path = ()
+                else:
+                    parent = frames[ -1 ]
+                    path = parent.spans.path + ( parent.key if parent.spans.is_object else len( parent.spans ), )
+
+                frames.append( _Frame( ContainerSpans( path, [] if character == _ObjectStart else None ), position ) )
+            else:
+                skipped_depth = 1
+        elif character == _Colon:
+            frames[ -1 ].value_start = position
+        else: # A separator or the end of a container.
+            frame = frames[ -1 ]
+            _add_child( data, frame, start )
+
+            if character == _ObjectEnd or character == _ListEnd:
+                if ( character == _ObjectEnd ) != frame.spans.is_object:
+                    raise ValueError( f"Mismatched '{ chr( character ) }' at byte offset { start }." )
+
+                containers.append( frame.spans )
+                frames.pop()
+
+                if len( frames ) == 0:
+                    return ( root_start, position - root_start ), containers
+            else:
+                frame.value_start = position
+                frame.expects_key = frame.spans.is_object
+
+# A string item, or a scalar item up to the next separator.
+_StringPattern = re.compile( rb'"[^"\\]*(?:\\.[^"\\]*)*"' )
+_ScalarPattern = re.compile( rb"[^,\]]*" )
+_Comma: int = ord( "," )
+
+def find_root_list( data: Any ) -> int:
+    """
+    Gets the byte position just after the opening bracket of a root list.
+
+    Raises:
+        `ValueError` if the root value is not a list.
+    """
+
+    root_start = _WhitespacePattern.match( data, 0 ).end()
+    if root_start >= len( data ) or data[ root_start ] != _ListStart:
+        raise ValueError( "The root value is not a list." )
+
+    return root_start + 1
+
+def iter_list_items( data: Any, position: int ) -> Iterator[ Tuple[ int, int, int ] ]:
+    """
+    Scans the items of a list lazily, from a position just after the opening bracket of the list or just after the separator following an item.
+
+    Parameters:
+        `data`: the bytes-like object holding the UTF-8 encoded document.
+        `position`: the byte position to scan from.
+
+    Returns:
+        Iterator of `( offset, length, next position )` tuples, one per item: the byte span of the item and the byte position just after the separator or the closing bracket following it.
+    """
+
+    match_nesting = _NestingPattern.match
+    match_whitespace = _WhitespacePattern.match
+
+    while True:
+        start = match_whitespace( data, position ).end()
+        if start >= len( data ):
+            raise ValueError( "The document ends inside a list." )
+
+        character = data[ start ]
+
+        if character == _ListEnd: # An empty list, or the end of the list after a separator, which the tokenizer rejects.
+            return
+        elif character == _ObjectStart or character == _ListStart:
+            end = start + 1
+            nesting = 1
+
+            while nesting > 0:
+                match = match_nesting( data, end )
+                if match is None:
+                    raise ValueError( "The document ends inside an object or a list." )
+
+                end = match.end()
+                nesting += 1 if data[ end - 1 ] in ( _ObjectStart, _ListStart ) else -1
+        elif character == _Quote:
+            match = _StringPattern.match( data, start )
+            if match is None:
+                raise ValueError( "The document ends inside a string." )
+
+            end = match.end()
+        else:
+            end = _ScalarPattern.match( data, start ).end()
+            while end > start and data[ end - 1 ] in _Whitespace:
+                end -= 1
+
+        position = match_whitespace( data, end ).end()
+        if position >= len( data ):
+            raise ValueError( "The document ends inside a list." )
+
+        separator = data[ position ]
+        position += 1
+
+        yield start, end - start, position
+
+        if separator != _Comma:
+            if separator != _ListEnd:
+                raise ValueError( f"Unexpected '{ chr( separator ) }' at byte offset { position - 1 }." )
+
+            return
@@ -1,36 +1,269 @@
 __version__ = r"1.0.0"
 
-from typing import Union, TextIO
+from typing import Any, BinaryIO, Iterable, List, TextIO, Union
 
 from .simple_adapters.base_adapter import BaseAdapter as SimpleBaseAdapter
+from .tokenizer.path_tracker import PathTracker
 from .tokenizer.scope_walker import ScopeWalker
+from .tokenizer.stage_statistics import StageStatistics
 from .tokenizer.token_processor import TokenProcessor
 
 class JsonVisitor( object ):
     """
     Implements a visitor for JSON nodes in a JSON object using the Visitor pattern.
     
+    Parameters:
+        `adapter`: the adapter the visitation events are published to.
+        `collect_statistics`: `True` to collect per-stage processing statistics for the visits which tokenize the input in this process (`visit`, `visit_documents`, `visit_path` and `visit_sampled`), available through `statistics`; `False` (the default) to skip the instrumentation entirely.
+        `use_float`: `True` to publish non-integer numbers as `float`, which is much faster to construct and smaller than `decimal.Decimal` but not exact; `False` (the default) to publish them as `decimal.Decimal`. Numbers outside of the `float` range are an error with `float`.
+        `number_mode`: `value` (the default) to publish numbers converted by the tokenizer, `lexeme` to publish them unconverted as `NumberLexeme` strings holding their original text, or `lazy` to publish them as `LazyNumber` objects converting their original text on first use. The `lexeme` and `lazy` modes use the ijson pure-Python tokenizer, which exposes the number text.
+        `key_intern_limit`: the maximum number of distinct member keys interned, so repeated keys are published as the same string object within and across documents; 0 disables the interning. The default is 4096.
+        `cache`: the `ResultCache` `visit` and `visit_documents` look an unchanged input up in, so it is not parsed again; `None` (the default) disables the caching. The statistics are only collected for the inputs which are processed.
+        `track_prefix`: `True` to maintain the ijson-style prefix of the current path in the path tracker, available to the adapters as `path_tracker.prefix`; `False` (the default) to skip it.
+
     Notes:
         - Visitor pattern: https://en.wikipedia.org/wiki/Visitor_pattern
     """
 
-    def __init__( self, adapter: SimpleBaseAdapter ):
+    def __init__( self, adapter: SimpleBaseAdapter, collect_statistics: bool = False, use_float: bool = False, number_mode: str = "value", key_intern_limit: int = 4096, cache: Any = None, track_prefix: bool = False ):
         if not isinstance( adapter, SimpleBaseAdapter ):
             raise ValueError( f"Adapter must be an instance of { SimpleBaseAdapter.__qualname__ }." )
         else:
             self._target_adapter: SimpleBaseAdapter = adapter
 
-        self._token_processor = TokenProcessor( ScopeWalker( self._target_adapter ) )
+        self._token_processor = TokenProcessor( ScopeWalker( self._target_adapter, track_prefix = track_prefix ), collect_statistics = collect_statistics, use_float = use_float, number_mode = number_mode, key_intern_limit = key_intern_limit )
+        self._cache: Any = cache
 
-    def visit( self, input_source: Union[ TextIO, str ] ) -> None:
+    @property
+    def path_tracker( self ) -> PathTracker:
+        """
+        Gets the path tracker of the walk, which tracks the path of the current value; it is also set on the adapter, as its `path_tracker`.
+        """
+
+        return self._token_processor._internal_scope_walker.path_tracker
+
+    @property
+    def statistics( self ) -> StageStatistics:
+        """
+        Gets the processing statistics of the last visit, broken down into the tokenizer, walker and adapter stages.
+
+        Returns:
+            The processing statistics of the last visit; `None` if the visitor was not created with `collect_statistics` enabled, nothing has been visited, or the last visit didn't tokenize its input in this process: a visit served from the cache, a checkpointed or resumed visit, or a parallel visit.
+        """
+
+        return self._token_processor.statistics
+
+    def visit( self, input_source: Union[ TextIO, BinaryIO, str, bytes ] ) -> None:
         """
         Walks the JSON input source.
 
         Parameters:
-            `input_source`: the JSON input source. The input source is expected to be a file-like object or a string.
+            `input_source`: the JSON input source. The input source is expected to be a file-like object, a string or UTF-8 encoded bytes.
+
+        Returns:
+            None
+        """
+
+        self._token_processor.reset_statistics()
+
+        if self._cache is not None:
+            self._cache.visit( self._token_processor, input_source )
+        else:
+            self._token_processor.process( input_source )
+
+    def visit_documents( self, input_source: Union[ TextIO, BinaryIO, str, bytes ], records: Iterable[ int ] = None, index: Any = None ) -> None:
+        """
+        Walks an input source containing a sequence of JSON documents, such as JSON Lines (NDJSON); each top-level value is visited as a separate document.
+
+        Parameters:
+            `input_source`: the JSON input source. The input source is expected to be a file-like object, a string or UTF-8 encoded bytes; when `records` is given, it must be the path of a JSON Lines file, a seekable binary file object or UTF-8 encoded bytes.
+            `records`: the numbers of the records to visit, counting the non-blank lines from 0: a `range`, such as a shard from `LineIndex.shard`, or ascending numbers, such as a sample from `LineIndex.sample`; each run of consecutive records is read as one byte span. `None` (the default) visits every document.
+            `index`: the `LineIndex` of the source, or the path of a line index file, used with `records`; if `None`, the sidecar index of the file is used when it is current, otherwise the lines are scanned first.
 
         Returns:
             None
+
+        Raises:
+            `IndexError` if a record number is outside of the records.
+            `ValueError` if the index is stale.
         """
 
-        self._token_processor.process( input_source )
+        self._token_processor.reset_statistics()
+
+        if records is None:
+            if self._cache is not None:
+                self._cache.visit( self._token_processor, input_source, documents = True )
+            else:
+                self._token_processor.process_documents( input_source )
+
+            return
+
+        from .indexing.index_io import SpanReader
+        from .indexing.line_index import LineIndex
+
+        index = LineIndex.for_source( input_source, index )
+        statistics: StageStatistics = None
+
+        for start, stop in index.get_runs( records ):
+            offset, length = index.get_span( start, stop )
+
+            with SpanReader( input_source, offset, length ) as reader:
+                self._token_processor.process_documents( reader )
+
+            # Each run is processed as an input of its own; the statistics of the visit are their sum.
+            if self._token_processor.statistics is not None:
+                if statistics is None:
+                    statistics = self._token_processor.statistics
+                else:
+                    statistics.add( self._token_processor.statistics )
+
+        self._token_processor._statistics = statistics
+
+    def visit_path( self, input_source: Union[ BinaryIO, str, bytes ], path: Union[ str, int, Iterable[ Union[ str, int ] ] ], index: Any = None ) -> None:
+        """
+        Walks the value at a path of a JSON document as a document of its own, reading only the bytes of the value.
+
+        Parameters:
+            `input_source`: the path of the JSON file, a seekable binary file object or UTF-8 encoded bytes; unlike `visit`, a string is a file path.
+            `path`: the member keys and list indices leading from the root value to the value, such as `( "items", 3 )`; a single key or index is a path of one component.
+            `index`: the `PathIndex` of the document, or the path of a path index file; if `None`, the sidecar index of the file is used when it is current, otherwise the document structure is scanned first.
+
+        Returns:
+            None
+
+        Raises:
+            `KeyError` if the path is not in the index.
+            `ValueError` if the index is stale.
+        """
+
+        from .indexing.index_io import SpanReader
+        from .indexing.path_index import PathIndex
+
+        self._token_processor.reset_statistics()
+
+        offset, length = PathIndex.for_source( input_source, index ).get_span( path )
+
+        with SpanReader( input_source, offset, length ) as reader:
+            self._token_processor.process( reader )
+
+    def visit_parallel( self, input_path: str, process_count: int = None, range_count: int = None, index: Any = None, mp_context = None ) -> None:
+        """
+        Walks the items of the root list of a JSON file in worker processes, so a single large list can use every CPU.
+
+        The byte spans of the items come from the path index of the file. The items are split into contiguous ranges of about the same size in bytes, and each range is visited in a worker process as a document holding a list of its items, by a copy of the adapter whose `set_item_index_offset` is called with the index of the first item of the range so the item indices are those of the whole list. The copies are merged back into the adapter in item order with its `merge`.
+
+        Parameters:
+            `input_path`: the path of the JSON file.
+            `process_count`: the number of worker processes; the default is the number of CPUs.
+            `range_count`: the number of item ranges; the default is 4 ranges per worker process.
+            `index`: the `PathIndex` of the file, or the path of a path index file; if `None`, the sidecar index of the file is used when it is current, otherwise the structure of the file is scanned first.
+            `mp_context`: the `multiprocessing` context the worker processes are created with.
+
+        Returns:
+            None
+
+        Raises:
+            `ValueError` if the root value is not a list or the index is stale.
+            `NotImplementedError` if the adapter doesn't support merging.
+
+        Notes:
+            - the adapter is copied as it is before the visit, so it should not hold the state of an earlier visit, and it must be picklable along with the state it accumulates.
+            - the document events, and the contextual events of the root list, are published once per range in the worker processes rather than once for the file.
+            - the statistics of the visitor are not collected for the worker processes.
+        """
+
+        from .parallel.parallel_visit import visit_parallel
+
+        token_processor = self._token_processor
+        visitor_options = { "use_float": token_processor._use_float, "number_mode": token_processor._number_mode, "key_intern_limit": token_processor._key_intern_limit, "track_prefix": self.path_tracker.tracks_prefix }
+
+        token_processor.reset_statistics()
+
+        visit_parallel( self._target_adapter, input_path, visitor_options, process_count, range_count, index, mp_context )
+
+    def visit_sampled( self, input_source: Union[ BinaryIO, str, bytes ], sampler: Any, documents: bool = False, index: Any = None ) -> List[ int ]:
+        """
+        Walks a sample of the documents of a file containing a sequence of JSON documents, such as JSON Lines, or of the items of the root list of a JSON document, for approximate analytics over inputs too large to visit in full.
+
+        The records are located at the byte level and the records which are not selected are skipped without being tokenized, so no events are published for them and the cost of the visit follows the sample size rather than the input size, apart from the structural scan of the records when their count is not known from an index. The selected documents are visited as a sequence of documents, and the selected list items as a document holding a list of them, in their order in the input.
+
+        Parameters:
+            `input_source`: the path of the file, a binary file object or UTF-8 encoded bytes; unlike `visit`, a string is a file path.
+            `sampler`: the `Sampler` selecting the records: an `EverySampler` for every Nth record, a `BernoulliSampler` for each record with a probability, or a `ReservoirSampler` for a uniform sample of a fixed size.
+            `documents`: `True` if the input contains a sequence of documents; `False` (the default) if it contains one document whose root value is a list.
+            `index`: the `LineIndex`, for documents, or the `PathIndex`, for list items, of the input, or the path of an index file; with an index only the selected records are read. If `None`, the sidecar index of the file is used when it is current, otherwise the records are scanned.
+
+        Returns:
+            The ascending numbers of the visited records: the record numbers of the documents, counting the non-blank lines from 0, or the indices of the list items, which the adapter sees renumbered from 0 in the list of the sample.
+
+        Raises:
+            `ValueError` if the root value of the document is not a list or the index is stale.
+
+        Notes:
+            - the visit bypasses the result cache of the visitor.
+        """
+
+        from .sampling.sampled_visit import visit_sampled
+
+        self._token_processor.reset_statistics()
+
+        return visit_sampled( self._token_processor, input_source, sampler, documents, index )
+
+    def visit_checkpointed( self, input_path: str, checkpoint_path: str, interval_seconds: float = 60.0, documents: bool = False ) -> None:
+        """
+        Walks a JSON file whose root value is a list, or a file containing a sequence of JSON documents such as JSON Lines, saving a checkpoint periodically so an interrupted visit can be continued with `resume`.
+
+        A checkpoint is saved at a safe boundary, between two items of the top-level list or between two documents, and holds the byte offset of the boundary, the scope walker's scope stack and the state snapshot of the adapter from its `get_state`. The checkpoint file is replaced by each checkpoint and removed when the visit completes.
+
+        Parameters:
+            `input_path`: the path of the JSON file.
+            `checkpoint_path`: the path of the checkpoint file.
+            `interval_seconds`: the minimum time between two checkpoints; the checkpoint is saved at the first boundary after the interval. The default is 60 seconds.
+            `documents`: `True` if the file contains a sequence of documents, each visited as a separate document; `False` (the default) if it contains one document whose root value is a list.
+
+        Returns:
+            None
+
+        Raises:
+            `ValueError` if the root value of the document is not a list.
+        """
+
+        from .checkpointing.checkpointed_visit import visit_checkpointed
+
+        self._token_processor.reset_statistics()
+
+        visit_checkpointed( self._token_processor, input_path, checkpoint_path, interval_seconds, "documents" if documents else "list_items" )
+
+    def resume( self, checkpoint: Any, checkpoint_path: str = None, interval_seconds: float = 60.0 ) -> None:
+        """
+        Continues a checkpointed visit from a checkpoint: the adapter state is restored with the adapter's `set_state` and the file is walked from the boundary of the checkpoint.
+
+        The visitor must be created with an adapter of the same configuration as the adapter of the interrupted visit.
+
+        Parameters:
+            `checkpoint`: the `Checkpoint`, or the path of the checkpoint file.
+            `checkpoint_path`: the path of the checkpoint file for the checkpoints of the resumed visit; the default is the path `checkpoint` was loaded from.
+            `interval_seconds`: the minimum time between two checkpoints. The default is 60 seconds.
+
+        Returns:
+            None
+
+        Raises:
+            `ValueError` if the file has changed since the checkpoint was saved.
+        """
+
+        from .checkpointing.checkpoint import Checkpoint
+        from .checkpointing.checkpointed_visit import visit_checkpointed
+
+        if not isinstance( checkpoint, Checkpoint ):
+            if checkpoint_path is None:
+                checkpoint_path = checkpoint
+
+            checkpoint = Checkpoint.load( checkpoint )
+        elif checkpoint_path is None:
+            raise ValueError( "The checkpoint path is required to resume from a checkpoint object." )
+
+        self._token_processor.reset_statistics()
+
+        visit_checkpointed( self._token_processor, checkpoint.source_path, checkpoint_path, interval_seconds, checkpoint.mode, checkpoint )
+
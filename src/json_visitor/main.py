@@ -1,50 +1,387 @@
 __version__ = r"1.0.0"
 
-from typing import Any, Dict, Iterable, Union
+from typing import Any, Dict, Iterable, List, TextIO
 
 import os
 import sys
-from argparse import ArgumentParser, FileType, Namespace
-from pathlib import Path
+import time
+from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from . import __name__ as PackageName
-from .contextual_adapters.composite_adapter import CompositeAdapter
-from .contextual_adapters.inspector_adapter import InspectionAdapter
-from .subscription.contextual_subscription import ContextualSubscription
-from .json_visitor import JsonVisitor
 
-class _ExpandedFileType( FileType ):
-    def __init__( self, **kwargs: Dict[ str, Any ] ):
-        mode = kwargs.get( "mode", "r" )
-        bufsize = kwargs.get( "bufsize", -1 )
-        encoding = kwargs.get( "encoding", None )
-        errors = kwargs.get( "errors", None )
+# The CLI is started many times on small inputs, so modules only some modes need are imported where they are used: the adapters and the visitor when an input is processed, `concurrent.futures` with --jobs, `glob` for patterns and `resource` for --stats.
 
-        super().__init__( mode, bufsize, encoding, errors )
+class _InputFile:
+    """
+    The path of an input file; distinguishes file inputs from `-s` string literals in the shared `inputs` list.
+    """
+
+    def __init__( self, path: str ):
+        self.path: str = path
+
+    def __str__( self ):
+        return self.path
 
-        relative_path = kwargs.get( "relative_path", None )
+class _ExpandedPathType:
+    """
+    Expands a `-f` argument into the input files: `-` is standard input, `@<file path>` reads one path per line (blank lines and lines starting with `#` are skipped; relative paths are relative to the list file), a directory expands to the `*.json` files below it and a pattern with `*`, `?` or `[` expands to the matching paths. The paths are sorted within each expansion.
+    """
+
+    def __init__( self, relative_path: str = None ):
         if relative_path is None:
             relative_path: str = os.getcwd()
-        if isinstance( relative_path, str ):
-            relative_path: Path = Path( relative_path )
-        self._relative_path: Path = relative_path
+        self._relative_path: str = os.fspath( relative_path )
+
+    def __call__( self, string: str ) -> "_InputFiles":
+        return _InputFiles( _InputFile( path ) for path in self._expand( string, self._relative_path ) )
+
+    def _expand( self, string: str, relative_path: str ) -> List[ str ]:
+        if string == "-":
+            return [ string ]
+
+        if string.startswith( "@" ):
+            list_path = os.path.join( relative_path, string[ 1: ] )
+            try:
+                with open( list_path, "r" ) as list_file:
+                    lines = [ line.strip() for line in list_file ]
+            except OSError as e:
+                raise ArgumentTypeError( f"can't read file list '{ list_path }': { e }" )
+
+            paths: List[ str ] = []
+            for line in lines:
+                if line and not line.startswith( "#" ):
+                    paths.extend( self._expand( line, os.path.dirname( os.path.abspath( list_path ) ) ) )
+
+            return paths
+
+        path = os.path.join( relative_path, string )
+
+        if any( character in string for character in "*?[" ):
+            import glob
+
+            paths = sorted( match for match in glob.glob( path, recursive = True ) if os.path.isfile( match ) )
+            if len( paths ) == 0:
+                raise ArgumentTypeError( f"no files match '{ path }'" )
 
-    def __call__( self, string ):
-        if string != "-" and not os.path.isabs( string ):
-            string = self._relative_path.joinpath( string ).resolve( True )
+            return paths
+        elif os.path.isdir( path ):
+            paths = []
+            for directory, directory_names, file_names in os.walk( path ):
+                directory_names.sort()
+                paths.extend( os.path.join( directory, name ) for name in sorted( file_names ) if name.endswith( ".json" ) )
 
-        return super().__call__( string )
+            return paths
+        elif os.path.isfile( path ):
+            return [ os.path.abspath( path ) ]
+        else:
+            raise ArgumentTypeError( f"can't open '{ path }': no such file or directory" )
 
     def __repr__( self ):
-        # Adapted from: argparse.py's FileType.__repr__ implementation
+        return f"{ type( self ).__name__ }(relative_path={ self._relative_path !r})"
 
-        args = tuple()
-        kwargs = [( 'mode', self._mode ), ( 'bufsize', self._bufsize ), ( 'encoding', self._encoding ), ( 'errors', self._errors ), ( 'relative_path', self._relative_path )]
-        args_str = ', '.join( [repr( arg ) for arg in args if arg != -1] +
-                             ['%s=%r' % ( kw, arg ) for kw, arg in kwargs
-                              if arg is not None] )
-        return '%s(%s)' % ( type( self ).__name__, args_str )
+class _InputFiles( list ):
+    """
+    The input files a `-f` argument expanded to.
+    """
+
+_ProcessEventCounter: type = None
+
+def _create_process_event_counter() -> Any:
+    """
+    Creates an adapter counting the scope events processed, like a `ContextualSubscription` callback registered for `default_process`, without the subscription overhead.
+
+    The adapter class derives from the contextual `BaseAdapter`, which loads the scoping modules, so it is defined on first use rather than when the CLI starts.
+    """
+
+    global _ProcessEventCounter
 
-def _build_argument_parser( file_relative_path: Union[ Path, str ] = None ):
+    if _ProcessEventCounter is None:
+        from .contextual_adapters.base_adapter import BaseAdapter as ContextualBaseAdapter
+
+        class ProcessEventCounter( ContextualBaseAdapter ):
+            def __init__( self ):
+                super().__init__()
+
+                self.count: int = 0
+
+            def default_process( self, *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
+                self.count += 1
+
+        _ProcessEventCounter = ProcessEventCounter
+
+    return _ProcessEventCounter()
+
+def _get_peak_rss() -> int:
+    """
+    Gets the peak resident set size of the process in bytes, or `None` if it is not available on the platform.
+    """
+
+    try:
+        import resource
+    except ImportError: # Not available on Windows.
+        return None
+    else:
+        peak_rss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+
+        # Linux reports kilobytes, macOS reports bytes.
+        return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+def _get_input_name( input_: Any ) -> str:
+    if isinstance( input_, str ):
+        return f"<string of { len( input_ ) } characters>"
+    elif isinstance( input_, _InputFile ):
+        return input_.path
+    else:
+        return getattr( input_, "name", repr( input_ ) )
+
+class _InputResult:
+    """
+    The outcome of processing one input, sent back from the worker processes when processing in parallel.
+    """
+
+    def __init__( self, name: str, error_code: int = 0, scope_event_count: int = 0, elapsed_ns: float = 0, bytes_consumed: int = None ):
+        self.name: str = name
+        self.error_code: int = error_code
+        self.scope_event_count: int = scope_event_count
+        self.elapsed_ns: float = elapsed_ns
+        self.bytes_consumed: int = bytes_consumed
+        self.output: str = None
+        self.error_output: str = None
+        self.event_output: str = None
+
+def _report_statistics( input_: Any, processed_args: Namespace ) -> _InputResult:
+    """
+    Processes the input without inspection output, `processed_args.repeat` times, and prints the throughput statistics.
+
+    Returns:
+        The result; its error code is 0 if no error occurred, 2 otherwise.
+    """
+
+    repeat: int = max( processed_args.repeat, 1 )
+    input_name: str = _get_input_name( input_ )
+
+    if not isinstance( input_, str ) and repeat > 1:
+        if input_.seekable():
+            start_position = input_.tell()
+        else:
+            input_ = input_.read()
+
+    from .json_visitor import JsonVisitor
+    from .simple_adapters.profiling_composite_adapter import ProfilingCompositeAdapter
+    from .tokenizer.stage_statistics import StageStatistics
+
+    runs: List[ StageStatistics ] = []
+    scope_event_count: int = 0
+
+    for run_index in range( repeat + 1 if repeat > 1 else 1 ):
+        if not isinstance( input_, str ) and run_index > 0:
+            input_.seek( start_position )
+
+        counter = _create_process_event_counter()
+        if processed_args.profile_format is not None:
+            adapter = ProfilingCompositeAdapter( counter, sample_interval = processed_args.profile_sample_interval )
+        else:
+            adapter = counter
+
+        visitor = JsonVisitor( adapter, collect_statistics = True, use_float = processed_args.use_float, number_mode = processed_args.number_mode )
+
+        try:
+            visitor.visit( input_ )
+        except Exception as e:
+            print( f"Error executing commands from '{ input_name }': { e }", file = sys.stderr )
+            return _InputResult( input_name, error_code = 2 )
+
+        # With more than one repetition, the first run is a warm-up run and is excluded from the averages.
+        if repeat == 1 or run_index > 0:
+            runs.append( visitor.statistics )
+            scope_event_count = counter.count
+
+    elapsed_ns: float = sum( statistics.total_ns for statistics in runs ) / len( runs )
+    statistics = runs[ -1 ]
+    elapsed_seconds = elapsed_ns / 1e9
+
+    def rate( amount: float ) -> float:
+        return amount / elapsed_seconds if elapsed_seconds > 0 else 0.0
+
+    peak_rss = _get_peak_rss()
+
+    print( f"Input: { input_name }" )
+    print( f"  Bytes read: { statistics.bytes_consumed }" )
+    print( f"  Tokens: { statistics.token_count }" )
+    print( f"  Scope events: { scope_event_count }" )
+    print( f"  Elapsed: { elapsed_ns / 1e6:.3f} ms{ f' (mean of { len( runs ) } runs after a warm-up run)' if len( runs ) > 1 else '' }" )
+    print( f"  Throughput: { rate( statistics.bytes_consumed / 1e6 ):.3f} MB/s, { rate( statistics.token_count ):.0f} tokens/s, { rate( scope_event_count ):.0f} scope events/s" )
+    print( f"  Stages: tokenizer { statistics.tokenizer_ns * 100 / statistics.total_ns if statistics.total_ns > 0 else 0.0:.1f}%, walker { statistics.walker_ns * 100 / statistics.total_ns if statistics.total_ns > 0 else 0.0:.1f}%, adapters { statistics.adapter_ns * 100 / statistics.total_ns if statistics.total_ns > 0 else 0.0:.1f}%" )
+    print( f"  Peak RSS: { f'{ peak_rss } bytes' if peak_rss is not None else 'unavailable' }" )
+
+    if processed_args.profile_format == "json":
+        print( adapter.format_report_json(), file = sys.stderr )
+    elif processed_args.profile_format == "table":
+        print( adapter.format_report_table(), file = sys.stderr )
+
+    return _InputResult( input_name, scope_event_count = scope_event_count, elapsed_ns = elapsed_ns, bytes_consumed = statistics.bytes_consumed )
+
+def _inspect_input( input_: Any, processed_args: Namespace, event_sink: TextIO = None ) -> _InputResult:
+    """
+    Processes the input and writes the visitation events to the event sink, or to standard output if it is `None`.
+
+    Returns:
+        The result; its error code is 0 if no error occurred, 2 otherwise.
+    """
+
+    from .contextual_adapters.composite_adapter import CompositeAdapter
+    from .contextual_adapters.inspector_adapter import InspectionAdapter
+    from .json_visitor import JsonVisitor
+    from .simple_adapters.profiling_composite_adapter import ProfilingCompositeAdapter
+
+    input_name: str = _get_input_name( input_ )
+    counter = _create_process_event_counter()
+
+    inspection_adapter = InspectionAdapter( event_sink, processed_args.output_format, processed_args.max_value_length )
+    adapters = [
+        inspection_adapter,
+        counter,
+    ]
+
+    if processed_args.profile_format is not None:
+        adapter = ProfilingCompositeAdapter( *adapters, sample_interval = processed_args.profile_sample_interval )
+    else:
+        adapter = CompositeAdapter( *adapters )
+
+    cache = None
+    if processed_args.cache_dir is not None:
+        from .caching.result_cache import ResultCache
+
+        cache = ResultCache( processed_args.cache_dir, max_bytes = processed_args.cache_max_bytes )
+
+    start = time.perf_counter_ns()
+
+    try:
+        JsonVisitor( adapter, use_float = processed_args.use_float, number_mode = processed_args.number_mode, cache = cache ).visit( input_ )
+    except Exception as e:
+        # Writes the events buffered before the error.
+        inspection_adapter.flush()
+
+        print( f"Error executing commands from '{ input_name }': { e }", file = sys.stderr )
+        error_code = 2
+    else:
+        error_code = 0
+
+    elapsed_ns = time.perf_counter_ns() - start
+
+    if processed_args.info_enabled:
+        print( f"Number of scope events processed: { counter.count }" )
+
+    if processed_args.profile_format == "json":
+        print( adapter.format_report_json(), file = sys.stderr )
+    elif processed_args.profile_format == "table":
+        print( adapter.format_report_table(), file = sys.stderr )
+
+    return _InputResult( input_name, error_code = error_code, scope_event_count = counter.count, elapsed_ns = elapsed_ns )
+
+def _process_input( input_: Any, processed_args: Namespace, capture_output: bool = False, event_sink: TextIO = None ) -> _InputResult:
+    """
+    Processes a string literal, an input file path or an open input file.
+
+    Parameters:
+        `input_`: the string literal, input file path or file.
+        `processed_args`: the parsed command line arguments.
+        `capture_output`: `True` to capture the standard output, the standard error and, if an output path was given, the visitation events into the result instead of writing them, `False` otherwise.
+        `event_sink`: the text stream the visitation events are written to, or `None` to write them to standard output.
+
+    Returns:
+        The result of processing the input.
+    """
+
+    if capture_output:
+        from contextlib import redirect_stderr, redirect_stdout
+        from io import StringIO
+
+        output, error_output = StringIO(), StringIO()
+        event_output = StringIO() if processed_args.output_path is not None else None
+
+        with redirect_stdout( output ), redirect_stderr( error_output ):
+            result = _process_input( input_, processed_args, event_sink = event_output )
+
+        result.output = output.getvalue()
+        result.error_output = error_output.getvalue()
+        if event_output is not None:
+            result.event_output = event_output.getvalue()
+
+        return result
+
+    if isinstance( input_, _InputFile ):
+        try:
+            input_file = open( input_.path, "rb" )
+        except OSError as e:
+            print( f"Error opening '{ input_.path }': { e }", file = sys.stderr )
+            return _InputResult( input_.path, error_code = 2 )
+
+        with input_file:
+            return _process_input( input_file, processed_args, event_sink = event_sink )
+
+    if processed_args.stats_enabled:
+        return _report_statistics( input_, processed_args )
+    else:
+        return _inspect_input( input_, processed_args, event_sink )
+
+def _process_inputs( inputs: List[ Any ], processed_args: Namespace, event_sink: TextIO = None ) -> Iterable[ _InputResult ]:
+    """
+    Processes the inputs, in a process pool when `processed_args.jobs` is greater than 1, and yields their results in input order.
+
+    When processing in parallel, the output of each input is captured in its worker process and written as its result is yielded, so the output of different inputs is not interleaved.
+    """
+
+    jobs: int = processed_args.jobs if processed_args.jobs > 0 else ( os.cpu_count() or 1 )
+
+    # The statistics report names its input itself.
+    print_names: bool = processed_args.info_enabled and not processed_args.stats_enabled and len( inputs ) > 1
+
+    if jobs == 1 or len( inputs ) < 2:
+        for input_ in inputs:
+            if print_names:
+                print( f"Input: { _get_input_name( input_ ) }" )
+
+            yield _process_input( input_, processed_args, event_sink = event_sink )
+
+        return
+
+    # The worker processes can't share standard input, so it is read up front, and the input list isn't sent with each input.
+    inputs = [ sys.stdin.read() if input_ is sys.stdin else input_ for input_ in inputs ]
+    worker_args = Namespace( **vars( processed_args ) )
+    worker_args.inputs = None
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor( max_workers = min( jobs, len( inputs ) ) ) as executor:
+        # Small chunks keep the ordered output flowing while amortizing the inter-process overhead over thousands of small files.
+        chunk_size = max( 1, len( inputs ) // ( jobs * 16 ) )
+
+        for result in executor.map( _process_input, inputs, [ worker_args ] * len( inputs ), [ True ] * len( inputs ), chunksize = chunk_size ):
+            if print_names:
+                print( f"Input: { result.name }" )
+
+            sys.stdout.write( result.output )
+            sys.stdout.flush()
+            sys.stderr.write( result.error_output )
+            sys.stderr.flush()
+            if result.event_output is not None:
+                event_sink.write( result.event_output )
+
+            yield result
+
+def _report_totals( results: List[ _InputResult ], elapsed_ns: float, processed_args: Namespace ) -> None:
+    failed_names = [ result.name for result in results if result.error_code != 0 ]
+    bytes_consumed = sum( result.bytes_consumed for result in results if result.bytes_consumed is not None )
+
+    print( f"Inputs processed: { len( results ) } ({ len( failed_names ) } failed)" )
+    for name in failed_names:
+        print( f"  Failed: { name }" )
+    print( f"Total scope events processed: { sum( result.scope_event_count for result in results ) }" )
+    if processed_args.stats_enabled:
+        print( f"Total bytes read: { bytes_consumed }" )
+    print( f"Total processing time: { sum( result.elapsed_ns for result in results ) / 1e6:.3f} ms; elapsed: { elapsed_ns / 1e6:.3f} ms" )
+
+def _build_argument_parser( file_relative_path: str = None ):
     parser: ArgumentParser = ArgumentParser( description = "Processes the input JSON strings or files and outputs the visitation events.", prog = PackageName )
 
     info_parser = parser.add_mutually_exclusive_group( required = False )
@@ -52,7 +389,23 @@ def _build_argument_parser( file_relative_path: Union[ Path, str ] = None ):
     info_parser.add_argument( "-I", "--suppress-processing-info", dest = "info_enabled", action = "store_false", help = "Suppresses the output of the processing information." )
     info_parser.set_defaults( info_enabled = True )
 
-    parser.add_argument( "-f", "--file", type = _ExpandedFileType( mode = "r", relative_path = file_relative_path ), dest = "inputs", nargs = 1, action = "extend", help = "JSON file path to process; relative paths are relative to the current working directory.", metavar = "<file path>" )
+    parser.add_argument( "--stats", dest = "stats_enabled", action = "store_true", help = "Skips the inspection output and reports the bytes read, tokens, scope events, elapsed time, throughput and peak RSS of each input." )
+    parser.add_argument( "--repeat", type = int, default = 1, help = "Processes each input N times in statistics mode; when N is greater than 1 an additional warm-up run precedes the N runs, which are averaged. The default is 1.", metavar = "N" )
+    parser.add_argument( "--profile", dest = "profile_format", nargs = "?", const = "table", choices = [ "table", "json" ], default = None, help = "Profiles the time spent in each adapter event handler and writes the report to standard error, as a text table (the default) or JSON." )
+    parser.add_argument( "--profile-sample-interval", dest = "profile_sample_interval", type = int, default = 1, help = "Times only every Nth event when profiling, to reduce the profiling overhead. The default is 1.", metavar = "N" )
+
+    parser.add_argument( "--use-float", dest = "use_float", action = "store_true", help = "Parses non-integer numbers as floats rather than exact decimals, which is faster." )
+    parser.add_argument( "--numbers", dest = "number_mode", choices = [ "value", "lexeme", "lazy" ], default = "value", help = "Publishes numbers converted (the default), as their original text, or as lazy numbers converting their original text on first use." )
+    parser.add_argument( "--output-format", dest = "output_format", choices = [ "text", "ndjson" ], default = "text", help = "Format of the visitation events: text lines (the default) or one compact JSON object per line." )
+    parser.add_argument( "--max-value-length", dest = "max_value_length", type = int, default = None, help = "Truncates each value in the visitation events to N characters. Values are not truncated by default.", metavar = "N" )
+    parser.add_argument( "-o", "--output", dest = "output_path", default = None, help = "Writes the visitation events to the given path instead of standard output.", metavar = "<file path>" )
+
+    parser.add_argument( "--cache-dir", dest = "cache_dir", default = None, help = "Caches the visitation events of each input in the given directory, keyed by the hash of the input content, and replays them instead of parsing an unchanged input again. Not used with --stats.", metavar = "<directory path>" )
+    parser.add_argument( "--cache-max-bytes", dest = "cache_max_bytes", type = int, default = None, help = "Evicts the least recently used cache entries when the cache exceeds N bytes. The cache size is not limited by default.", metavar = "N" )
+
+    parser.add_argument( "-j", "--jobs", type = int, default = 1, help = "Processes the inputs in a pool of N processes; the output of each input is still written in input order. 0 uses one process per CPU. The default is 1.", metavar = "N" )
+
+    parser.add_argument( "-f", "--file", type = _ExpandedPathType( relative_path = file_relative_path ), dest = "inputs", nargs = 1, action = "extend", help = "JSON file path to process, '-' for standard input, a directory to process the *.json files below it, a glob pattern, or @<file path> to read one path per line; relative paths are relative to the current working directory.", metavar = "<file path>" )
     parser.add_argument( "-s", "--string", type = str, dest = "inputs", nargs = 1, action = "extend", help = "JSON string literal to process.", metavar = "<string literal>" )
 
     return parser
@@ -78,35 +431,31 @@ def main( args = None ) -> int:
     processed_args: Namespace = arg_parser.parse_args( args )
     inputs = processed_args.inputs
 
-    if inputs is None or len( inputs ) == 0:
+    # A directory without JSON files or an empty file list expands to no inputs.
+    expanded_inputs: List[ Any ] = []
+    for input_ in inputs or ():
+        if isinstance( input_, _InputFiles ):
+            expanded_inputs.extend( sys.stdin if input_file.path == "-" else input_file for input_file in input_ )
+        else:
+            expanded_inputs.append( input_ )
+
+    if len( expanded_inputs ) == 0:
         print( f"No input provided.", file = sys.stderr )
         error_code = 1
     else:
-        for input_ in inputs:
-            subscription: ContextualSubscription = ContextualSubscription()
+        event_sink = open( processed_args.output_path, "w", encoding = "utf-8", buffering = 1 << 20 ) if processed_args.output_path is not None else None
 
-            count: int = 0
+        try:
+            start = time.perf_counter_ns()
+            results: List[ _InputResult ] = list( _process_inputs( expanded_inputs, processed_args, event_sink ) )
+            elapsed_ns = time.perf_counter_ns() - start
+        finally:
+            if event_sink is not None:
+                event_sink.close()
 
-            def increment_count( *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
-                nonlocal count
-                count += 1
+        if processed_args.info_enabled and len( results ) > 1:
+            _report_totals( results, elapsed_ns, processed_args )
 
-            subscription.register( "default_process", increment_count )
-
-            adapters = [
-                InspectionAdapter(),
-                subscription,
-            ]
-
-            try:
-                JsonVisitor( CompositeAdapter( *adapters ) ).visit( input_ )
-            except Exception as e:
-                print( f"Error executing commands from '{ input_ }': { e }", file = sys.stderr )
-                error_code = 2
-            else:
-                error_code = 0
-
-            if processed_args.info_enabled:
-                print( f"Number of scope events processed: { count }" )
+        error_code = max( result.error_code for result in results )
 
     return error_code
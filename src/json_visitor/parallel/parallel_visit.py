@@ -0,0 +1,138 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, List, Tuple
+
+import os
+import pickle
+import multiprocessing
+from array import array
+from bisect import bisect_left
+from ..indexing.index_io import FramedReader, SpanReader
+from ..indexing.path_index import PathIndex
+from ..simple_adapters.base_adapter import BaseAdapter
+
+# A range of list items: the index of its first item, its item count, and the byte offset and length spanning its items and the separators between them.
+ItemRange = Tuple[ int, int, int, int ]
+
+def plan_ranges( offsets: array, lengths: array, range_count: int ) -> List[ ItemRange ]:
+    """
+    Splits the items of a list into contiguous ranges of about the same size in bytes.
+
+    Parameters:
+        `offsets`: the byte offsets of the items.
+        `lengths`: the byte lengths of the items.
+        `range_count`: the number of ranges; fewer ranges are returned if there are fewer items.
+
+    Returns:
+        List of non-empty `( first item index, item count, byte offset, byte length )` ranges covering all items in order.
+    """
+
+    if range_count < 1:
+        raise ValueError( f"Invalid range count { range_count }: it must be at least 1." )
+
+    item_count = len( offsets )
+    if item_count == 0:
+        return []
+
+    first_offset = offsets[ 0 ]
+    total_size = offsets[ -1 ] + lengths[ -1 ] - first_offset
+
+    ranges: List[ ItemRange ] = []
+    start = 0
+
+    for range_index in range( 1, range_count + 1 ):
+        if range_index < range_count:
+            # The range ends at the first item starting at or after its share of the bytes.
+            stop = bisect_left( offsets, first_offset + total_size * range_index // range_count, start + 1, item_count )
+        else:
+            stop = item_count
+
+        if stop > start:
+            offset = offsets[ start ]
+            ranges.append( ( start, stop - start, offset, offsets[ stop - 1 ] + lengths[ stop - 1 ] - offset ) )
+            start = stop
+
+    return ranges
+
+# The state of a worker process, set by its initializer.
+_WorkerSourcePath: str = None
+_WorkerAdapterData: bytes = None
+_WorkerVisitorOptions: Dict[ str, Any ] = None
+
+def _initialize_worker( source_path: str, adapter_data: bytes, visitor_options: Dict[ str, Any ] ) -> None:
+    global _WorkerSourcePath, _WorkerAdapterData, _WorkerVisitorOptions
+
+    _WorkerSourcePath = source_path
+    _WorkerAdapterData = adapter_data
+    _WorkerVisitorOptions = visitor_options
+
+def _visit_range( item_range: ItemRange ) -> BaseAdapter:
+    """
+    Worker process entry point: visits a range of list items as a list, with a fresh copy of the adapter whose item indices start at the index of the first item of the range.
+    """
+
+    from ..json_visitor import JsonVisitor
+
+    first_item_index, _, offset, length = item_range
+
+    adapter: BaseAdapter = pickle.loads( _WorkerAdapterData )
+    adapter.set_item_index_offset( first_item_index )
+
+    visitor = JsonVisitor( adapter, **_WorkerVisitorOptions )
+    visitor.path_tracker.set_item_index_offset( first_item_index )
+
+    with open( _WorkerSourcePath, "rb" ) as source_file:
+        visitor.visit( FramedReader( b"[", SpanReader( source_file, offset, length ), b"]" ) )
+
+    return adapter
+
+def visit_parallel( adapter: BaseAdapter, source_path: str, visitor_options: Dict[ str, Any ], process_count: int = None, range_count: int = None, index: Any = None, mp_context = None ) -> List[ ItemRange ]:
+    """
+    Visits the items of the root list of a JSON file in worker processes and merges the partial results into the adapter.
+
+    Parameters:
+        `adapter`: the adapter; a copy of it is sent to each range, and the copies are merged back into it in item order with its `merge`.
+        `source_path`: the path of the JSON file.
+        `visitor_options`: the keyword arguments of the `JsonVisitor` of each range.
+        `process_count`: the number of worker processes; the default is the number of CPUs.
+        `range_count`: the number of item ranges; the default is 4 ranges per worker process, so a range of slow items doesn't leave the other processes idle.
+        `index`: the `PathIndex` of the file, or the path of a path index file, holding the byte spans of the items; if `None`, the sidecar index of the file is used when it is current, otherwise the structure of the file is scanned first.
+        `mp_context`: the `multiprocessing` context the worker processes are created with.
+
+    Returns:
+        The visited item ranges.
+
+    Raises:
+        `ValueError` if the root value is not a list or the index is stale.
+    """
+
+    if process_count is None:
+        process_count = os.cpu_count() or 1
+    if process_count < 1:
+        raise ValueError( "Process count must be at least 1." )
+    if range_count is None:
+        range_count = process_count * 4
+
+    source_path = os.path.abspath( source_path )
+
+    try:
+        items = PathIndex.for_source( source_path, index ).get_children( () )
+    except KeyError:
+        items = None # A scalar root value has no children.
+
+    if items is None or items.is_object:
+        raise ValueError( "The root value is not a list." )
+
+    ranges = plan_ranges( items.offsets, items.lengths, range_count )
+    if len( ranges ) == 0:
+        return ranges
+
+    context = mp_context if mp_context is not None else multiprocessing.get_context()
+    initializer_arguments = ( source_path, pickle.dumps( adapter ), visitor_options )
+
+    with context.Pool( min( process_count, len( ranges ) ), _initialize_worker, initializer_arguments ) as pool:
+        # The partial adapters arrive in item order and are merged as they arrive, so at most a few of them are held at once.
+        for partial_adapter in pool.imap( _visit_range, ranges ):
+            adapter.merge( partial_adapter )
+
+    return ranges
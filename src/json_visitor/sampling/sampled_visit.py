@@ -0,0 +1,146 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterator, List, Tuple
+
+from itertools import chain
+
+from .samplers import Sampler
+from ..indexing.index_io import scan_source
+from ..indexing.line_index import LineIndex, iter_record_spans
+from ..indexing.path_index import PathIndex
+from ..indexing.structural_scanner import find_root_list, iter_list_items
+from ..tokenizer.token_processor import TokenProcessor
+
+class _SampleReader( object ):
+    """
+    A binary file-like object reading the byte spans of the selected records of a source, joined by a separator and framed by a prefix and a suffix, so the sample is tokenized as one stream and the bytes of the other records are never read.
+
+    The spans are consumed lazily, as the tokenizer reads, so the records selected from a stream are read as they are selected.
+    """
+
+    def __init__( self, data: Any, spans: Iterator[ Tuple[ int, int ] ], separator: bytes, prefix: bytes = b"", suffix: bytes = b"" ):
+        self._data: Any = data
+        self._spans: Iterator[ Tuple[ int, int ] ] = spans
+        self._separator: bytes = separator
+        self._pending: bytes = prefix
+        self._suffix: bytes = suffix
+        self._is_first: bool = True
+
+    def read( self, size: int = -1 ) -> bytes:
+        if size == 0: # The tokenizer reads 0 bytes to detect a binary file.
+            return b""
+
+        parts: List[ bytes ] = [ self._pending ]
+        length = len( self._pending )
+
+        while ( size < 0 or length < size ) and self._spans is not None:
+            span = next( self._spans, None )
+
+            if span is None:
+                self._spans = None
+                parts.append( self._suffix )
+                length += len( self._suffix )
+            else:
+                offset, span_length = span
+
+                if self._is_first:
+                    self._is_first = False
+                else:
+                    parts.append( self._separator )
+                    length += len( self._separator )
+
+                parts.append( bytes( self._data[ offset:offset + span_length ] ) )
+                length += span_length
+
+        data = b"".join( parts )
+        if size < 0:
+            self._pending = b""
+            return data
+
+        self._pending = data[ size: ]
+
+        return data[ :size ]
+
+def _select_spans( sampler: Sampler, numbers: List[ int ], spans: Iterator[ Tuple[ int, int ] ] ) -> Iterator[ Tuple[ int, int ] ]:
+    """
+    Selects the spans of a stream of records, recording the numbers of the selected records.
+    """
+
+    for number, span in sampler.select_stream( enumerate( spans ) ):
+        numbers.append( number )
+        yield span
+
+def _iter_item_spans( data: Any ) -> Iterator[ Tuple[ int, int ] ]:
+    for offset, length, _ in iter_list_items( data, find_root_list( data ) ):
+        yield offset, length
+
+def visit_sampled( token_processor: TokenProcessor, input_source: Any, sampler: Sampler, documents: bool = False, index: Any = None ) -> List[ int ]:
+    """
+    Visits a sample of the documents of a multi-document source, such as JSON Lines, or of the items of the root list of a JSON document.
+
+    The records are located at the byte level, and only the bytes of the selected records are tokenized: the selected documents are visited as a sequence of documents and the selected list items as a document holding a list of them. When the record count is known from a line index, for documents, or from a path index, for list items, the sampler selects the records from the count and only their spans are read; otherwise the records are scanned with the structural scanner as the visit progresses, without being tokenized.
+
+    Parameters:
+        `token_processor`: the token processor publishing the events.
+        `input_source`: the path of the file, a binary file object or a bytes-like object; files are memory-mapped.
+        `sampler`: the `Sampler` selecting the records.
+        `documents`: `True` to sample the documents of a multi-document source; `False` to sample the items of the root list.
+        `index`: the `LineIndex` or `PathIndex` of the source, or the path of an index file; if `None`, the sidecar index of the file is used when it is current, and the records are scanned otherwise.
+
+    Returns:
+        The ascending numbers of the visited records: the record numbers of the documents, counting the non-blank lines from 0, or the indices of the list items.
+
+    Raises:
+        `ValueError` if the root value is not a list, or the index is stale.
+    """
+
+    index_class = LineIndex if documents else PathIndex
+    source_index = index_class.load_sidecar( input_source ) if index is None else index_class.for_source( input_source, index )
+
+    numbers: List[ int ] = []
+    record_spans: List[ Tuple[ int, int ] ] = None
+
+    if source_index is not None:
+        if documents:
+            record_count = len( source_index )
+            get_span = source_index.get_span
+        else:
+            try:
+                items = source_index.get_children( () )
+            except KeyError:
+                items = None # A scalar root value has no children.
+
+            if items is None or items.is_object:
+                raise ValueError( "The root value is not a list." )
+
+            record_count = len( items )
+            offsets, lengths = items.offsets, items.lengths
+            get_span = lambda number: ( offsets[ number ], lengths[ number ] )
+
+        numbers.extend( sampler.select( record_count ) )
+        record_spans = [ get_span( number ) for number in numbers ]
+
+    def visit( data: Any ) -> None:
+        if record_spans is not None:
+            spans = iter( record_spans )
+        else:
+            spans = _select_spans( sampler, numbers, iter_record_spans( data ) if documents else _iter_item_spans( data ) )
+
+        try:
+            first_span = next( spans, None )
+
+            if documents:
+                # An empty sample has no document to visit, and the tokenizer rejects an empty input.
+                if first_span is not None:
+                    token_processor.process_documents( _SampleReader( data, chain( ( first_span, ), spans ), b"\n" ) )
+            else:
+                token_processor.process( _SampleReader( data, spans if first_span is None else chain( ( first_span, ), spans ), b",", b"[", b"]" ) )
+        finally:
+            # The scan holds a view of a memory-mapped source, which can't be closed while the view exists.
+            close = getattr( spans, "close", None )
+            if close is not None:
+                close()
+
+    scan_source( input_source, visit )
+
+    return numbers
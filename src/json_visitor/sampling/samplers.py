@@ -0,0 +1,180 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterable, Iterator, List, Tuple
+
+import math
+from itertools import islice
+from random import Random
+
+Record = Tuple[ int, Any ]
+"""
+A record of a stream: its number, counting from 0, and its byte span.
+"""
+
+def _draw_open( random: Random ) -> float:
+    """
+    Draws a uniform number in `(0, 1)`, so its logarithm is finite.
+    """
+
+    value = random.random()
+    while value == 0.0:
+        value = random.random()
+
+    return value
+
+class Sampler( object ):
+    """
+    The base class of the record samplers of a sampled visit, which select the records to visit among the documents of a multi-document source or the items of a top-level list.
+
+    A sampler selects the record numbers from the record count when it is known from an index, and otherwise from the stream of records as they are scanned; in both cases the selected records are in ascending order. A sampler can be used for several visits. Seeded every-Nth and Bernoulli samplers select the same records whether the count is known or not; a seeded reservoir sampler draws its sample differently from a count than from a stream, so it selects the same records for the same source as long as an index is available for every visit or for none.
+    """
+
+    def select( self, record_count: int ) -> Iterable[ int ]:
+        """
+        Selects records among a known number of records.
+
+        Parameters:
+            `record_count`: the number of records.
+
+        Returns:
+            The ascending numbers of the selected records.
+        """
+
+        raise NotImplementedError( f"{ self.__class__.__qualname__ } doesn't implement record selection." )
+
+    def select_stream( self, records: Iterator[ Record ] ) -> Iterable[ Record ]:
+        """
+        Selects records from a stream of records of unknown length.
+
+        Parameters:
+            `records`: iterator of the `( number, span )` records, in order.
+
+        Returns:
+            The selected records, in ascending order.
+        """
+
+        raise NotImplementedError( f"{ self.__class__.__qualname__ } doesn't implement stream selection." )
+
+class EverySampler( Sampler ):
+    """
+    Selects every `interval`th record, starting with record `start`: a systematic sample.
+
+    Parameters:
+        `interval`: the distance between two selected records; 1 selects every record.
+        `start`: the number of the first selected record. The default is 0.
+    """
+
+    def __init__( self, interval: int, start: int = 0 ):
+        if interval < 1:
+            raise ValueError( "Sampling interval must be at least 1." )
+        if start < 0:
+            raise ValueError( "Sampling start must be at least 0." )
+
+        self._interval: int = int( interval )
+        self._start: int = int( start )
+
+    def select( self, record_count: int ) -> Iterable[ int ]:
+        return range( self._start, record_count, self._interval )
+
+    def select_stream( self, records: Iterator[ Record ] ) -> Iterable[ Record ]:
+        return islice( records, self._start, None, self._interval )
+
+class BernoulliSampler( Sampler ):
+    """
+    Selects each record independently with the probability `probability`.
+
+    Rather than drawing a random number per record, the number of records skipped before the next selected record is drawn from the geometric distribution, so the random draws are proportional to the sample size.
+
+    Parameters:
+        `probability`: the probability of selecting a record, in `[0, 1]`.
+        `seed`: the seed of the random number generator, for a reproducible sample.
+    """
+
+    def __init__( self, probability: float, seed: Any = None ):
+        if not 0.0 <= probability <= 1.0:
+            raise ValueError( "Sampling probability must be between 0 and 1." )
+
+        self._probability: float = float( probability )
+        self._seed: Any = seed
+
+    def _iter_gaps( self ) -> Iterator[ int ]:
+        """
+        Draws the number of records skipped before each selected record.
+        """
+
+        if self._probability == 1.0:
+            while True:
+                yield 0
+
+        random = Random( self._seed )
+        log_complement = math.log1p( -self._probability )
+
+        while True:
+            yield int( math.log( _draw_open( random ) ) / log_complement )
+
+    def select( self, record_count: int ) -> Iterable[ int ]:
+        if self._probability == 0.0:
+            return
+
+        number = -1
+
+        for gap in self._iter_gaps():
+            number += gap + 1
+            if number >= record_count:
+                return
+
+            yield number
+
+    def select_stream( self, records: Iterator[ Record ] ) -> Iterable[ Record ]:
+        if self._probability == 0.0:
+            return
+
+        for gap in self._iter_gaps():
+            record = next( islice( records, gap, None ), None )
+            if record is None:
+                return
+
+            yield record
+
+class ReservoirSampler( Sampler ):
+    """
+    Selects `size` records uniformly at random, or every record if there are fewer.
+
+    With a known record count the sample is drawn directly; a stream is sampled with the skipping reservoir algorithm L of Li, which draws a number of random numbers proportional to `size * log( record count / size )` and holds only the spans of the reservoir.
+
+    Parameters:
+        `size`: the sample size.
+        `seed`: the seed of the random number generator, for a reproducible sample.
+    """
+
+    def __init__( self, size: int, seed: Any = None ):
+        if size < 0:
+            raise ValueError( "Sample size must be at least 0." )
+
+        self._size: int = int( size )
+        self._seed: Any = seed
+
+    def select( self, record_count: int ) -> Iterable[ int ]:
+        return sorted( Random( self._seed ).sample( range( record_count ), min( self._size, record_count ) ) )
+
+    def select_stream( self, records: Iterator[ Record ] ) -> Iterable[ Record ]:
+        size = self._size
+        reservoir: List[ Record ] = list( islice( records, size ) )
+
+        if size > 0 and len( reservoir ) == size:
+            random = Random( self._seed )
+            weight = math.exp( math.log( _draw_open( random ) ) / size )
+
+            while True:
+                skip = int( math.log( _draw_open( random ) ) / math.log1p( -weight ) )
+
+                record = next( islice( records, skip, None ), None )
+                if record is None:
+                    break
+
+                reservoir[ random.randrange( size ) ] = record
+                weight *= math.exp( math.log( _draw_open( random ) ) / size )
+
+        reservoir.sort()
+
+        return reservoir
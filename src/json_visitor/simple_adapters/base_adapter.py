@@ -1,6 +1,6 @@
 __version__ = r"1.0.0"
 
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Tuple
 
 class BaseAdapter( object ):
     """
@@ -9,6 +9,11 @@ class BaseAdapter( object ):
     This adapter does not track scope to implement low-level callbacks.
     """
 
+    path_tracker: Any = None
+    """
+    The `PathTracker` of the walk publishing the events, set by `set_path_tracker`: its `path` is the path of the current value; `None` before the adapter is attached to a walker.
+    """
+
     def default_before( self, *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
         """
         Default callback invoked when before processing a node.
@@ -383,3 +388,106 @@ class BaseAdapter( object ):
         """
 
         self.default_after( value )
+
+    def process_string( self, value: str ) -> None:
+        """
+        Callback invoked when processing a string value; the default implementation forwards the value to `process_value`.
+
+        Adapters which handle each value type differently can override the typed callbacks instead of testing the type of the value in `process_value`.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.process_value( value )
+
+    def process_number( self, value: Any ) -> None:
+        """
+        Callback invoked when processing a number value; the default implementation forwards the value to `process_value`.
+
+        Parameters:
+            `value`: the value being processed; an `int`, a `float` or a `decimal.Decimal`, or a `NumberLexeme` or `LazyNumber` depending on the number mode of the visitor.
+        """
+
+        self.process_value( value )
+
+    def process_boolean( self, value: bool ) -> None:
+        """
+        Callback invoked when processing a boolean value; the default implementation forwards the value to `process_value`.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.process_value( value )
+
+    def process_null( self, value: None ) -> None:
+        """
+        Callback invoked when processing a null value; the default implementation forwards the value to `process_value`.
+
+        Parameters:
+            `value`: the value being processed, always `None`.
+        """
+
+        self.process_value( value )
+
+    def get_state( self ) -> Any:
+        """
+        Gets a snapshot of the state the adapter accumulated, saved in checkpoints so an interrupted visit can be resumed; the default implementation returns `None`, for an adapter without state.
+
+        The snapshot is taken between two list items of a top-level list or between two documents, and must be picklable. It is pickled before any further event is published, so it may share objects with the adapter. An adapter deriving from an adapter with state includes the state of the base class, for example as `( super().get_state(), own state )`.
+        """
+
+        return None
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the state from a snapshot returned by `get_state`, when a visit is resumed from a checkpoint; the default implementation does nothing.
+
+        Parameters:
+            `state`: the state snapshot.
+        """
+
+        pass
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list in the following documents, when a range of the items of a top-level list is visited as a document of its own, as by a parallel visit; the default implementation does nothing.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+        """
+
+        pass
+
+    def merge( self, other: "BaseAdapter" ) -> None:
+        """
+        Combines into the adapter the state accumulated by `other`, a copy of the adapter which visited the list items following the items visited by this adapter, so the partial results of a parallel visit can be reduced in item order.
+
+        Parameters:
+            `other`: the adapter to merge; it is not used after being merged, so its state may be taken over rather than copied.
+
+        Raises:
+            `NotImplementedError` if the adapter doesn't support merging, which is the default.
+        """
+
+        raise NotImplementedError( f"{ self.__class__.__qualname__ } doesn't support merging partial results." )
+
+    def get_cache_identity( self ) -> Tuple[ Any, ... ]:
+        """
+        Gets the identity of the adapter and of its configuration, which keys the adapter states stored in a result cache; the default implementation returns the qualified name of the adapter class.
+
+        An adapter whose results depend on its configuration appends it, for example as `super().get_cache_identity() + ( self._threshold, )`, and a change to the adapter which changes its results appends a version, so the states stored by the previous version are not restored. The identity must have a stable `repr`.
+        """
+
+        return ( f"{ type( self ).__module__ }.{ type( self ).__qualname__ }", )
+
+    def set_path_tracker( self, path_tracker: Any ) -> None:
+        """
+        Sets the path tracker of the walk publishing the events to the adapter, when the adapter is attached to a walker; the default implementation stores it as `path_tracker`. A composite adapter sets it on its child adapters as well.
+
+        Parameters:
+            `path_tracker`: the `PathTracker`.
+        """
+
+        self.path_tracker = path_tracker
@@ -16,6 +16,66 @@ class CompositeAdapter( BaseAdapter ):
 
         self._adapters: Tuple[ BaseAdapter ] = tuple( adapters )
 
+    def get_state( self ) -> Any:
+        """
+        Gets the state snapshots of the child adapters.
+        """
+
+        return tuple( adapter.get_state() for adapter in self._adapters )
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the states of the child adapters from a snapshot returned by `get_state`.
+
+        Parameters:
+            `state`: the state snapshot.
+        """
+
+        for adapter, adapter_state in zip( self._adapters, state ):
+            adapter.set_state( adapter_state )
+
+    def get_cache_identity( self ) -> Tuple[ Any, ... ]:
+        """
+        Gets the identity of the adapter, followed by the identities of the child adapters.
+        """
+
+        return super().get_cache_identity() + tuple( adapter.get_cache_identity() for adapter in self._adapters )
+
+    def set_path_tracker( self, path_tracker: Any ) -> None:
+        """
+        Sets the path tracker of the walk on the adapter and on the child adapters.
+
+        Parameters:
+            `path_tracker`: the `PathTracker`.
+        """
+
+        super().set_path_tracker( path_tracker )
+
+        for adapter in self._adapters:
+            adapter.set_path_tracker( path_tracker )
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list of the child adapters in the following documents.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+        """
+
+        for adapter in self._adapters:
+            adapter.set_item_index_offset( offset )
+
+    def merge( self, other: "CompositeAdapter" ) -> None:
+        """
+        Merges each child adapter of `other` into the corresponding child adapter.
+
+        Parameters:
+            `other`: the adapter to merge.
+        """
+
+        for adapter, other_adapter in zip( self._adapters, other._adapters ):
+            adapter.merge( other_adapter )
+
     def before_document_start( self ) -> None:
         """
         Callback invoked before processing the start of the document.
@@ -417,3 +477,47 @@ class CompositeAdapter( BaseAdapter ):
 
         for adapter in self._adapters:
             adapter.after_value( value )
+
+    def process_string( self, value: str ) -> None:
+        """
+        Callback invoked when processing a string value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        for adapter in self._adapters:
+            adapter.process_string( value )
+
+    def process_number( self, value: Any ) -> None:
+        """
+        Callback invoked when processing a number value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        for adapter in self._adapters:
+            adapter.process_number( value )
+
+    def process_boolean( self, value: bool ) -> None:
+        """
+        Callback invoked when processing a boolean value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        for adapter in self._adapters:
+            adapter.process_boolean( value )
+
+    def process_null( self, value: None ) -> None:
+        """
+        Callback invoked when processing a null value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        for adapter in self._adapters:
+            adapter.process_null( value )
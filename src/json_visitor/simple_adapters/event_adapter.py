@@ -0,0 +1,471 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterable, Tuple
+
+from .base_adapter import BaseAdapter
+
+EventNames: Tuple[ str ] = (
+    "before_document_start", "process_document_start", "after_document_start",
+    "before_document_end", "process_document_end", "after_document_end",
+    "before_object_start", "process_object_start", "after_object_start",
+    "before_object_end", "process_object_end", "after_object_end",
+    "before_list_start", "process_list_start", "after_list_start",
+    "before_list_end", "process_list_end", "after_list_end",
+    "before_list_item_start", "process_list_item_start", "after_list_item_start",
+    "before_list_item_end", "process_list_item_end", "after_list_item_end",
+    "before_list_item_value_start", "process_list_item_value_start", "after_list_item_value_start",
+    "before_list_item_value_end", "process_list_item_value_end", "after_list_item_value_end",
+    "before_member_start", "process_member_start", "after_member_start",
+    "before_member_end", "process_member_end", "after_member_end",
+    "before_member_key", "process_member_key", "after_member_key",
+    "before_member_value_start", "process_member_value_start", "after_member_value_start",
+    "before_member_value_end", "process_member_value_end", "after_member_value_end",
+    "before_value", "process_value", "after_value",
+    "process_string", "process_number", "process_boolean", "process_null",
+)
+"""
+The names of the simple adapter event handlers, in the order they are declared in the simple `BaseAdapter`.
+"""
+
+def dispatch_event( adapter: BaseAdapter, event_name: str, *args: Iterable[ Any ] ) -> None:
+    """
+    Invokes the event handler with the given name on the given adapter.
+
+    Parameters:
+        `adapter`: the adapter to invoke the event handler on.
+        `event_name`: the name of the event handler; must be one of `EventNames`.
+        `args`: the arguments of the event.
+
+    Returns:
+        None
+    """
+
+    getattr( adapter, event_name )( *args )
+
+def replay_events( events: Iterable[ Tuple[ str, Tuple[ Any ] ] ], *adapters: Iterable[ BaseAdapter ] ) -> None:
+    """
+    Replays a recorded event sequence through the given adapters.
+
+    Parameters:
+        `events`: iterable of `( event name, event arguments )` tuples.
+        `adapters`: the adapters to publish the events to; each event is published to all adapters before the next event.
+
+    Returns:
+        None
+    """
+
+    for event_name, args in events:
+        for adapter in adapters:
+            getattr( adapter, event_name )( *args )
+
+class EventAdapter( BaseAdapter ):
+    """
+    Implements an adapter which funnels every event through the single `handle_event( event_name, *args )` method.
+
+    This is the extension point for adapters which treat the events as data (recording, queueing, serializing or timing them) instead of handling each event individually.
+    """
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        """
+        Handles an event; the default implementation does nothing.
+
+        Parameters:
+            `event_name`: the name of the event handler which was invoked; one of `EventNames`.
+            `args`: the arguments of the event.
+        """
+
+        pass
+
+    def before_document_start( self ) -> None:
+        """
+        Callback invoked before processing the start of the document.
+        """
+
+        self.handle_event( "before_document_start" )
+
+    def process_document_start( self ) -> None:
+        """
+        Callback invoked when processing the start of the document.
+        """
+
+        self.handle_event( "process_document_start" )
+
+    def after_document_start( self ) -> None:
+        """
+        Callback invoked after processing the start of the document.
+        """
+
+        self.handle_event( "after_document_start" )
+
+    def before_document_end( self ) -> None:
+        """
+        Callback invoked before processing the end of the document.
+        """
+
+        self.handle_event( "before_document_end" )
+
+    def process_document_end( self ) -> None:
+        """
+        Callback invoked when processing the end of the document.
+        """
+
+        self.handle_event( "process_document_end" )
+
+    def after_document_end( self ) -> None:
+        """
+        Callback invoked after processing the end of the document.
+        """
+
+        self.handle_event( "after_document_end" )
+
+    def before_object_start( self ) -> None:
+        """
+        Callback invoked before processing the start of an object.
+        """
+
+        self.handle_event( "before_object_start" )
+
+    def process_object_start( self ) -> None:
+        """
+        Callback invoked when processing the start of an object.
+        """
+
+        self.handle_event( "process_object_start" )
+
+    def after_object_start( self ) -> None:
+        """
+        Callback invoked after processing the start of an object.
+        """
+
+        self.handle_event( "after_object_start" )
+
+    def before_object_end( self ) -> None:
+        """
+        Callback invoked before processing the end of an object.
+        """
+
+        self.handle_event( "before_object_end" )
+
+    def process_object_end( self ) -> None:
+        """
+        Callback invoked when processing the end of an object.
+        """
+
+        self.handle_event( "process_object_end" )
+
+    def after_object_end( self ) -> None:
+        """
+        Callback invoked after processing the end of an object.
+        """
+
+        self.handle_event( "after_object_end" )
+
+    def before_list_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a list.
+        """
+
+        self.handle_event( "before_list_start" )
+
+    def process_list_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a list.
+        """
+
+        self.handle_event( "process_list_start" )
+
+    def after_list_start( self ) -> None:
+        """
+        Callback invoked after processing the start of a list.
+        """
+
+        self.handle_event( "after_list_start" )
+
+    def before_list_end( self ) -> None:
+        """
+        Callback invoked before processing the end of a list.
+        """
+
+        self.handle_event( "before_list_end" )
+
+    def process_list_end( self ) -> None:
+        """
+        Callback invoked when processing the end of a list.
+        """
+
+        self.handle_event( "process_list_end" )
+
+    def after_list_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a list.
+        """
+
+        self.handle_event( "after_list_end" )
+
+    def before_list_item_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a list item.
+        """
+
+        self.handle_event( "before_list_item_start" )
+
+    def process_list_item_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a list item.
+        """
+
+        self.handle_event( "process_list_item_start" )
+
+    def after_list_item_start( self ) -> None:
+        """
+        Callback invoked after processing the start of a list item.
+        """
+
+        self.handle_event( "after_list_item_start" )
+
+    def before_list_item_end( self ) -> None:
+        """
+        Callback invoked before processing the end of a list item.
+        """
+
+        self.handle_event( "before_list_item_end" )
+
+    def process_list_item_end( self ) -> None:
+        """
+        Callback invoked when processing the end of a list item.
+        """
+
+        self.handle_event( "process_list_item_end" )
+
+    def after_list_item_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a list item.
+        """
+
+        self.handle_event( "after_list_item_end" )
+
+    def before_list_item_value_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a list item value.
+        """
+
+        self.handle_event( "before_list_item_value_start" )
+
+    def process_list_item_value_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a list item value.
+        """
+
+        self.handle_event( "process_list_item_value_start" )
+
+    def after_list_item_value_start( self ) -> None:
+        """
+        Callback invoked after processing the start of a list item value.
+        """
+
+        self.handle_event( "after_list_item_value_start" )
+
+    def before_list_item_value_end( self ) -> None:
+        """
+        Callback invoked before processing the end of a list item value.
+        """
+
+        self.handle_event( "before_list_item_value_end" )
+
+    def process_list_item_value_end( self ) -> None:
+        """
+        Callback invoked when processing the end of a list item value.
+        """
+
+        self.handle_event( "process_list_item_value_end" )
+
+    def after_list_item_value_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a list item value.
+        """
+
+        self.handle_event( "after_list_item_value_end" )
+
+    def before_member_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a member.
+        """
+
+        self.handle_event( "before_member_start" )
+
+    def process_member_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a member.
+        """
+
+        self.handle_event( "process_member_start" )
+
+    def after_member_start( self ) -> None:
+        """
+        Callback invoked after processing the start of a member.
+        """
+
+        self.handle_event( "after_member_start" )
+
+    def before_member_end( self ) -> None:
+        """
+        Callback invoked before processing the end of a member.
+        """
+
+        self.handle_event( "before_member_end" )
+
+    def process_member_end( self ) -> None:
+        """
+        Callback invoked when processing the end of a member.
+        """
+
+        self.handle_event( "process_member_end" )
+
+    def after_member_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a member.
+        """
+
+        self.handle_event( "after_member_end" )
+
+    def before_member_key( self, name: str ) -> None:
+        """
+        Callback invoked before processing the member key.
+        
+        Parameters:
+            `name`: The member key.
+        """
+
+        self.handle_event( "before_member_key", name )
+
+    def process_member_key( self, name: str ) -> None:
+        """
+        Callback invoked when processing the member key.
+        
+        Parameters:
+            `name`: The member key.
+        """
+
+        self.handle_event( "process_member_key", name )
+
+    def after_member_key( self, name: str ) -> None:
+        """
+        Callback invoked after processing the member key.
+        
+        Parameters:
+            `name`: The member key.
+        """
+
+        self.handle_event( "after_member_key", name )
+
+    def before_member_value_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a member value.
+        """
+
+        self.handle_event( "before_member_value_start" )
+
+    def process_member_value_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a member value.
+        """
+
+        self.handle_event( "process_member_value_start" )
+
+    def after_member_value_start( self ) -> None:
+        """
+        Callback invoked after processing the start of a member value.
+        """
+
+        self.handle_event( "after_member_value_start" )
+
+    def before_member_value_end( self ) -> None:
+        """
+        Callback invoked before processing the end of a member value.
+        """
+
+        self.handle_event( "before_member_value_end" )
+
+    def process_member_value_end( self ) -> None:
+        """
+        Callback invoked when processing the end of a member value.
+        """
+
+        self.handle_event( "process_member_value_end" )
+
+    def after_member_value_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a member value.
+        """
+
+        self.handle_event( "after_member_value_end" )
+
+    def before_value( self, value: Any ) -> None:
+        """
+        Callback invoked before processing the value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "before_value", value )
+
+    def process_value( self, value: Any ) -> None:
+        """
+        Callback invoked when processing the value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "process_value", value )
+
+    def after_value( self, value: Any ) -> None:
+        """
+        Callback invoked after processing the value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "after_value", value )
+
+    def process_string( self, value: str ) -> None:
+        """
+        Callback invoked when processing a string value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "process_string", value )
+
+    def process_number( self, value: Any ) -> None:
+        """
+        Callback invoked when processing a number value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "process_number", value )
+
+    def process_boolean( self, value: bool ) -> None:
+        """
+        Callback invoked when processing a boolean value.
+
+        Parameters:
+            `value`: the value being processed.
+        """
+
+        self.handle_event( "process_boolean", value )
+
+    def process_null( self, value: None ) -> None:
+        """
+        Callback invoked when processing a null value.
+
+        Parameters:
+            `value`: the value being processed, always `None`.
+        """
+
+        self.handle_event( "process_null", value )
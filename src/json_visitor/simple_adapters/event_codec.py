@@ -0,0 +1,155 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, Iterator, Tuple
+
+import struct
+from decimal import Decimal
+from ..tokenizer.raw_numbers import LazyNumber, NumberLexeme
+from .event_adapter import EventNames
+
+# Record layout: one byte event code, followed by a one byte value tag and the value payload for the events which carry a value.
+_EventCodes: Dict[ str, int ] = { name: code for code, name in enumerate( EventNames ) }
+_ValueEventCodes = frozenset( code for name, code in _EventCodes.items() if name.endswith( ( "_member_key", "_value", "_string", "_number", "_boolean", "_null" ) ) )
+
+_NoneTag: int = 0
+_TrueTag: int = 1
+_FalseTag: int = 2
+_IntegerTag: int = 3
+_BigIntegerTag: int = 4
+_FloatTag: int = 5
+_DecimalTag: int = 6
+_StringTag: int = 7
+_NumberLexemeTag: int = 8
+_LazyNumberTag: int = 9
+_LazyFloatNumberTag: int = 10
+
+_Integer = struct.Struct( "<q" )
+_Float = struct.Struct( "<d" )
+_Length = struct.Struct( "<I" )
+
+_IntegerMinimum: int = -( 2 ** 63 )
+_IntegerMaximum: int = 2 ** 63 - 1
+
+def _encode_text( buffer: bytearray, tag: int, text: str ) -> None:
+    data = text.encode( "utf-8" )
+
+    buffer.append( tag )
+    buffer += _Length.pack( len( data ) )
+    buffer += data
+
+def encode_value( buffer: bytearray, value: Any ) -> None:
+    """
+    Appends the compact encoding of a JSON scalar value to the buffer.
+
+    Parameters:
+        `buffer`: the buffer to append to.
+        `value`: the value to encode; must be `None`, a `bool`, an `int`, a `float`, a `Decimal`, a `str`, a `NumberLexeme` or a `LazyNumber`.
+
+    Returns:
+        None
+    """
+
+    if value is None:
+        buffer.append( _NoneTag )
+    elif value is True:
+        buffer.append( _TrueTag )
+    elif value is False:
+        buffer.append( _FalseTag )
+    elif type( value ) is str:
+        _encode_text( buffer, _StringTag, value )
+    elif isinstance( value, int ):
+        if _IntegerMinimum <= value <= _IntegerMaximum:
+            buffer.append( _IntegerTag )
+            buffer += _Integer.pack( value )
+        else:
+            _encode_text( buffer, _BigIntegerTag, str( value ) )
+    elif isinstance( value, float ):
+        buffer.append( _FloatTag )
+        buffer += _Float.pack( value )
+    elif isinstance( value, Decimal ):
+        _encode_text( buffer, _DecimalTag, str( value ) )
+    elif isinstance( value, NumberLexeme ):
+        _encode_text( buffer, _NumberLexemeTag, value )
+    elif isinstance( value, LazyNumber ):
+        _encode_text( buffer, _LazyFloatNumberTag if value.use_float else _LazyNumberTag, value.lexeme )
+    elif isinstance( value, str ):
+        _encode_text( buffer, _StringTag, value )
+    else:
+        raise ValueError( f"Cannot encode value of type '{ value.__class__.__qualname__ }'." )
+
+def _decode_value( data: bytes, offset: int ) -> Tuple[ Any, int ]:
+    tag = data[ offset ]
+    offset += 1
+
+    if tag == _NoneTag:
+        return None, offset
+    elif tag == _TrueTag:
+        return True, offset
+    elif tag == _FalseTag:
+        return False, offset
+    elif tag == _IntegerTag:
+        return _Integer.unpack_from( data, offset )[ 0 ], offset + _Integer.size
+    elif tag == _FloatTag:
+        return _Float.unpack_from( data, offset )[ 0 ], offset + _Float.size
+    else:
+        length = _Length.unpack_from( data, offset )[ 0 ]
+        offset += _Length.size
+        text = bytes( data[ offset:offset + length ] ).decode( "utf-8" )
+        offset += length
+
+        if tag == _StringTag:
+            return text, offset
+        elif tag == _DecimalTag:
+            return Decimal( text ), offset
+        elif tag == _BigIntegerTag:
+            return int( text ), offset
+        elif tag == _NumberLexemeTag:
+            return NumberLexeme( text ), offset
+        elif tag == _LazyNumberTag or tag == _LazyFloatNumberTag:
+            return LazyNumber( text, tag == _LazyFloatNumberTag ), offset
+        else:
+            raise ValueError( f"Invalid value tag { tag }." )
+
+def encode_event( buffer: bytearray, event_name: str, args: Tuple[ Any ] ) -> None:
+    """
+    Appends the compact encoding of an event to the buffer.
+
+    Parameters:
+        `buffer`: the buffer to append to.
+        `event_name`: the name of the event; must be one of `EventNames`.
+        `args`: the arguments of the event.
+
+    Returns:
+        None
+    """
+
+    code = _EventCodes[ event_name ]
+
+    buffer.append( code )
+
+    if code in _ValueEventCodes:
+        encode_value( buffer, args[ 0 ] )
+
+def decode_events( data: bytes ) -> Iterator[ Tuple[ str, Tuple[ Any ] ] ]:
+    """
+    Decodes a sequence of encoded events.
+
+    Parameters:
+        `data`: the bytes-like object containing zero or more encoded events.
+
+    Returns:
+        Iterator of `( event name, event arguments )` tuples.
+    """
+
+    offset: int = 0
+    length: int = len( data )
+
+    while offset < length:
+        code = data[ offset ]
+        offset += 1
+
+        if code in _ValueEventCodes:
+            value, offset = _decode_value( data, offset )
+            yield EventNames[ code ], ( value, )
+        else:
+            yield EventNames[ code ], ()
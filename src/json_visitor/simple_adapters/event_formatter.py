@@ -0,0 +1,211 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Iterable, List, Sequence, Tuple
+
+import sys
+import json
+from decimal import Decimal
+from ..tokenizer.raw_numbers import LazyNumber, NumberLexeme
+
+OutputFormats = ( "text", "ndjson" )
+"""
+The event output formats: `text` writes `name: (0: value), ...` lines and `ndjson` writes one compact `{"event": name, "values": [...]}` JSON object per line.
+"""
+
+TruncationMarker = "..."
+"""
+The marker appended to a truncated value.
+"""
+
+class _LimitReached( Exception ):
+    pass
+
+class _BoundedFormatter:
+    """
+    Formats a value piece by piece, stopping as soon as the length limit is reached, so the cost of truncating a value is bounded by the limit rather than by the size of the value.
+    """
+
+    _item_separator: str = ", "
+    _member_separator: str = ": "
+
+    def __init__( self, limit: int ):
+        self._parts: List[ str ] = []
+        self._remaining: int = limit
+
+    def write( self, text: str ) -> None:
+        if len( text ) > self._remaining:
+            self._parts.append( text[ :self._remaining ] )
+            raise _LimitReached()
+
+        self._parts.append( text )
+        self._remaining -= len( text )
+
+    def format( self, value: Any, is_top_level: bool = True ) -> None:
+        raise NotImplementedError()
+
+    def format_items( self, opening: str, items: Iterable[ Any ], closing: str, format_item: Callable[ [ Any ], None ] ) -> None:
+        self.write( opening )
+
+        for index_, item in enumerate( items ):
+            if index_ > 0:
+                self.write( self._item_separator )
+
+            format_item( item )
+
+        self.write( closing )
+
+    def get_text( self, value: Any ) -> Tuple[ str, bool ]:
+        """
+        Gets the formatted value, truncated to the limit with the truncation marker appended, and whether it was truncated.
+        """
+
+        try:
+            self.format( value )
+        except _LimitReached:
+            return "".join( self._parts ) + TruncationMarker, True
+
+        return "".join( self._parts ), False
+
+class _BoundedTextFormatter( _BoundedFormatter ):
+    """
+    Formats values as `str()` does.
+    """
+
+    def format( self, value: Any, is_top_level: bool = True ) -> None:
+        if isinstance( value, dict ):
+            def format_member( member ):
+                self.format( member[ 0 ], False )
+                self.write( self._member_separator )
+                self.format( member[ 1 ], False )
+
+            self.format_items( "{", value.items(), "}", format_member )
+        elif isinstance( value, tuple ):
+            self.format_items( "(", value, ",)" if len( value ) == 1 else ")", lambda item: self.format( item, False ) )
+        elif isinstance( value, list ):
+            self.format_items( "[", value, "]", lambda item: self.format( item, False ) )
+        elif isinstance( value, str ):
+            # Only the part of a long string which can be written is converted.
+            text = value[ :self._remaining + 1 ]
+            self.write( text if is_top_level else repr( text ) )
+        else:
+            self.write( str( value ) if is_top_level else repr( value ) )
+
+class _BoundedJsonFormatter( _BoundedFormatter ):
+    """
+    Formats values as compact JSON.
+    """
+
+    _item_separator: str = ","
+    _member_separator: str = ":"
+
+    def format( self, value: Any, is_top_level: bool = True ) -> None:
+        if isinstance( value, dict ):
+            def format_member( member ):
+                self.format( str( member[ 0 ] ), False )
+                self.write( self._member_separator )
+                self.format( member[ 1 ], False )
+
+            self.format_items( "{", value.items(), "}", format_member )
+        elif isinstance( value, ( tuple, list ) ):
+            self.format_items( "[", value, "]", lambda item: self.format( item, False ) )
+        elif _is_raw_number( value ):
+            # The original text of a number, and the text of a finite decimal, is a JSON number already.
+            self.write( str( value ) )
+        elif isinstance( value, str ):
+            self.write( json.dumps( value[ :self._remaining + 1 ] ) )
+        else:
+            self.write( json.dumps( value, default = _json_default ) )
+
+def _json_default( value: Any ) -> Any:
+    return str( value )
+
+def _is_raw_number( value: Any ) -> bool:
+    """
+    `True` if the value is a number written as its text: a number published as its original text or a finite decimal, which `float` would round.
+    """
+
+    return isinstance( value, ( NumberLexeme, LazyNumber ) ) or ( isinstance( value, Decimal ) and value.is_finite() )
+
+def _has_raw_number( value: Any ) -> bool:
+    """
+    `True` if the value is, or holds, a number written as its text, which `json.dumps` can't write.
+    """
+
+    if _is_raw_number( value ):
+        return True
+    elif isinstance( value, dict ):
+        return any( _has_raw_number( item ) for item in value.values() )
+    elif isinstance( value, ( tuple, list ) ):
+        return any( _has_raw_number( item ) for item in value )
+    else:
+        return False
+
+def format_text_value( value: Any, max_length: int = None ) -> str:
+    """
+    Formats the value for the `text` format.
+
+    Parameters:
+        `value`: the value.
+        `max_length`: the maximum length of the formatted value, excluding the truncation marker, or `None` for no limit.
+    """
+
+    if max_length is None:
+        return str( value )
+    else:
+        return _BoundedTextFormatter( max_length ).get_text( value )[ 0 ]
+
+def format_text_event( name: str, values: Sequence[ Any ], max_length: int = None ) -> str:
+    """
+    Formats the event as a `text` line, without the line terminator.
+
+    Parameters:
+        `name`: the event name.
+        `values`: the event values.
+        `max_length`: the maximum length of each formatted value, excluding the truncation marker, or `None` for no limit.
+    """
+
+    if len( values ) > 0:
+        return f'{ name }: { ", ".join( [ f"({ index_ }: { format_text_value( value, max_length ) })" for index_, value in enumerate( values ) ] ) }'
+    else:
+        return name
+
+def format_json_event( name: str, values: Sequence[ Any ], max_length: int = None ) -> str:
+    """
+    Formats the event as a compact `ndjson` line, without the line terminator. Decimal numbers are written as JSON numbers of their exact text, the numbers of the `lexeme` and `lazy` number modes as JSON numbers of their original text, and values which aren't JSON types as strings.
+
+    A string longer than `max_length` is truncated, and any other value whose JSON text is longer is replaced by a string of its truncated JSON text; the truncation marker is appended and the event gets a `"truncated": true` member.
+
+    Parameters:
+        `name`: the event name.
+        `values`: the event values.
+        `max_length`: the maximum length of each formatted value, excluding the truncation marker, or `None` for no limit.
+    """
+
+    if max_length is None:
+        if not any( _has_raw_number( value ) for value in values ):
+            return json.dumps( { "event": name, "values": values }, separators = ( ",", ":" ), default = _json_default )
+
+        # `json.dumps` can't write raw text: it writes a `NumberLexeme` as the string it subclasses and has no exact form of a `Decimal`.
+        max_length = sys.maxsize
+
+    formatted_values: List[ str ] = []
+    is_truncated: bool = False
+
+    for value in values:
+        if isinstance( value, str ) and not isinstance( value, NumberLexeme ):
+            # A string is truncated to a string rather than to its JSON text.
+            is_value_truncated = len( value ) > max_length
+            text = json.dumps( value[ :max_length ] + TruncationMarker if is_value_truncated else value )
+        else:
+            text, is_value_truncated = _BoundedJsonFormatter( max_length ).get_text( value )
+
+            if is_value_truncated:
+                text = json.dumps( text )
+
+        is_truncated = is_truncated or is_value_truncated
+
+        formatted_values.append( text )
+
+    truncation_member = ',"truncated":true' if is_truncated else ""
+
+    return f'{{"event":{ json.dumps( name ) },"values":[{ ",".join( formatted_values ) }]{ truncation_member }}}'
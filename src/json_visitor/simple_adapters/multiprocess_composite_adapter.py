@@ -0,0 +1,573 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import os
+import pickle
+import struct
+import traceback
+import weakref
+import multiprocessing
+from queue import Empty
+from .base_adapter import BaseAdapter
+from .composite_adapter import CompositeAdapter
+from .event_adapter import EventAdapter
+from .event_codec import decode_events, encode_event
+from ..tokenizer.path_tracker import PathTracker, track_events
+
+try:
+    from multiprocessing import shared_memory
+except ImportError: # Python < 3.8
+    shared_memory = None
+
+# Slot layout: payload length and flags, followed by the payload. A message which does not fit in one slot continues in the following slots.
+_SlotHeader = struct.Struct( "<II" )
+_ContinuedFlag: int = 0x1
+_SyncFlag: int = 0x2
+_EndOfStreamFlag: int = 0x4
+
+_PollInterval: float = 0.05
+
+def _put_response( result_queue, adapters: Tuple[ BaseAdapter ], error: BaseException = None, error_traceback: str = "" ) -> bool:
+    """
+    Reports the adapters or the error of a worker process back to the parent process.
+
+    Returns:
+        `True` if the adapters were reported, `False` if an error was reported.
+    """
+
+    # The response is pickled here, rather than by the queue's feeder thread, so a pickling failure is reported instead of lost.
+    response: bytes = None
+
+    if error is None:
+        try:
+            response = pickle.dumps( ( "result", adapters ) )
+        except Exception as e:
+            error = e
+            error_traceback = traceback.format_exc()
+
+    if response is None:
+        try:
+            response = pickle.dumps( ( "error", error, error_traceback ) )
+        except Exception:
+            response = pickle.dumps( ( "error", RuntimeError( repr( error ) ), error_traceback ) )
+
+    result_queue.put( response )
+
+    return error is None
+
+def _run_worker( shared_memory_name: str, slot_count: int, slot_size: int, free_slots, filled_slots, adapters: Tuple[ BaseAdapter ], path_tracker: PathTracker, result_queue ) -> None:
+    """
+    Worker process entry point: reads the event messages from the ring buffer and publishes the events to the adapters, updating the path tracker of the adapters. The adapters are reported back to the parent process after each message flagged for synchronization and after the end of the stream, where the worker process exits; an error raised by an adapter is reported right away, and the worker process exits.
+    """
+
+    ring = shared_memory.SharedMemory( name = shared_memory_name )
+
+    try:
+        composite = CompositeAdapter( *adapters )
+        composite.set_path_tracker( path_tracker )
+        parts: List[ bytes ] = []
+        slot_index: int = 0
+
+        while True:
+            filled_slots.acquire()
+
+            offset = slot_index * slot_size
+            length, flags = _SlotHeader.unpack_from( ring.buf, offset )
+            offset += _SlotHeader.size
+            parts.append( bytes( ring.buf[ offset:offset + length ] ) )
+
+            free_slots.release()
+            slot_index = ( slot_index + 1 ) % slot_count
+
+            if flags & _ContinuedFlag:
+                continue
+
+            message = b"".join( parts )
+            parts = []
+
+            try:
+                for event_name, args in track_events( path_tracker, decode_events( message ) ):
+                    getattr( composite, event_name )( *args )
+            except BaseException as e:
+                _put_response( result_queue, adapters, e, traceback.format_exc() )
+                return
+
+            if flags & ( _SyncFlag | _EndOfStreamFlag ):
+                if not _put_response( result_queue, adapters ) or flags & _EndOfStreamFlag:
+                    return
+    finally:
+        ring.close()
+
+class _WorkerGroup( object ):
+    """
+    Tracks a worker process and the subset of the adapters it runs.
+    """
+
+    def __init__( self, adapter_indices: List[ int ], context ):
+        self.adapter_indices: List[ int ] = adapter_indices
+        self.free_slots = None
+        self.filled_slots = None
+        self.result_queue = context.Queue()
+        self.process = None
+
+class _WorkerPool( object ):
+    """
+    Holds the worker processes and the ring buffer they read; the finalizer of the composite adapter holds the pool rather than the adapter, so the adapter can be garbage collected while its worker processes are running.
+    """
+
+    def __init__( self ):
+        self.ring = None
+        self.slot_index: int = 0
+        self.groups: List[ _WorkerGroup ] = []
+
+    @property
+    def is_running( self ) -> bool:
+        """
+        `True` if the ring buffer has been created and the worker processes started, `False` otherwise.
+        """
+
+        return self.ring is not None
+
+    def terminate( self ) -> None:
+        """
+        Terminates the worker processes which are still running and releases the ring buffer.
+        """
+
+        groups = self.groups
+        self.groups = []
+
+        for group in groups:
+            if group.process.is_alive():
+                group.process.terminate()
+            group.process.join()
+
+        if self.ring is not None:
+            self.ring.close()
+            self.ring.unlink()
+            self.ring = None
+
+class MultiprocessCompositeAdapter( EventAdapter ):
+    """
+    Implements an adapter which represents one or more other adapters which must be children of BaseAdapter; the child adapters run in worker processes so CPU-bound adapters are not limited by the GIL.
+
+    The documents are parsed once, in the publishing process. Events are serialized with a compact binary encoding into a `multiprocessing.shared_memory` ring buffer which every worker process reads; each worker process runs a subset of the child adapters. The ring buffer is divided into `slot_count` slots of `slot_size` bytes, and publishing blocks while any worker process still has to read the slot which would be overwritten. The events of consecutive documents share the messages, the document boundaries being the document events themselves, so short documents, such as the lines of JSON Lines, don't cost a message each.
+
+    The worker processes and the ring buffer are created with the first document, with a copy of the child adapters, and are kept across documents until `close()` is called. The copies are sent back and replace the child adapters when the child adapters are read between documents, through `adapters`, `result` or `get_state`, and when the adapter is closed, so `adapters` holds the adapters with the state they accumulated during the visits; the `reducer`, if given, is invoked with the adapters when `result` is read after a document, and its return value is returned. An exception raised by a child adapter is re-raised by the first of the following: the end of a document, a full ring buffer, or the next time the child adapters are sent back; the worker processes are then terminated, and the child adapters keep the state they were last sent back with.
+
+    The adapter is a context manager which calls `close()` on exit. If a visit is aborted before the end of a document (for example, by a parse error), the events of the document which were not written to the ring buffer are discarded when the next document starts; the worker processes of an adapter which is not closed are terminated when it is garbage collected, discarding the state accumulated since the child adapters were last sent back.
+
+    Notes:
+        - requires Python 3.8 or later.
+        - the child adapters and the state they accumulate must be picklable.
+        - the event values must be `None`, `bool`, `int`, `float`, `Decimal` or `str`, which are the values produced by the tokenizer.
+        - the child adapters in a worker process share a path tracker of the process, updated as the events are read from the ring buffer.
+        - restoring the state of the child adapters, merging them or setting their item index offset closes the adapter, since the copies in the worker processes would be out of date; the worker processes are started again by the next document.
+    """
+
+    def __init__( self, *adapters: Iterable[ BaseAdapter ], process_count: int = None, reducer: Callable[ [ Tuple[ BaseAdapter ] ], Any ] = None, slot_count: int = 64, slot_size: int = 64 * 1024, mp_context = None ):
+        if shared_memory is None:
+            raise ValueError( f"{ MultiprocessCompositeAdapter.__qualname__ } requires Python 3.8 or later." )
+
+        for adapter in adapters:
+            if not isinstance( adapter, BaseAdapter ):
+                raise ValueError( f"Invalid adapter '{ adapter.__class__.__qualname__ }': it must be a child of { BaseAdapter.__qualname__ }" )
+
+        if process_count is None:
+            process_count = os.cpu_count() or 1
+        if process_count < 1:
+            raise ValueError( "Process count must be at least 1." )
+        if slot_count < 2:
+            raise ValueError( "Slot count must be at least 2." )
+        if slot_size <= _SlotHeader.size:
+            raise ValueError( f"Slot size must be larger than { _SlotHeader.size } bytes." )
+
+        self._adapters: Tuple[ BaseAdapter ] = tuple( adapters )
+        self._reducer: Callable[ [ Tuple[ BaseAdapter ] ], Any ] = reducer
+        self._result: Any = None
+
+        self._process_count: int = min( int( process_count ), max( len( self._adapters ), 1 ) )
+        self._slot_count: int = int( slot_count )
+        self._slot_size: int = int( slot_size )
+        self._context = mp_context if mp_context is not None else multiprocessing.get_context()
+
+        self._buffer: bytearray = bytearray()
+        self._in_document: bool = False
+        self._adapters_are_current: bool = True
+        self._result_is_current: bool = True
+
+        self._workers: _WorkerPool = _WorkerPool()
+        weakref.finalize( self, self._workers.terminate )
+
+        # Sent to the worker processes, with the prefix tracking of the walk and the item index offset.
+        self._child_path_tracker: PathTracker = PathTracker()
+
+    def __getstate__( self ) -> Dict[ str, Any ]:
+        # A copy holds the child adapters, without the worker processes.
+        if not self._in_document:
+            self._collect_adapters()
+
+        state = self.__dict__.copy()
+        state[ "_buffer" ] = bytearray()
+        state[ "_in_document" ] = False
+        state[ "_adapters_are_current" ] = True
+        state[ "_workers" ] = _WorkerPool()
+
+        return state
+
+    def __setstate__( self, state: Dict[ str, Any ] ) -> None:
+        self.__dict__.update( state )
+
+        weakref.finalize( self, self._workers.terminate )
+
+    def __enter__( self ) -> "MultiprocessCompositeAdapter":
+        return self
+
+    def __exit__( self, *args: Iterable[ Any ] ) -> None:
+        self.close()
+
+    @property
+    def adapters( self ) -> Tuple[ BaseAdapter ]:
+        """
+        The child adapters; between documents, these are the adapters sent back by the worker processes, with the state they accumulated during the visits. Inside a document, these are the adapters as they were last sent back.
+        """
+
+        if not self._in_document:
+            self._collect_adapters()
+
+        return self._adapters
+
+    @property
+    def result( self ) -> Any:
+        """
+        The value returned by the reducer for the adapters after the last visited document, or `None` if there is no reducer.
+        """
+
+        if not self._result_is_current and not self._in_document:
+            if self._reducer is not None:
+                self._result = self._reducer( self.adapters )
+
+            self._result_is_current = True
+
+        return self._result
+
+    def _check_between_documents( self ) -> None:
+        if self._in_document:
+            raise RuntimeError( f"The child adapters of a { MultiprocessCompositeAdapter.__qualname__ } are only available between documents." )
+
+    def get_state( self ) -> Any:
+        """
+        Gets the state snapshots of the child adapters; only available between documents, when the child adapters can be sent back by the worker processes.
+
+        Raises:
+            `RuntimeError` inside a document.
+        """
+
+        self._check_between_documents()
+
+        return tuple( adapter.get_state() for adapter in self.adapters )
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the states of the child adapters from a snapshot returned by `get_state`; only available between documents.
+
+        Parameters:
+            `state`: the state snapshot.
+
+        Raises:
+            `RuntimeError` inside a document.
+        """
+
+        self._check_between_documents()
+        self.close()
+
+        for adapter, adapter_state in zip( self._adapters, state ):
+            adapter.set_state( adapter_state )
+
+        self._result_is_current = False
+
+    def get_cache_identity( self ) -> Tuple[ Any, ... ]:
+        """
+        Gets the identity of the adapter, followed by the identities of the child adapters.
+        """
+
+        return super().get_cache_identity() + tuple( adapter.get_cache_identity() for adapter in self._adapters )
+
+    def set_path_tracker( self, path_tracker: PathTracker ) -> None:
+        """
+        Sets the path tracker of the walk on the adapter; the child adapters are given the path tracker of their worker process, tracking the prefix if the path tracker of the walk does.
+
+        Parameters:
+            `path_tracker`: the `PathTracker`.
+        """
+
+        super().set_path_tracker( path_tracker )
+
+        # The worker processes were started with the previous path tracker.
+        self.close()
+
+        self._child_path_tracker = PathTracker( path_tracker.tracks_prefix )
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list of the child adapters in the following documents.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+
+        Raises:
+            `RuntimeError` inside a document.
+        """
+
+        self._check_between_documents()
+        self.close()
+
+        for adapter in self._adapters:
+            adapter.set_item_index_offset( offset )
+
+        self._child_path_tracker.set_item_index_offset( offset )
+
+    def merge( self, other: "MultiprocessCompositeAdapter" ) -> None:
+        """
+        Merges each child adapter of `other` into the corresponding child adapter.
+
+        Parameters:
+            `other`: the adapter to merge.
+
+        Raises:
+            `RuntimeError` inside a document of either adapter.
+        """
+
+        self._check_between_documents()
+        other._check_between_documents()
+        self.close()
+
+        for adapter, other_adapter in zip( self._adapters, other.adapters ):
+            adapter.merge( other_adapter )
+
+        self._result_is_current = False
+
+    def _start_workers( self ) -> None:
+        """
+        Creates the ring buffer and starts the worker processes, unless they are running.
+        """
+
+        workers = self._workers
+        if workers.is_running:
+            return
+
+        workers.ring = shared_memory.SharedMemory( create = True, size = self._slot_count * self._slot_size )
+        workers.slot_index = 0
+        self._buffer = bytearray()
+
+        if len( self._adapters ) > 0:
+            groups = [ _WorkerGroup( [], self._context ) for _ in range( self._process_count ) ]
+            for index_ in range( len( self._adapters ) ):
+                groups[ index_ % self._process_count ].adapter_indices.append( index_ )
+        else:
+            groups = []
+
+        for group in groups:
+            group.free_slots = self._context.Semaphore( self._slot_count )
+            group.filled_slots = self._context.Semaphore( 0 )
+            group.process = self._context.Process(
+                target = _run_worker,
+                args = ( workers.ring.name, self._slot_count, self._slot_size, group.free_slots, group.filled_slots, tuple( self._adapters[ index_ ] for index_ in group.adapter_indices ), self._child_path_tracker, group.result_queue ),
+                daemon = True,
+            )
+            group.process.start()
+
+            # Appended as they start, so the processes started before a failure are terminated.
+            workers.groups.append( group )
+
+    def _raise_error( self, response: Tuple[ Any, ... ] ) -> None:
+        """
+        Terminates the worker processes and raises the error reported by a worker process.
+        """
+
+        self._workers.terminate()
+
+        _, error, remote_traceback = response
+        if remote_traceback:
+            error.__cause__ = RuntimeError( f"Worker process traceback:\n{ remote_traceback }" )
+
+        raise error
+
+    def _raise_exit_error( self, group: _WorkerGroup ) -> None:
+        """
+        Raises the error reported by the worker process of a group which has exited, or reports the unexpected exit.
+        """
+
+        if not group.result_queue.empty():
+            response = pickle.loads( group.result_queue.get() )
+            if response[ 0 ] == "error":
+                self._raise_error( response )
+
+        self._workers.terminate()
+
+        raise RuntimeError( f"Worker process { group.process.pid } exited unexpectedly with exit code { group.process.exitcode }." )
+
+    def _raise_worker_error( self ) -> None:
+        """
+        Raises the first error reported by a worker process, if any; between the synchronizations the only responses are errors.
+        """
+
+        for group in self._workers.groups:
+            if not group.result_queue.empty():
+                self._raise_error( pickle.loads( group.result_queue.get() ) )
+
+    def _acquire_slot( self, group: _WorkerGroup ) -> None:
+        """
+        Waits until the worker process of the group has read the next slot.
+        """
+
+        while not group.free_slots.acquire( timeout = _PollInterval ):
+            if not group.process.is_alive():
+                self._raise_exit_error( group )
+
+    def _write_message( self, data: bytes, message_flags: int = 0 ) -> None:
+        """
+        Writes a message to the ring buffer, spanning as many slots as needed.
+        """
+
+        workers = self._workers
+        capacity = self._slot_size - _SlotHeader.size
+        view = memoryview( data )
+        position = 0
+
+        while True:
+            chunk = view[ position:position + capacity ]
+            position += len( chunk )
+            is_last = position >= len( data )
+
+            flags = message_flags if is_last else _ContinuedFlag
+
+            for group in workers.groups:
+                self._acquire_slot( group )
+
+            offset = workers.slot_index * self._slot_size
+            _SlotHeader.pack_into( workers.ring.buf, offset, len( chunk ), flags )
+            offset += _SlotHeader.size
+            workers.ring.buf[ offset:offset + len( chunk ) ] = chunk
+
+            for group in workers.groups:
+                group.filled_slots.release()
+
+            workers.slot_index = ( workers.slot_index + 1 ) % self._slot_count
+
+            if is_last:
+                break
+
+        view.release()
+
+    def _flush_buffer( self, message_flags: int = 0 ) -> None:
+        """
+        Writes the encoded events buffered so far as one message.
+        """
+
+        data = bytes( self._buffer )
+        self._buffer = bytearray()
+
+        self._write_message( data, message_flags )
+
+    def _get_response( self, group: _WorkerGroup ) -> bytes:
+        """
+        Waits for the response of the worker process of the group.
+        """
+
+        while True:
+            try:
+                return group.result_queue.get( timeout = _PollInterval )
+            except Empty:
+                if not group.process.is_alive() and group.result_queue.empty():
+                    self._workers.terminate()
+
+                    raise RuntimeError( f"Worker process { group.process.pid } exited unexpectedly with exit code { group.process.exitcode }." )
+
+    def _collect_adapters( self, end_of_stream: bool = False ) -> None:
+        """
+        Writes the buffered events and asks the worker processes to send their adapters back, replacing the child adapters with the returned adapters; with `end_of_stream`, the worker processes then exit.
+        """
+
+        workers = self._workers
+        if not workers.is_running or ( self._adapters_are_current and not end_of_stream ):
+            return
+
+        self._flush_buffer( _EndOfStreamFlag if end_of_stream else _SyncFlag )
+
+        adapters = list( self._adapters )
+        error_response: Tuple[ Any, ... ] = None
+
+        for group in workers.groups:
+            response = pickle.loads( self._get_response( group ) )
+
+            if response[ 0 ] == "result":
+                for index_, adapter in zip( group.adapter_indices, response[ 1 ] ):
+                    adapters[ index_ ] = adapter
+            elif error_response is None:
+                error_response = response
+
+        if error_response is not None:
+            self._raise_error( error_response )
+
+        self._adapters = tuple( adapters )
+        self._adapters_are_current = True
+
+    def close( self ) -> None:
+        """
+        Sends the child adapters back from the worker processes, then stops the worker processes and releases the ring buffer. The worker processes are started again by the next document.
+
+        Raises:
+            The error raised by a child adapter since the child adapters were last sent back, if any; the worker processes are stopped regardless.
+        """
+
+        try:
+            self._collect_adapters( end_of_stream = True )
+
+            for group in self._workers.groups:
+                group.process.join()
+        finally:
+            self._workers.terminate()
+            self._buffer = bytearray()
+            self._in_document = False
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        """
+        Encodes the event into the current message, writing the message to the ring buffer once it fills a slot.
+
+        Parameters:
+            `event_name`: the name of the event handler which was invoked.
+            `args`: the arguments of the event.
+        """
+
+        encode_event( self._buffer, event_name, args )
+
+        if len( self._buffer ) >= self._slot_size - _SlotHeader.size:
+            self._flush_buffer()
+
+    def before_document_start( self ) -> None:
+        """
+        Callback invoked before processing the start of the document.
+        """
+
+        if self._in_document:
+            # The previous document was aborted: its events which were not written to the ring buffer are discarded.
+            self._buffer = bytearray()
+
+        self._start_workers()
+        self._in_document = True
+        self._adapters_are_current = False
+        self._result_is_current = False
+
+        super().before_document_start()
+
+    def after_document_end( self ) -> None:
+        """
+        Callback invoked after processing the end of the document.
+        """
+
+        super().after_document_end()
+
+        self._in_document = False
+
+        self._raise_worker_error()
@@ -30,6 +30,8 @@ class ScopeAdapter( BaseAdapter ):
         self._values: List[ Any ] = []
         self._list_item_scopes_stack: List[ List[ Any ] ] = []
 
+        self._item_index_offset: int = 0
+
     def get_current_scope( self ) -> Scope:
         """
         Gets the current scope or `None` if there is no current scope.
@@ -98,6 +100,62 @@ class ScopeAdapter( BaseAdapter ):
 
             return result
 
+    def get_state( self ) -> Any:
+        """
+        Gets the scope chain, and the values of the scopes which have not ended, as the state snapshot.
+        """
+
+        return ( super().get_state(), self._root, self.current_scope, self._values, self._list_item_scopes_stack )
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the scope chain from a snapshot returned by `get_state`.
+
+        Parameters:
+            `state`: the state snapshot.
+        """
+
+        base_state, self._root, self.current_scope, self._values, self._list_item_scopes_stack = state
+
+        super().set_state( base_state )
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list in the following documents.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+        """
+
+        super().set_item_index_offset( offset )
+
+        self._item_index_offset = offset
+
+    def merge( self, other: "ScopeAdapter" ) -> None:
+        """
+        Appends the item scopes of the root list of `other` to the root list of the adapter; the item indices are already offset by `set_item_index_offset`.
+
+        Parameters:
+            `other`: the adapter to merge.
+
+        Raises:
+            `ValueError` if the root value of either adapter is not a list.
+        """
+
+        if not other.has_root_scope:
+            return
+        elif not self.has_root_scope:
+            self._root = other._root
+            return
+
+        own_list = self._root.child_scope
+        other_list = other._root.child_scope
+
+        if not isinstance( own_list, ListScope ) or not isinstance( other_list, ListScope ):
+            raise ValueError( "Only the scope chains of root lists can be merged." )
+
+        own_list._item_scopes.extend( other_list._item_scopes )
+
     def before_document_start( self ) -> None:
         """
         Callback invoked before processing the start of the document.
@@ -105,6 +163,10 @@ class ScopeAdapter( BaseAdapter ):
 
         super().before_document_start()
 
+        # The root scope of the previous document is kept until the next document starts so it stays available after the document ends.
+        self._root = None
+        self.current_scope = None
+
         self._push_scope( RootScope() )
 
     def after_document_end( self ) -> None:
@@ -244,7 +306,11 @@ class ScopeAdapter( BaseAdapter ):
 
         super().before_list_item_start()
 
-        scope = ListItemScope( item_index = len( self.current_scope.get_value() ) )
+        item_index = len( self.current_scope._item_scopes )
+        if self.current_scope.parent.is_root:
+            item_index += self._item_index_offset
+
+        scope = ListItemScope( item_index = item_index )
 
         self.current_scope._item_scopes.append( scope )
         self._push_scope( scope )
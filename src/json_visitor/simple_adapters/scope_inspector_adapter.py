@@ -1,22 +1,77 @@
 __version__ = r"1.0.0"
 
-from typing import Any, Iterable
+from typing import Any, Iterable, List, TextIO, Tuple
 
+import sys
+
+from .event_formatter import OutputFormats, format_json_event, format_text_event
 from .scope_adapter import ScopeAdapter
 
 class ScopeInspectionAdapter( ScopeAdapter ):
-    def __init__( self ):
+    """
+    An adapter which writes each visitation event to a sink.
+
+    The events are buffered and formatted only when the buffer is written, which happens when `buffer_size` events are pending, after the end of each document and when `flush` is called; each buffer is written with a single `write` call.
+    """
+
+    def __init__( self, sink: TextIO = None, output_format: str = "text", max_value_length: int = None, buffer_size: int = 8192 ):
+        """
+        Parameters:
+            `sink`: the text stream the events are written to; if `None`, the events are written to `sys.stdout` as it is when the buffer is written.
+            `output_format`: one of `OutputFormats`.
+            `max_value_length`: the length each formatted event value is truncated to, or `None` to write complete values.
+            `buffer_size`: the number of events buffered before they are written.
+        """
+
         super().__init__()
 
-        self._output_message = lambda message: print( message )
+        self._configure_output( sink, output_format, max_value_length, buffer_size )
+
+    def _configure_output( self, sink: TextIO, output_format: str, max_value_length: int, buffer_size: int ) -> None:
+        if output_format not in OutputFormats:
+            raise ValueError( f"Invalid output format '{ output_format }': it must be one of { ', '.join( OutputFormats ) }" )
+        if max_value_length is not None and max_value_length < 0:
+            raise ValueError( f"Invalid maximum value length { max_value_length }: it must not be negative" )
+
+        self._sink: TextIO = sink
+        self._format_event = format_json_event if output_format == "ndjson" else format_text_event
+        self._max_value_length: int = max_value_length
+        self._buffer_size: int = max( buffer_size, 1 )
+        self._pending_events: List[ Tuple[ str, Tuple[ Any ] ] ] = []
+
+    @property
+    def output_format( self ) -> str:
+        """
+        Gets the output format.
+        """
+
+        return "ndjson" if self._format_event is format_json_event else "text"
 
     def _print_message( self, name, *values: Iterable[ Any ] ) -> None:
-        if len( values ) > 0:
-            message = f'{ name }: { ", ".join( [ f"({ index_ }: { value })" for index_, value in enumerate( values ) ] ) }'
-        else:
-            message = f"{ name }"
+        self._pending_events.append( ( name, values ) )
+
+        if len( self._pending_events ) >= self._buffer_size:
+            self.flush()
+
+    def flush( self ) -> None:
+        """
+        Formats and writes the buffered events.
+        """
+
+        if len( self._pending_events ) > 0:
+            pending_events = self._pending_events
+            self._pending_events = []
+
+            format_event = self._format_event
+            max_value_length = self._max_value_length
+            sink = self._sink if self._sink is not None else sys.stdout
+
+            sink.write( "".join( [ format_event( name, values, max_value_length ) + "\n" for name, values in pending_events ] ) )
+
+    def after_document_end( self ) -> None:
+        super().after_document_end()
 
-        self._output_message( message )
+        self.flush()
 
     def process_document_start( self ) -> None:
         super().process_document_start()
@@ -0,0 +1,399 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict, List, Tuple, Union
+
+import math
+from .base_adapter import BaseAdapter
+
+ValueTypes: Tuple[ str, ... ] = ( "string", "number", "boolean", "null", "object", "list" )
+"""
+The value types counted by the statistics adapter.
+"""
+
+_StringType, _NumberType, _BooleanType, _NullType, _ObjectType, _ListType = range( len( ValueTypes ) )
+
+ListItems = None
+"""
+The path component standing for every item of a list: the statistics of the items of a list are collected under a single path.
+"""
+
+def _import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    else:
+        return numpy
+
+class PathStatistics( object ):
+    """
+    The accumulators of the values at one path.
+
+    The numbers are buffered and folded into the running count, mean and sum of squared deviations in batches, combined with the parallel variance algorithm of Chan et al., which also merges the statistics of partial runs.
+
+    Attributes:
+        `type_counts`: the number of values of each of the `ValueTypes`, by index.
+        `number_count`: the number of folded numbers.
+        `minimum`: the smallest folded number, or `None`.
+        `maximum`: the largest folded number, or `None`.
+        `mean`: the mean of the folded numbers.
+        `squared_deviations`: the sum of the squared deviations of the folded numbers from their mean.
+        `non_finite_count`: the number of numbers outside of the `float` range, which are counted but not folded.
+    """
+
+    __slots__ = ( "children", "type_counts", "numbers", "number_count", "minimum", "maximum", "mean", "squared_deviations", "non_finite_count" )
+
+    def __init__( self ):
+        self.children: Dict[ Union[ str, None ], PathStatistics ] = {}
+        self.type_counts: List[ int ] = [ 0 ] * len( ValueTypes )
+        self.numbers: List[ float ] = []
+
+        self.number_count: int = 0
+        self.minimum: float = None
+        self.maximum: float = None
+        self.mean: float = 0.0
+        self.squared_deviations: float = 0.0
+        self.non_finite_count: int = 0
+
+    def add_number( self, value: Any ) -> int:
+        """
+        Buffers a number converted to `float`; a number outside of the `float` range, such as a large integer or a `Decimal`, `NumberLexeme` or `LazyNumber` with a large exponent, is counted in `non_finite_count` instead, so that it doesn't abort the visit nor make the mean and the variance infinite.
+
+        Parameters:
+            `value`: the number value.
+
+        Returns:
+            The number of buffered numbers.
+        """
+
+        try:
+            number = float( value )
+        except OverflowError: # An integer outside of the `float` range.
+            number = math.inf
+
+        if math.isfinite( number ):
+            self.numbers.append( number )
+        else:
+            self.non_finite_count += 1
+
+        return len( self.numbers )
+
+    def get_child( self, component: Union[ str, None ] ) -> "PathStatistics":
+        child = self.children.get( component, None )
+        if child is None:
+            child = PathStatistics()
+            self.children[ component ] = child
+
+        return child
+
+    def _combine( self, count: int, minimum: float, maximum: float, mean: float, squared_deviations: float ) -> None:
+        if count == 0:
+            return
+
+        total_count = self.number_count + count
+        delta = mean - self.mean
+
+        self.squared_deviations += squared_deviations + delta * delta * self.number_count * count / total_count
+        self.mean += delta * count / total_count
+        self.number_count = total_count
+        self.minimum = minimum if self.minimum is None or minimum < self.minimum else self.minimum
+        self.maximum = maximum if self.maximum is None or maximum > self.maximum else self.maximum
+
+    def fold( self, numpy: Any = None ) -> None:
+        """
+        Folds the buffered numbers into the accumulators, with vectorized NumPy reductions when `numpy` is given.
+        """
+
+        numbers = self.numbers
+        if len( numbers ) == 0:
+            return
+
+        self.numbers = []
+
+        if numpy is not None:
+            values = numpy.array( numbers, dtype = numpy.float64 )
+            mean = float( values.mean() )
+            deviations = values - mean
+
+            self._combine( len( values ), float( values.min() ), float( values.max() ), mean, float( numpy.dot( deviations, deviations ) ) )
+        else:
+            mean = math.fsum( numbers ) / len( numbers )
+
+            self._combine( len( numbers ), min( numbers ), max( numbers ), mean, math.fsum( ( number - mean ) ** 2 for number in numbers ) )
+
+    def merge( self, other: "PathStatistics", numpy: Any = None ) -> None:
+        """
+        Merges the statistics of the same path from another run, and of the paths below it.
+        """
+
+        self.fold( numpy )
+        other.fold( numpy )
+
+        for index_, count in enumerate( other.type_counts ):
+            self.type_counts[ index_ ] += count
+
+        self._combine( other.number_count, other.minimum, other.maximum, other.mean, other.squared_deviations )
+        self.non_finite_count += other.non_finite_count
+
+        for component, other_child in other.children.items():
+            child = self.children.get( component, None )
+            if child is None:
+                self.children[ component ] = other_child
+            else:
+                child.merge( other_child, numpy )
+
+    def get_summary( self ) -> Dict[ str, Any ]:
+        """
+        Gets the statistics of the path; the buffered numbers must be folded first.
+
+        Returns:
+            Dictionary with the value count, the null count, the count of each value type and, if there are numbers, their count, minimum, maximum, mean and population variance, the numbers outside of the `float` range being counted separately as `non_finite_count`.
+        """
+
+        summary = {
+            "count": sum( self.type_counts ),
+            "null_count": self.type_counts[ _NullType ],
+            "types": { name: count for name, count in zip( ValueTypes, self.type_counts ) if count > 0 },
+        }
+
+        if self.number_count > 0 or self.non_finite_count > 0:
+            summary[ "numbers" ] = {
+                "count": self.number_count,
+                "non_finite_count": self.non_finite_count,
+                "min": self.minimum,
+                "max": self.maximum,
+                "mean": self.mean if self.number_count > 0 else None,
+                "variance": self.squared_deviations / self.number_count if self.number_count > 0 else None,
+            }
+
+        return summary
+
+def format_path( path: Tuple[ Union[ str, None ], ... ] ) -> str:
+    """
+    Formats a statistics path as a string: `$` is the root value, `.key` a member and `[*]` the items of a list.
+    """
+
+    return "$" + "".join( "[*]" if component is ListItems else f".{ component }" for component in path )
+
+class StatisticsAdapter( BaseAdapter ):
+    """
+    An adapter which collects per-path statistics of the visited values without keeping the values: the value count, the null count, the count of each value type and, for numbers, the minimum, maximum, mean and variance.
+
+    The list indices are collapsed, so the items of a list share a single path, `ListItems`, and the statistics are kept in a tree of `PathStatistics` following the paths, which is entered and left as the walk enters and leaves members and list items. The numbers are buffered per path and folded into the accumulators every `buffer_size` numbers; the folds use vectorized NumPy reductions when NumPy is installed, and `math.fsum` otherwise. The statistics accumulate over every visited document; `merge` combines the statistics of parallel runs.
+
+    The adapter builds no scope chain: it holds the statistics tree, with one `PathStatistics` per distinct collapsed path, the stack of the paths being walked and at most `buffer_size` buffered numbers per path, so its memory follows the number of distinct paths rather than the size of the documents.
+
+    Parameters:
+        `buffer_size`: the number of numbers buffered per path before they are folded. The default is 4096.
+        `use_numpy`: `True` to fold with NumPy, `False` to fold in Python, or `None` (the default) to use NumPy when it is installed.
+    """
+
+    def __init__( self, buffer_size: int = 4096, use_numpy: bool = None ):
+        super().__init__()
+
+        if buffer_size < 1:
+            raise ValueError( "Buffer size must be at least 1." )
+
+        self._buffer_size: int = int( buffer_size )
+        self._use_numpy: bool = use_numpy
+        self._numpy: Any = _import_numpy() if use_numpy is not False else None
+
+        if use_numpy and self._numpy is None:
+            raise ValueError( "NumPy is not installed." )
+
+        self._root_statistics: PathStatistics = PathStatistics()
+        self._path_stack: List[ PathStatistics ] = [ self._root_statistics ]
+
+    def __getstate__( self ) -> Dict[ str, Any ]:
+        # The module isn't picklable; it is imported again when the adapter is unpickled in another process.
+        state = self.__dict__.copy()
+        state[ "_numpy" ] = None
+
+        return state
+
+    def __setstate__( self, state: Dict[ str, Any ] ) -> None:
+        self.__dict__.update( state )
+        self._numpy = _import_numpy() if self._use_numpy is not False else None
+
+    def get_state( self ) -> Any:
+        """
+        Gets the statistics and the current path as the state snapshot.
+        """
+
+        return ( super().get_state(), self._root_statistics, self._path_stack )
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the statistics from a snapshot returned by `get_state`.
+
+        Parameters:
+            `state`: the state snapshot.
+        """
+
+        base_state, self._root_statistics, self._path_stack = state
+
+        super().set_state( base_state )
+
+    def get_cache_identity( self ) -> Tuple[ Any, ... ]:
+        """
+        Gets the identity of the adapter; the buffer size and the folding implementation change the results by rounding only, so they are not part of it.
+        """
+
+        return super().get_cache_identity() + ( 2, )
+
+    def merge( self, other: "StatisticsAdapter" ) -> None:
+        """
+        Merges the statistics of another statistics adapter, such as one which visited another range of a parallel visit.
+
+        Parameters:
+            `other`: the adapter to merge.
+        """
+
+        self._root_statistics.merge( other._root_statistics, self._numpy )
+
+    def get_statistics( self ) -> Dict[ Tuple[ Union[ str, None ], ... ], Dict[ str, Any ] ]:
+        """
+        Folds the buffered numbers and gets the statistics of every path.
+
+        Returns:
+            Dictionary of the statistics summary of each path, from `PathStatistics.get_summary`, keyed by the path: a tuple of member keys and `ListItems` components, in the order the paths were first visited.
+        """
+
+        result: Dict[ Tuple[ Union[ str, None ], ... ], Dict[ str, Any ] ] = {}
+        pending: List[ Tuple[ Tuple[ Union[ str, None ], ... ], PathStatistics ] ] = [ ( (), self._root_statistics ) ]
+
+        while len( pending ) > 0:
+            path, statistics = pending.pop()
+            statistics.fold( self._numpy )
+
+            if sum( statistics.type_counts ) > 0:
+                result[ path ] = statistics.get_summary()
+
+            pending.extend( ( path + ( component, ), child ) for component, child in reversed( tuple( statistics.children.items() ) ) )
+
+        return result
+
+    def get_report( self ) -> Dict[ str, Dict[ str, Any ] ]:
+        """
+        Gets the statistics of every path, keyed by the path formatted with `format_path`.
+        """
+
+        return { format_path( path ): summary for path, summary in self.get_statistics().items() }
+
+    def before_document_start( self ) -> None:
+        """
+        Callback invoked before processing the start of the document.
+        """
+
+        super().before_document_start()
+
+        self._path_stack = [ self._root_statistics ]
+
+    def process_object_start( self ) -> None:
+        """
+        Callback invoked when processing the start of an object.
+        """
+
+        super().process_object_start()
+
+        self._path_stack[ -1 ].type_counts[ _ObjectType ] += 1
+
+    def process_list_start( self ) -> None:
+        """
+        Callback invoked when processing the start of a list.
+        """
+
+        super().process_list_start()
+
+        self._path_stack[ -1 ].type_counts[ _ListType ] += 1
+
+    def before_member_key( self, name: str ) -> None:
+        """
+        Callback invoked before processing the member key.
+
+        Parameters:
+            `name`: The member key.
+        """
+
+        super().before_member_key( name )
+
+        self._path_stack.append( self._path_stack[ -1 ].get_child( name ) )
+
+    def after_member_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a member.
+        """
+
+        super().after_member_end()
+
+        self._path_stack.pop()
+
+    def before_list_item_start( self ) -> None:
+        """
+        Callback invoked before processing the start of a list item.
+        """
+
+        super().before_list_item_start()
+
+        self._path_stack.append( self._path_stack[ -1 ].get_child( ListItems ) )
+
+    def after_list_item_end( self ) -> None:
+        """
+        Callback invoked after processing the end of a list item.
+        """
+
+        super().after_list_item_end()
+
+        self._path_stack.pop()
+
+    def process_string( self, value: str ) -> None:
+        """
+        Callback invoked when processing a string value.
+
+        Parameters:
+            `value`: the string value.
+        """
+
+        super().process_string( value )
+
+        self._path_stack[ -1 ].type_counts[ _StringType ] += 1
+
+    def process_number( self, value: Any ) -> None:
+        """
+        Callback invoked when processing a number value.
+
+        Parameters:
+            `value`: the number value.
+        """
+
+        super().process_number( value )
+
+        statistics = self._path_stack[ -1 ]
+        statistics.type_counts[ _NumberType ] += 1
+
+        if statistics.add_number( value ) >= self._buffer_size:
+            statistics.fold( self._numpy )
+
+    def process_boolean( self, value: bool ) -> None:
+        """
+        Callback invoked when processing a boolean value.
+
+        Parameters:
+            `value`: the boolean value.
+        """
+
+        super().process_boolean( value )
+
+        self._path_stack[ -1 ].type_counts[ _BooleanType ] += 1
+
+    def process_null( self, value: None ) -> None:
+        """
+        Callback invoked when processing a null value.
+
+        Parameters:
+            `value`: `None`.
+        """
+
+        super().process_null( value )
+
+        self._path_stack[ -1 ].type_counts[ _NullType ] += 1
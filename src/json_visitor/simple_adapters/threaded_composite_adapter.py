@@ -0,0 +1,315 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Iterable, List, Tuple
+
+import threading
+import weakref
+from queue import Queue
+from .base_adapter import BaseAdapter
+from .event_adapter import EventAdapter
+from ..tokenizer.path_tracker import PathTracker, track_events
+
+class _StopWorker( object ):
+    """
+    Marker placed on a worker queue to stop the worker thread.
+    """
+
+    pass
+
+class _AdapterWorker( object ):
+    """
+    Delivers event batches to a single adapter on a dedicated thread.
+    """
+
+    def __init__( self, adapter: BaseAdapter, path_tracker: PathTracker, queue_size: int ):
+        self.adapter: BaseAdapter = adapter
+        self.path_tracker: PathTracker = path_tracker
+        self.queue: Queue = Queue( maxsize = queue_size )
+        self.error: BaseException = None
+
+        self._thread: threading.Thread = threading.Thread( target = self._run, name = f"{ adapter.__class__.__qualname__ } worker", daemon = True )
+        self._thread.start()
+
+    @property
+    def is_alive( self ) -> bool:
+        """
+        `True` if the worker thread is running, `False` otherwise.
+        """
+
+        return self._thread.is_alive()
+
+    def _run( self ) -> None:
+        while True:
+            batch = self.queue.get()
+
+            try:
+                if batch is _StopWorker:
+                    return
+                elif self.error is None:
+                    # Once the adapter has failed the remaining batches are drained without being delivered so the producer never blocks on a full queue.
+                    try:
+                        for event_name, args in track_events( self.path_tracker, batch ):
+                            getattr( self.adapter, event_name )( *args )
+                    except BaseException as e:
+                        self.error = e
+            finally:
+                self.queue.task_done()
+
+    def stop( self ) -> None:
+        """
+        Stops the worker thread after all queued batches have been delivered.
+        """
+
+        self.queue.put( _StopWorker )
+        self._thread.join()
+
+def _stop_workers( workers: List[ _AdapterWorker ] ) -> None:
+    """
+    Stops and removes the worker threads of the list; also invoked when the composite adapter owning the list is garbage collected.
+    """
+
+    stopped_workers = list( workers )
+    workers.clear()
+
+    for worker in stopped_workers:
+        if worker.is_alive:
+            worker.stop()
+
+class ThreadedCompositeAdapter( EventAdapter ):
+    """
+    Implements an adapter which represents zero or more other adapters which must be children of BaseAdapter; each child adapter handles the events on its own worker thread.
+
+    Events are recorded into batches of `batch_size` events; each full batch is placed on a bounded queue per child adapter. A child adapter receives the events in the order they were published, but child adapters progress independently of each other and of the parser, which allows adapters performing blocking work (I/O, compression, database writes) to overlap with parsing. When a queue is full, publishing blocks until the child adapter catches up.
+
+    The worker threads are started with the first document and are kept across documents until `close()` is called; at the end of each document the adapter waits until all of the events have been delivered. An exception raised by a child adapter is re-raised by the next batch hand-off or at the end of the document, whichever comes first; the worker threads are then stopped, and started again with the next document. The failed child adapter receives no further events of the document.
+
+    The adapter is a context manager which calls `close()` on exit, including when the visit is aborted before the end of a document (for example, by a parse error). The events of an aborted document which have not been handed off are discarded when the next document starts, and the worker threads of an adapter which is not closed are stopped when it is garbage collected.
+
+    Notes:
+        - the child adapters must not share mutable state with each other or with the publishing thread unless that state is thread-safe.
+        - each child adapter has a path tracker of its own, updated on its worker thread as the child adapter handles the events, since the walk has moved on by then.
+    """
+
+    def __init__( self, *adapters: Iterable[ BaseAdapter ], batch_size: int = 1024, queue_size: int = 16 ):
+        for adapter in adapters:
+            if not isinstance( adapter, BaseAdapter ):
+                raise ValueError( f"Invalid adapter '{ adapter.__class__.__qualname__ }': it must be a child of { BaseAdapter.__qualname__ }" )
+
+        if batch_size < 1:
+            raise ValueError( "Batch size must be at least 1." )
+        if queue_size < 1:
+            raise ValueError( "Queue size must be at least 1." )
+
+        self._adapters: Tuple[ BaseAdapter ] = tuple( adapters )
+        self._batch_size: int = int( batch_size )
+        self._queue_size: int = int( queue_size )
+
+        self._batch: List[ Tuple[ str, Tuple[ Any ] ] ] = []
+        self._in_document: bool = False
+
+        # The list is only updated in place: the finalizer holds it, rather than the adapter, so the adapter can be garbage collected while its worker threads are running.
+        self._workers: List[ _AdapterWorker ] = []
+        weakref.finalize( self, _stop_workers, self._workers )
+
+        self._path_trackers: Tuple[ PathTracker ] = ()
+        self._set_child_path_trackers( False )
+
+    @property
+    def adapters( self ) -> Tuple[ BaseAdapter ]:
+        """
+        The child adapters.
+        """
+
+        return self._adapters
+
+    def __enter__( self ) -> "ThreadedCompositeAdapter":
+        return self
+
+    def __exit__( self, *args: Iterable[ Any ] ) -> None:
+        self.close()
+
+    def _start_workers( self ) -> None:
+        """
+        Starts a worker thread for each child adapter, unless the worker threads are running.
+        """
+
+        if len( self._workers ) == 0:
+            self._workers.extend( _AdapterWorker( adapter, path_tracker, self._queue_size ) for adapter, path_tracker in zip( self._adapters, self._path_trackers ) )
+
+    def _set_child_path_trackers( self, track_prefix: bool ) -> None:
+        """
+        Gives each child adapter a path tracker of its own.
+        """
+
+        self._path_trackers = tuple( PathTracker( track_prefix ) for _ in self._adapters )
+
+        for adapter, path_tracker in zip( self._adapters, self._path_trackers ):
+            adapter.set_path_tracker( path_tracker )
+
+    def _raise_worker_error( self ) -> None:
+        """
+        Raises the first error encountered by a child adapter, if any.
+        """
+
+        for worker in self._workers:
+            if worker.error is not None:
+                error = worker.error
+                self.close()
+
+                raise error
+
+    def _flush_batch( self ) -> None:
+        """
+        Hands the current batch off to each worker queue, blocking while a queue is full.
+        """
+
+        batch = self._batch
+        self._batch = []
+
+        if len( batch ) > 0:
+            for worker in self._workers:
+                worker.queue.put( batch )
+
+        self._raise_worker_error()
+
+    def flush( self ) -> None:
+        """
+        Hands the buffered events off to the child adapters and waits until the child adapters have handled all of the events published so far.
+
+        Raises:
+            The first exception raised by a child adapter, if any.
+        """
+
+        self._flush_batch()
+
+        for worker in self._workers:
+            worker.queue.join()
+
+        self._raise_worker_error()
+
+    def close( self ) -> None:
+        """
+        Stops the worker threads after the events handed off so far have been delivered; buffered events which have not been handed off are discarded. The worker threads are started again by the next document.
+        """
+
+        self._batch = []
+
+        _stop_workers( self._workers )
+
+    def get_state( self ) -> Any:
+        """
+        Gets the state snapshots of the child adapters, after they have handled all of the events published so far.
+        """
+
+        if len( self._workers ) > 0:
+            self.flush()
+
+        return tuple( adapter.get_state() for adapter in self._adapters )
+
+    def set_state( self, state: Any ) -> None:
+        """
+        Restores the states of the child adapters from a snapshot returned by `get_state`.
+
+        Parameters:
+            `state`: the state snapshot.
+        """
+
+        if len( self._workers ) > 0:
+            self.flush()
+
+        for adapter, adapter_state in zip( self._adapters, state ):
+            adapter.set_state( adapter_state )
+
+    def get_cache_identity( self ) -> Tuple[ Any, ... ]:
+        """
+        Gets the identity of the adapter, followed by the identities of the child adapters.
+        """
+
+        return super().get_cache_identity() + tuple( adapter.get_cache_identity() for adapter in self._adapters )
+
+    def set_path_tracker( self, path_tracker: PathTracker ) -> None:
+        """
+        Sets the path tracker of the walk on the adapter; the child adapters are given path trackers of their own, tracking the prefix if the path tracker of the walk does.
+
+        Parameters:
+            `path_tracker`: the `PathTracker`.
+        """
+
+        super().set_path_tracker( path_tracker )
+
+        if len( self._workers ) > 0:
+            # The worker threads update the path trackers they were started with.
+            self.flush()
+            self.close()
+
+        self._set_child_path_trackers( path_tracker.tracks_prefix )
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list of the child adapters in the following documents.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+        """
+
+        if len( self._workers ) > 0:
+            self.flush()
+
+        for adapter, path_tracker in zip( self._adapters, self._path_trackers ):
+            adapter.set_item_index_offset( offset )
+            path_tracker.set_item_index_offset( offset )
+
+    def merge( self, other: "ThreadedCompositeAdapter" ) -> None:
+        """
+        Merges each child adapter of `other` into the corresponding child adapter.
+
+        Parameters:
+            `other`: the adapter to merge.
+        """
+
+        if len( self._workers ) > 0:
+            self.flush()
+        if len( other._workers ) > 0:
+            other.flush()
+
+        for adapter, other_adapter in zip( self._adapters, other._adapters ):
+            adapter.merge( other_adapter )
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        """
+        Records the event in the current batch, handing the batch off to the child adapters when it is full.
+
+        Parameters:
+            `event_name`: the name of the event handler which was invoked.
+            `args`: the arguments of the event.
+        """
+
+        self._batch.append( ( event_name, args ) )
+
+        if len( self._batch ) >= self._batch_size:
+            self._flush_batch()
+
+    def before_document_start( self ) -> None:
+        """
+        Callback invoked before processing the start of the document.
+        """
+
+        if self._in_document:
+            # The previous document was aborted: its events which were not handed off are discarded.
+            self._batch = []
+
+        self._start_workers()
+        self._in_document = True
+
+        super().before_document_start()
+
+    def after_document_end( self ) -> None:
+        """
+        Callback invoked after processing the end of the document.
+        """
+
+        super().after_document_end()
+
+        self._in_document = False
+
+        self.flush()
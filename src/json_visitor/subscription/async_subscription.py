@@ -0,0 +1,182 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from .simple_subscription import SimpleSubscription
+
+class AsyncSubscription( SimpleSubscription ):
+    """
+    A subscription whose callbacks may be coroutine functions, such as the handlers of asynchronous clients; the coroutines are run as tasks on an event loop in a background thread while the visit continues.
+
+    At most `max_concurrency` tasks are outstanding at once: raising an event with a coroutine callback while the limit is reached blocks the visit until a task completes, so a slow subscriber slows the visit down instead of accumulating tasks. All of the outstanding tasks are awaited before `after_document_end` returns. An exception raised by a task is re-raised by the next event with a coroutine callback or at the end of the document, whichever comes first. Synchronous callbacks are invoked in the visit as by the `SimpleSubscription`.
+
+    Parameters:
+        `max_concurrency`: the maximum number of outstanding tasks. The default is 64.
+        `loop`: the running event loop the tasks are scheduled on, such as the loop the asynchronous clients of the subscribers are bound to; it must be running in another thread. If `None` (the default), the subscription runs an event loop in a thread of its own, started with the first document and stopped by `close()`.
+
+    Notes:
+        - the tasks run concurrently, so the coroutine callbacks of consecutive events may complete in any order.
+        - the visit must not run on the thread of the event loop, which it would block.
+    """
+
+    def __init__( self, max_concurrency: int = 64, loop: asyncio.AbstractEventLoop = None ):
+        super().__init__()
+
+        if max_concurrency < 1:
+            raise ValueError( "Maximum concurrency must be at least 1." )
+
+        self._max_concurrency: int = int( max_concurrency )
+        self._loop: asyncio.AbstractEventLoop = loop
+        self._owns_loop: bool = loop is None
+        self._loop_thread: threading.Thread = None
+
+        self._condition: threading.Condition = threading.Condition()
+        self._pending_count: int = 0
+        self._errors: List[ BaseException ] = []
+
+    @property
+    def max_concurrency( self ) -> int:
+        """
+        The maximum number of outstanding tasks.
+        """
+
+        return self._max_concurrency
+
+    @property
+    def pending_count( self ) -> int:
+        """
+        The number of outstanding tasks.
+        """
+
+        return self._pending_count
+
+    def register( self, subscription_key: str, callback: Callable ) -> None:
+        """
+        Registers the given callback for the subscription associated with the given subscription key.
+
+        Arguments:
+            `subscription_key`: the key identifying the subscription.
+            `callback`: the callback invoked when the event is triggered; a coroutine function is scheduled as a task with the event arguments.
+        """
+
+        if asyncio.iscoroutinefunction( callback ):
+            def schedule( *args: Iterable[ Any ], **kwargs: Dict[ str, Any ] ) -> None:
+                self._schedule( callback, args, kwargs )
+
+            super().register( subscription_key, schedule )
+        else:
+            super().register( subscription_key, callback )
+
+    def _start_loop( self ) -> None:
+        """
+        Starts the event loop thread of the subscription, if it owns its event loop and the thread isn't running.
+        """
+
+        if not self._owns_loop or ( self._loop_thread is not None and self._loop_thread.is_alive() ):
+            return
+
+        loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop( loop )
+            loop.run_forever()
+
+        self._loop = loop
+        self._loop_thread = threading.Thread( target = run, name = f"{ self.__class__.__qualname__ } event loop", daemon = True )
+        self._loop_thread.start()
+
+    def _raise_task_error( self ) -> None:
+        """
+        Raises the first error raised by a task since the last error was raised, if any.
+        """
+
+        with self._condition:
+            if len( self._errors ) == 0:
+                return
+
+            error = self._errors[ 0 ]
+            self._errors = []
+
+        raise error
+
+    def _on_task_done( self, future: Future ) -> None:
+        with self._condition:
+            if not future.cancelled() and future.exception() is not None:
+                self._errors.append( future.exception() )
+
+            self._pending_count -= 1
+            self._condition.notify_all()
+
+    def _schedule( self, callback: Callable, args: Iterable[ Any ], kwargs: Dict[ str, Any ] ) -> None:
+        """
+        Schedules a coroutine callback as a task, waiting while the maximum number of tasks is outstanding.
+        """
+
+        self._raise_task_error()
+
+        if self._loop is None:
+            self._start_loop()
+
+        with self._condition:
+            while self._pending_count >= self._max_concurrency:
+                self._condition.wait()
+
+            self._pending_count += 1
+
+        try:
+            future = asyncio.run_coroutine_threadsafe( callback( *args, **kwargs ), self._loop )
+        except BaseException:
+            with self._condition:
+                self._pending_count -= 1
+                self._condition.notify_all()
+
+            raise
+
+        future.add_done_callback( self._on_task_done )
+
+    def drain( self ) -> None:
+        """
+        Waits until every outstanding task has completed.
+
+        Raises:
+            The first exception raised by a task, if any.
+        """
+
+        with self._condition:
+            while self._pending_count > 0:
+                self._condition.wait()
+
+        self._raise_task_error()
+
+    def close( self ) -> None:
+        """
+        Waits for the outstanding tasks and stops the event loop thread of the subscription; an event loop given to the subscription is left running. Errors raised by the tasks are discarded.
+        """
+
+        with self._condition:
+            while self._pending_count > 0:
+                self._condition.wait()
+
+            self._errors = []
+
+        if self._owns_loop and self._loop is not None:
+            loop = self._loop
+            self._loop = None
+
+            loop.call_soon_threadsafe( loop.stop )
+            self._loop_thread.join()
+            self._loop_thread = None
+            loop.close()
+
+    def before_document_start( self ) -> None:
+        self._start_loop()
+
+        super().before_document_start()
+
+    def after_document_end( self ) -> None:
+        super().after_document_end()
+
+        self.drain()
@@ -0,0 +1,257 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+PathComponent = Union[ str, int ]
+
+_InitialCapacity: int = 32
+
+class PathTracker( object ):
+    """
+    Tracks the path of the current value incrementally as the walk enters and leaves members and list items, so adapters can read where they are without walking the scope chain.
+
+    The path is a tuple of member keys and list item indices from the root value; `()` is the root value. The key of a member is part of the path from its member key events to its member value end events, and the index of a list item over its list item value events, so the start and end events of members and list items, objects and lists are at the path of the object or the list. The components are kept in a preallocated list and the tuple is built once per change, on the first read; the ijson-style prefix, such as `"a.item.b"`, is maintained as the path changes when `track_prefix` is set.
+
+    Parameters:
+        `track_prefix`: `True` to maintain the ijson-style `prefix`; `False` (the default) to skip it.
+    """
+
+    __slots__ = ( "_track_prefix", "_components", "_prefixes", "_next_indices", "_depth", "_path", "_item_index_offset" )
+
+    def __init__( self, track_prefix: bool = False ):
+        self._track_prefix: bool = track_prefix
+        self._components: List[ PathComponent ] = [ None ] * _InitialCapacity
+        self._prefixes: List[ str ] = [ "" ] * ( _InitialCapacity + 1 ) if track_prefix else None
+        self._next_indices: List[ int ] = []
+        self._depth: int = 0
+        self._path: Tuple[ PathComponent, ... ] = ()
+        self._item_index_offset: int = 0
+
+    def __getstate__( self ) -> Tuple[ Any, ... ]:
+        return ( self._track_prefix, self._item_index_offset, self.path, self._next_indices )
+
+    def __setstate__( self, state: Tuple[ Any, ... ] ) -> None:
+        track_prefix, item_index_offset, path, next_indices = state
+
+        self.__init__( track_prefix )
+        self._item_index_offset = item_index_offset
+
+        for component in path:
+            self._push( component )
+
+        self._next_indices = list( next_indices )
+
+    @property
+    def tracks_prefix( self ) -> bool:
+        """
+        `True` if the ijson-style prefix is maintained, `False` otherwise.
+        """
+
+        return self._track_prefix
+
+    @property
+    def depth( self ) -> int:
+        """
+        Gets the number of components of the current path.
+        """
+
+        return self._depth
+
+    @property
+    def path( self ) -> Tuple[ PathComponent, ... ]:
+        """
+        Gets the current path as a tuple of member keys and list item indices; the tuple is shared until the path changes.
+        """
+
+        path = self._path
+        if path is None:
+            path = tuple( self._components[ :self._depth ] )
+            self._path = path
+
+        return path
+
+    @property
+    def prefix( self ) -> str:
+        """
+        Gets the current path as an ijson prefix: the member keys and `item` for the list items, separated by dots; `""` is the root value.
+
+        Raises:
+            `ValueError` if the tracker doesn't track the prefix.
+        """
+
+        if not self._track_prefix:
+            raise ValueError( "The path tracker doesn't track the prefix." )
+
+        return self._prefixes[ self._depth ]
+
+    @property
+    def last_component( self ) -> PathComponent:
+        """
+        Gets the last component of the current path: the key of the current member or the index of the current list item, or `None` at the root value.
+        """
+
+        return self._components[ self._depth - 1 ] if self._depth > 0 else None
+
+    def get_component( self, level: int ) -> PathComponent:
+        """
+        Gets a component of the current path.
+
+        Parameters:
+            `level`: the index of the component, from 0 for the component below the root value; negative levels count from the end of the path.
+
+        Raises:
+            `IndexError` if there is no such component.
+        """
+
+        if level < 0:
+            level += self._depth
+        if level < 0 or level >= self._depth:
+            raise IndexError( f"Path component { level } is outside of the path." )
+
+        return self._components[ level ]
+
+    def _push( self, component: PathComponent ) -> None:
+        depth = self._depth
+
+        if depth == len( self._components ):
+            self._components.extend( [ None ] * depth )
+            if self._track_prefix:
+                self._prefixes.extend( [ "" ] * depth )
+
+        self._components[ depth ] = component
+        self._depth = depth + 1
+        self._path = None
+
+        if self._track_prefix:
+            name = "item" if type( component ) is int else component
+            self._prefixes[ depth + 1 ] = f"{ self._prefixes[ depth ] }.{ name }" if depth > 0 else name
+
+    def _pop( self ) -> None:
+        self._depth -= 1
+        self._path = None
+
+    def reset( self ) -> None:
+        """
+        Resets the path to the root value, at the start of a document.
+        """
+
+        self._depth = 0
+        self._path = ()
+        self._next_indices.clear()
+
+    def set_item_index_offset( self, offset: int ) -> None:
+        """
+        Sets the index of the first item of the root list in the following documents, as the simple `BaseAdapter.set_item_index_offset`.
+
+        Parameters:
+            `offset`: the index of the first item of the range in the whole list.
+        """
+
+        self._item_index_offset = offset
+
+    def set_next_item_index( self, index: int ) -> None:
+        """
+        Sets the index of the next item of the current list, when a visit resumes inside a list.
+
+        Parameters:
+            `index`: the index of the next item.
+        """
+
+        self._next_indices[ -1 ] = index
+
+    def enter_member( self, key: str ) -> None:
+        """
+        Appends the key of a member to the path, before the member key events.
+        """
+
+        depth = self._depth
+
+        if depth < len( self._components ) and not self._track_prefix:
+            self._components[ depth ] = key
+            self._depth = depth + 1
+            self._path = None
+        else:
+            self._push( key )
+
+    def leave_member( self ) -> None:
+        """
+        Removes the key of a member from the path, before the member end events.
+        """
+
+        self._pop()
+
+    def enter_list( self ) -> None:
+        """
+        Starts counting the items of a list, before the list start events.
+        """
+
+        self._next_indices.append( self._item_index_offset if self._depth == 0 else 0 )
+
+    def leave_list( self ) -> None:
+        """
+        Stops counting the items of a list, before the list end events.
+        """
+
+        self._next_indices.pop()
+
+    def enter_list_item( self ) -> None:
+        """
+        Appends the index of the next list item to the path, before the list item value start events.
+        """
+
+        next_indices = self._next_indices
+        index_ = next_indices[ -1 ]
+        next_indices[ -1 ] = index_ + 1
+
+        depth = self._depth
+
+        if depth < len( self._components ) and not self._track_prefix:
+            self._components[ depth ] = index_
+            self._depth = depth + 1
+            self._path = None
+        else:
+            self._push( index_ )
+
+    def leave_list_item( self ) -> None:
+        """
+        Removes the index of a list item from the path, before the list item end events.
+        """
+
+        self._pop()
+
+    def handle_event( self, event_name: str, args: Tuple[ Any, ... ] ) -> None:
+        """
+        Updates the path before an event is published, for adapters which receive recorded events instead of the events of a walker, such as the child adapters of the threaded and multiprocess composite adapters.
+
+        Parameters:
+            `event_name`: the name of the event handler; one of `EventNames`.
+            `args`: the arguments of the event.
+        """
+
+        update = _EventUpdates.get( event_name, None )
+        if update is not None:
+            update( self, *args )
+
+_EventUpdates: Dict[ str, Callable[ ..., None ] ] = {
+    "before_document_start": PathTracker.reset,
+    "before_member_key": PathTracker.enter_member,
+    "before_member_end": PathTracker.leave_member,
+    "before_list_start": PathTracker.enter_list,
+    "before_list_end": PathTracker.leave_list,
+    "before_list_item_value_start": PathTracker.enter_list_item,
+    "before_list_item_end": PathTracker.leave_list_item,
+}
+"""
+The path updates made before the events, by event name.
+"""
+
+def track_events( path_tracker: PathTracker, events: Iterable[ Tuple[ str, Tuple[ Any, ... ] ] ] ) -> Iterable[ Tuple[ str, Tuple[ Any, ... ] ] ]:
+    """
+    Updates the path tracker before yielding each event of a recorded event sequence.
+    """
+
+    handle_event = path_tracker.handle_event
+
+    for event_name, args in events:
+        handle_event( event_name, args )
+        yield event_name, args
@@ -0,0 +1,212 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Callable, Dict, Iterable, Tuple, Union
+
+import re
+from collections import deque
+from decimal import Decimal
+from functools import total_ordering
+
+NumberModes = ( "value", "lexeme", "lazy" )
+"""
+The number modes of the tokenizer: `value` publishes numbers converted by ijson, `lexeme` publishes them as `NumberLexeme` strings and `lazy` publishes them as `LazyNumber` objects.
+"""
+
+class NumberLexeme( str ):
+    """
+    The original text of a JSON number, published in the `lexeme` number mode; it is a `str` so it can be forwarded as-is, and its type distinguishes it from a JSON string.
+    """
+
+    __slots__ = ()
+
+    def __repr__( self ):
+        return f"{ type( self ).__name__ }({ str.__repr__( self ) })"
+
+@total_ordering
+class LazyNumber( object ):
+    """
+    A JSON number published in the `lazy` number mode: it holds the original text of the number and converts it on first use, to an `int` for integers and to a `Decimal`, or a `float` if `use_float` is set, otherwise.
+
+    `str()` returns the original text without converting it; comparisons, hashing and the numeric conversions use the converted value.
+    """
+
+    __slots__ = ( "lexeme", "use_float", "_value" )
+
+    def __init__( self, lexeme: str, use_float: bool = False ):
+        self.lexeme: str = lexeme
+        self.use_float: bool = use_float
+        self._value: Union[ int, float, Decimal ] = None
+
+    @property
+    def value( self ) -> Union[ int, float, Decimal ]:
+        """
+        Gets the converted value, converting the lexeme on first use.
+        """
+
+        value = self._value
+
+        if value is None:
+            lexeme = self.lexeme
+
+            if "." in lexeme or "e" in lexeme or "E" in lexeme:
+                value = float( lexeme ) if self.use_float else Decimal( lexeme )
+            else:
+                value = int( lexeme )
+
+            self._value = value
+
+        return value
+
+    @property
+    def is_integer( self ) -> bool:
+        """
+        `True` if the lexeme is an integer, `False` if it has a fraction or an exponent; doesn't convert the lexeme.
+        """
+
+        lexeme = self.lexeme
+
+        return not ( "." in lexeme or "e" in lexeme or "E" in lexeme )
+
+    def __str__( self ):
+        return self.lexeme
+
+    def __repr__( self ):
+        return f"{ type( self ).__name__ }({ self.lexeme !r})"
+
+    def __int__( self ):
+        return int( self.value )
+
+    def __float__( self ):
+        return float( self.value )
+
+    def __bool__( self ):
+        return bool( self.value )
+
+    def __hash__( self ):
+        return hash( self.value )
+
+    def __eq__( self, other: Any ) -> bool:
+        if isinstance( other, LazyNumber ):
+            other = other.value
+
+        return self.value == other
+
+    def __lt__( self, other: Any ) -> bool:
+        if isinstance( other, LazyNumber ):
+            other = other.value
+
+        return self.value < other
+
+    def __reduce__( self ):
+        return ( type( self ), ( self.lexeme, self.use_float ) )
+
+# A JSON number; symbols which look like numbers but don't match are left to the parser to reject.
+_NumberPattern = re.compile( r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?\Z" )
+_NumberStart = frozenset( "-0123456789" )
+
+# The placeholder the parser converts in place of each number; the lexemes are queued in the same order.
+_Placeholder = "0"
+
+# The ijson versions whose pure-Python backend internals the tokenizer is built from; the range is also pinned in the package requirements.
+_MinimumIjsonVersion: Tuple[ int, int ] = ( 3, 1 )
+_MaximumIjsonVersion: Tuple[ int, int ] = ( 4, 0 )
+
+_python_backend: Tuple[ Any, ... ] = None
+
+def load_python_backend() -> Tuple[ Any, ... ]:
+    """
+    Loads the parts of the ijson pure-Python backend the tokenizer is built from: `common.file_source`, `utils.coroutine`, `utils.coros2gen` and the backend's `parse_value`, `Lexer` and `utf8_encoder`.
+
+    These are internals of ijson rather than its public interface, so only the ijson versions they are known to work with are accepted, and a missing part is reported when the tokenizer is set up rather than as a failure in the middle of a parse.
+
+    Raises:
+        `ImportError` if the installed ijson version is not supported or doesn't provide the backend parts.
+    """
+
+    global _python_backend
+
+    if _python_backend is None:
+        import ijson
+
+        supported_versions = f">={ '.'.join( map( str, _MinimumIjsonVersion ) ) },<{ '.'.join( map( str, _MaximumIjsonVersion ) ) }"
+        version_text = getattr( ijson, "__version__", "0" )
+        version = tuple( int( part ) for part in re.findall( r"[0-9]+", version_text )[ :2 ] )
+
+        if not _MinimumIjsonVersion <= version < _MaximumIjsonVersion:
+            raise ImportError( f"The lexeme and lazy number modes require ijson { supported_versions }; ijson { version_text } is installed." )
+
+        try:
+            from ijson import common, utils
+            from ijson.backends import python as backend
+
+            _python_backend = ( common.file_source, utils.coroutine, utils.coros2gen, backend.parse_value, backend.Lexer, backend.utf8_encoder )
+        except ( ImportError, AttributeError ) as e:
+            raise ImportError( f"The lexeme and lazy number modes require the pure-Python backend of ijson { supported_versions }, which ijson { version_text } doesn't provide: { e }" ) from e
+
+    return _python_backend
+
+def _number_lexeme_filter( target: Any, lexemes: deque ) -> Any:
+    """
+    Coroutine between the lexer and the parser of the ijson pure-Python backend which queues the number lexemes and passes placeholders to the parser, so the parser doesn't convert the numbers.
+    """
+
+    send = target.send
+    append = lexemes.append
+
+    while True:
+        position, symbol = ( yield )
+
+        if symbol is not None and symbol[ 0 ] in _NumberStart and _NumberPattern.match( symbol ):
+            append( symbol )
+            symbol = _Placeholder
+
+        try:
+            send( ( position, symbol ) )
+        except StopIteration:
+            return
+
+def basic_parse_raw_numbers( source_file: Any, make_number: Callable[ [ str ], Any ], **kwargs: Dict[ str, Any ] ) -> Iterable[ Tuple[ str, Any ] ]:
+    """
+    Tokenizes the source file like `ijson.basic_parse`, publishing numbers as the result of `make_number` called with their original text instead of converting them.
+
+    The ijson C backends don't expose the number lexemes, so this tokenizer is built from the ijson pure-Python backend's lexer and parser; see `load_python_backend`.
+
+    Parameters:
+        `source_file`: the file-like object to tokenize.
+        `make_number`: the function creating the published value from the lexeme of a number.
+
+    Keyword Arguments:
+        `multiple_values`: `True` if the source contains a sequence of documents, `False` otherwise.
+        `buf_size`: the read size; the default is 64 KiB.
+
+    Raises:
+        `ImportError` if the installed ijson version is not supported.
+    """
+
+    file_source, coroutine, coros2gen, parse_value, Lexer, utf8_encoder = load_python_backend()
+
+    lexemes = deque()
+    start_filter = coroutine( _number_lexeme_filter )
+
+    tokens = coros2gen(
+        file_source( source_file, kwargs.get( "buf_size", 64 * 1024 ) ),
+        ( parse_value, ( kwargs.get( "multiple_values", False ), False ), {} ),
+        ( start_filter, ( lexemes, ), {} ),
+        ( Lexer, (), {} ),
+        ( utf8_encoder, (), {} ),
+    )
+
+    return _publish_numbers( tokens, make_number, lexemes )
+
+def _publish_numbers( tokens: Iterable[ Tuple[ str, Any ] ], make_number: Callable[ [ str ], Any ], lexemes: deque ) -> Iterable[ Tuple[ str, Any ] ]:
+    """
+    Replaces the placeholder values of the number tokens with the values made from the queued lexemes; kept apart from `basic_parse_raw_numbers` so the backend is loaded when the tokenizer is set up, before any token is read.
+    """
+
+    pop_lexeme = lexemes.popleft
+
+    for event, value in tokens:
+        if event == "number":
+            value = make_number( pop_lexeme() )
+
+        yield event, value
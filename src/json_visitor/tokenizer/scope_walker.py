@@ -3,7 +3,9 @@ __version__ = r"1.0.0"
 from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from enum import Enum, auto
+from operator import attrgetter
 from ..simple_adapters.base_adapter import BaseAdapter
+from .path_tracker import PathTracker
 
 class ScopeTypes( Enum ):
     RootObject = auto()
@@ -16,6 +18,13 @@ class ScopeTypes( Enum ):
     MemberValue = auto()
     Value = auto()
 
+# The `process_` callback getters of the scalar events; the typed getters let the tokenizer dispatch on the token type instead of the adapters testing the type of every value.
+_GetProcessValue = attrgetter( "process_value" )
+_GetProcessString = attrgetter( "process_string" )
+_GetProcessNumber = attrgetter( "process_number" )
+_GetProcessBoolean = attrgetter( "process_boolean" )
+_GetProcessNull = attrgetter( "process_null" )
+
 class ScopeWalker( object ):
     # TODO: Update the order of execution documentation.
     """
@@ -34,14 +43,32 @@ class ScopeWalker( object ):
     3. "process_" callback.
     4. "after_" callback.
     5. Pop current scope.
+
+    The path of the current value is maintained in a `PathTracker`, which is set on the adapters with their `set_path_tracker`.
+
+    Parameters:
+        `adapters`: the adapters the events are published to.
+        `track_prefix`: `True` to maintain the ijson-style prefix of the path tracker; `False` (the default) to skip it.
     """
 
-    def __init__( self, *adapters: Iterable[ BaseAdapter ] ):
+    def __init__( self, *adapters: Iterable[ BaseAdapter ], track_prefix: bool = False ):
         self._adapters: Tuple[ BaseAdapter ] = tuple( adapters )
 
         self._scope_stack: List[ ScopeTypes ] = []
         self._member_scope_initialization_stack = []
 
+        self._path_tracker: PathTracker = PathTracker( track_prefix )
+        for adapter in self._adapters:
+            adapter.set_path_tracker( self._path_tracker )
+
+    @property
+    def path_tracker( self ) -> PathTracker:
+        """
+        Gets the path tracker of the walk.
+        """
+
+        return self._path_tracker
+
     @property
     def current_scope_type( self ) -> ScopeTypes:
         """
@@ -55,6 +82,7 @@ class ScopeWalker( object ):
 
     def process_document_start( self ) -> None:
         self._scope_stack.append( ScopeTypes.RootObject )
+        self._path_tracker.reset()
 
         for adapter in self._adapters:
             adapter.before_document_start()
@@ -127,6 +155,7 @@ class ScopeWalker( object ):
             adapter.after_member_start()
 
         self._scope_stack.append( ScopeTypes.MemberName )
+        self._path_tracker.enter_member( value )
 
         for adapter in self._adapters:
             adapter.before_member_key( value )
@@ -162,6 +191,7 @@ class ScopeWalker( object ):
             adapter.after_member_value_end()
 
         self._scope_stack.pop()
+        self._path_tracker.leave_member()
 
         for adapter in self._adapters:
             adapter.before_member_end()
@@ -181,6 +211,7 @@ class ScopeWalker( object ):
             self._process_list_member_value_start()
 
         self._scope_stack.append( ScopeTypes.List )
+        self._path_tracker.enter_list()
 
         for adapter in self._adapters:
             adapter.before_list_start()
@@ -192,6 +223,8 @@ class ScopeWalker( object ):
             adapter.after_list_start()
 
     def process_end_array( self, value: Any ) -> None:
+        self._path_tracker.leave_list()
+
         for adapter in self._adapters:
             adapter.before_list_end()
 
@@ -221,6 +254,7 @@ class ScopeWalker( object ):
             adapter.after_list_item_start()
 
         self._scope_stack.append( ScopeTypes.ListItemValue )
+        self._path_tracker.enter_list_item()
 
         for adapter in self._adapters:
             adapter.before_list_item_value_start()
@@ -242,6 +276,7 @@ class ScopeWalker( object ):
             adapter.after_list_item_value_end()
 
         self._scope_stack.pop()
+        self._path_tracker.leave_list_item()
 
         for adapter in self._adapters:
             adapter.before_list_item_end()
@@ -255,6 +290,21 @@ class ScopeWalker( object ):
         self._scope_stack.pop()
 
     def process_value( self, value: Any ) -> None:
+        self._process_scalar( value, _GetProcessValue )
+
+    def process_string( self, value: str ) -> None:
+        self._process_scalar( value, _GetProcessString )
+
+    def process_number( self, value: Any ) -> None:
+        self._process_scalar( value, _GetProcessNumber )
+
+    def process_boolean( self, value: bool ) -> None:
+        self._process_scalar( value, _GetProcessBoolean )
+
+    def process_null( self, value: None ) -> None:
+        self._process_scalar( value, _GetProcessNull )
+
+    def _process_scalar( self, value: Any, get_process: Callable[ [ BaseAdapter ], Callable[ [ Any ], None ] ] ) -> None:
         is_member_value: bool = self.current_scope_type == ScopeTypes.Member
         is_list_item_value: bool = self.current_scope_type == ScopeTypes.List
 
@@ -269,7 +319,7 @@ class ScopeWalker( object ):
             adapter.before_value( value )
 
         for adapter in self._adapters:
-            adapter.process_value( value )
+            get_process( adapter )( value )
 
         for adapter in self._adapters:
             adapter.after_value( value )
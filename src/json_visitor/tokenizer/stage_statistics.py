@@ -0,0 +1,129 @@
+__version__ = r"1.0.0"
+
+from typing import Any, Dict
+
+class StageStatistics( object ):
+    """
+    Holds the processing statistics of a tokenizer run, or of the runs of a visit reading several byte ranges, broken down by processing stage.
+
+    The stages are:
+    - tokenizer: the time spent in `ijson` producing tokens, including reading the input.
+    - walker: the time spent dispatching tokens and maintaining the scope stack in the `ScopeWalker`.
+    - adapters: the time spent in the adapter event handlers.
+    """
+
+    def __init__( self ):
+        self.total_ns: int = 0
+        self.tokenizer_ns: int = 0
+        self.walker_ns: int = 0
+        self.adapter_ns: int = 0
+
+        self.bytes_consumed: int = 0
+        self.token_count: int = 0
+        self.token_counts: Dict[ str, int ] = {}
+        self.adapter_event_count: int = 0
+        self.peak_scope_depth: int = 0
+
+    @staticmethod
+    def _rate( amount: float, duration_ns: int ) -> float:
+        return amount * 1e9 / duration_ns if duration_ns > 0 else 0.0
+
+    @property
+    def megabytes_per_second( self ) -> float:
+        """
+        The overall input throughput, in megabytes (10^6 bytes) per second.
+        """
+
+        return self._rate( self.bytes_consumed / 1e6, self.total_ns )
+
+    @property
+    def tokenizer_megabytes_per_second( self ) -> float:
+        """
+        The input throughput of the tokenizer stage alone, in megabytes (10^6 bytes) per second.
+        """
+
+        return self._rate( self.bytes_consumed / 1e6, self.tokenizer_ns )
+
+    @property
+    def tokens_per_second( self ) -> float:
+        """
+        The overall token throughput, in tokens per second.
+        """
+
+        return self._rate( self.token_count, self.total_ns )
+
+    @property
+    def adapter_events_per_second( self ) -> float:
+        """
+        The overall adapter event throughput, in adapter event handler calls per second.
+        """
+
+        return self._rate( self.adapter_event_count, self.total_ns )
+
+    def add( self, other: "StageStatistics" ) -> None:
+        """
+        Adds the statistics of another run, such as another byte range of the same visit, to the statistics.
+
+        Parameters:
+            `other`: the statistics to add.
+        """
+
+        self.total_ns += other.total_ns
+        self.tokenizer_ns += other.tokenizer_ns
+        self.walker_ns += other.walker_ns
+        self.adapter_ns += other.adapter_ns
+
+        self.bytes_consumed += other.bytes_consumed
+        self.token_count += other.token_count
+        for name, count in other.token_counts.items():
+            self.token_counts[ name ] = self.token_counts.get( name, 0 ) + count
+        self.adapter_event_count += other.adapter_event_count
+        self.peak_scope_depth = max( self.peak_scope_depth, other.peak_scope_depth )
+
+    def to_dict( self ) -> Dict[ str, Any ]:
+        """
+        Gets the statistics as a dictionary.
+
+        Returns:
+            Dictionary of the statistics, including the derived throughputs.
+        """
+
+        return {
+            "total_ns": self.total_ns,
+            "tokenizer_ns": self.tokenizer_ns,
+            "walker_ns": self.walker_ns,
+            "adapter_ns": self.adapter_ns,
+            "bytes_consumed": self.bytes_consumed,
+            "token_count": self.token_count,
+            "token_counts": dict( self.token_counts ),
+            "adapter_event_count": self.adapter_event_count,
+            "peak_scope_depth": self.peak_scope_depth,
+            "megabytes_per_second": self.megabytes_per_second,
+            "tokenizer_megabytes_per_second": self.tokenizer_megabytes_per_second,
+            "tokens_per_second": self.tokens_per_second,
+            "adapter_events_per_second": self.adapter_events_per_second,
+        }
+
+    def format_report( self ) -> str:
+        """
+        Formats the statistics as human-readable text.
+
+        Returns:
+            The text report.
+        """
+
+        def share( duration_ns: int ) -> str:
+            return f"{ duration_ns / 1e6:.3f} ms ({ duration_ns * 100 / self.total_ns if self.total_ns > 0 else 0.0:.1f}%)"
+
+        return "\n".join( [
+            f"Total: { self.total_ns / 1e6:.3f} ms",
+            f"Tokenizer: { share( self.tokenizer_ns ) }",
+            f"Walker: { share( self.walker_ns ) }",
+            f"Adapters: { share( self.adapter_ns ) }",
+            f"Bytes consumed: { self.bytes_consumed }",
+            f"Tokens: { self.token_count } ({ ', '.join( f'{ name }: { count }' for name, count in sorted( self.token_counts.items() ) ) })",
+            f"Adapter events: { self.adapter_event_count }",
+            f"Peak scope depth: { self.peak_scope_depth }",
+            f"Throughput: { self.megabytes_per_second:.3f} MB/s, { self.tokens_per_second:.0f} tokens/s, { self.adapter_events_per_second:.0f} adapter events/s",
+            f"Tokenizer throughput: { self.tokenizer_megabytes_per_second:.3f} MB/s",
+        ] )
@@ -1,29 +1,98 @@
 __version__ = r"1.0.0"
 
-from typing import Any, Dict, Callable, TextIO, Union
+from typing import Any, BinaryIO, Dict, Callable, Iterable, TextIO, Tuple, Union
 
-import ijson
-from io import StringIO
+from io import BytesIO, StringIO
+from time import perf_counter_ns
+from ..simple_adapters.base_adapter import BaseAdapter
+from ..simple_adapters.event_adapter import EventAdapter
 from .scope_walker import ScopeWalker
+from .stage_statistics import StageStatistics
+
+def _basic_parse( source_file: Any, **kwargs: Dict[ str, Any ] ) -> Iterable[ Tuple[ str, Any ] ]:
+    # ijson and its backend are loaded on first use rather than when the module is imported.
+    import ijson
+
+    return ijson.basic_parse( source_file, **kwargs )
+
+class _CountingReader( object ):
+    """
+    Wraps a file-like object, counting the bytes read from it; text is counted in UTF-8 encoded bytes.
+    """
+
+    def __init__( self, source_file: Any, statistics: StageStatistics ):
+        self._source_file = source_file
+        self._statistics: StageStatistics = statistics
+
+    def read( self, size: int = -1 ) -> Union[ bytes, str ]:
+        data = self._source_file.read( size )
+
+        self._statistics.bytes_consumed += len( data.encode( "utf-8" ) ) if isinstance( data, str ) else len( data )
+
+        return data
+
+class _TimedAdapter( EventAdapter ):
+    """
+    Wraps an adapter, attributing the time spent in its event handlers to the adapter stage.
+    """
+
+    def __init__( self, adapter: BaseAdapter, scope_walker: ScopeWalker, statistics: StageStatistics ):
+        self._adapter: BaseAdapter = adapter
+        self._scope_walker: ScopeWalker = scope_walker
+        self._statistics: StageStatistics = statistics
+
+    def handle_event( self, event_name: str, *args: Iterable[ Any ] ) -> None:
+        statistics = self._statistics
+
+        depth = len( self._scope_walker._scope_stack )
+        if depth > statistics.peak_scope_depth:
+            statistics.peak_scope_depth = depth
+
+        start = perf_counter_ns()
+        getattr( self._adapter, event_name )( *args )
+        statistics.adapter_ns += perf_counter_ns() - start
+        statistics.adapter_event_count += 1
 
 class TokenProcessor( object ):
     """
     Implements a JSON tokenizer and uses the tokens to publish events through the Visitor interface.
     """
 
-    def __init__( self, scope_walker: ScopeWalker ):
+    def __init__( self, scope_walker: ScopeWalker, collect_statistics: bool = False, use_float: bool = False, number_mode: str = "value", key_intern_limit: int = 4096 ):
         self._internal_scope_walker: ScopeWalker = scope_walker
 
+        self._collect_statistics: bool = bool( collect_statistics )
+        self._use_float: bool = bool( use_float )
+
+        self._number_mode: str = number_mode
+        self._make_number: Callable[ [ str ], Any ] = None
+        if number_mode != "value":
+            from .raw_numbers import LazyNumber, NumberLexeme, NumberModes
+
+            if number_mode not in NumberModes:
+                raise ValueError( f"Invalid number mode '{ number_mode }': it must be one of { ', '.join( NumberModes ) }" )
+            elif number_mode == "lexeme":
+                self._make_number = NumberLexeme
+            elif self._use_float:
+                self._make_number = lambda lexeme: LazyNumber( lexeme, True )
+            else:
+                self._make_number = LazyNumber
+        self._statistics: StageStatistics = None
+
+        # Member keys repeat across the objects of a document and across documents; publishing one string object per distinct key shares the key strings, and their cached hashes, between all the scopes and contextual dictionaries holding them. The table is cleared when it reaches the limit, so high-cardinality keys can't grow it without bound.
+        self._key_intern_limit: int = max( key_intern_limit, 0 )
+        self._interned_keys: Dict[ str, str ] = {}
+
         self._event_handlers: Dict[ str, Callable[ [ Any ], None ] ] = {
             "start_map": self._scope_walker.process_start_map,
-            "map_key": self._scope_walker.process_map_key,
+            "map_key": self._process_map_key if self._key_intern_limit > 0 else self._scope_walker.process_map_key,
             "end_map": self._scope_walker.process_end_map,
             "start_array": self._scope_walker.process_start_array,
             "end_array": self._scope_walker.process_end_array,
-            "number": self._scope_walker.process_value,
-            "string": self._scope_walker.process_value,
-            "boolean": self._scope_walker.process_value,
-            "null": self._scope_walker.process_value,
+            "number": self._scope_walker.process_number,
+            "string": self._scope_walker.process_string,
+            "boolean": self._scope_walker.process_boolean,
+            "null": self._scope_walker.process_null,
         }
 
     @property
@@ -37,29 +106,257 @@ class TokenProcessor( object ):
 
         return self._internal_scope_walker
 
-    def process( self, input_source: Union[ TextIO, str ] ) -> None:
+    @property
+    def collect_statistics( self ) -> bool:
+        """
+        `True` if the processing statistics are collected, `False` otherwise.
         """
-        Tokenizes the input and processes the tokens, pushing the walk sequence through the adapters in the scope walker.
 
-        Parameters:
-            `input_source`: text file-object or string containing the input to process.
+        return self._collect_statistics
+
+    @property
+    def use_float( self ) -> bool:
+        """
+        `True` if non-integer numbers are tokenized as `float`, `False` if they are tokenized as `decimal.Decimal`.
+        """
+
+        return self._use_float
+
+    @property
+    def number_mode( self ) -> str:
+        """
+        Gets the number mode: `value` if numbers are converted by the tokenizer, `lexeme` if they are published as `NumberLexeme` strings holding their original text and `lazy` if they are published as `LazyNumber` objects converting their original text on first use.
+        """
+
+        return self._number_mode
+
+    @property
+    def key_intern_limit( self ) -> int:
+        """
+        Gets the maximum number of distinct member keys interned; 0 if the member keys are not interned.
+        """
+
+        return self._key_intern_limit
+
+    @property
+    def interned_key_count( self ) -> int:
+        """
+        Gets the number of distinct member keys currently interned.
+        """
+
+        return len( self._interned_keys )
+
+    def clear_interned_keys( self ) -> None:
+        """
+        Clears the member key intern table; the table otherwise persists across inputs and documents.
+        """
+
+        self._interned_keys.clear()
+
+    def _process_map_key( self, key: str ) -> None:
+        interned_keys = self._interned_keys
+        interned_key = interned_keys.get( key, None )
+
+        if interned_key is None:
+            if len( interned_keys ) >= self._key_intern_limit:
+                interned_keys.clear()
+
+            interned_keys[ key ] = key
+            interned_key = key
+
+        self._internal_scope_walker.process_map_key( interned_key )
+
+    @property
+    def statistics( self ) -> StageStatistics:
+        """
+        Gets the processing statistics of the last processed input.
 
         Returns:
-            None
+            The processing statistics of the last processed input; `None` if the statistics are not collected or no input has been processed.
+        """
+
+        return self._statistics
+
+    def reset_statistics( self ) -> None:
+        """
+        Discards the processing statistics of the last processed input, so `statistics` is `None` until the next input is processed.
+        """
+
+        self._statistics = None
+
+    @staticmethod
+    def _get_source_file( input_source: Union[ TextIO, BinaryIO, str, bytes ] ) -> Any:
+        """
+        Gets the file-like object to tokenize for the input source.
         """
 
         if input_source is None:
             raise ValueError( "Input source cannot be None." )
         elif isinstance( input_source, str ):
-            source_file = StringIO( input_source )
+            return StringIO( input_source )
+        elif isinstance( input_source, ( bytes, bytearray, memoryview ) ):
+            return BytesIO( input_source )
         else:
-            source_file = input_source
+            return input_source
+
+    def _tokenize( self, source_file: Any, **kwargs: Dict[ str, Any ] ) -> Iterable[ Tuple[ str, Any ] ]:
+        """
+        Gets the token iterator of the source file with the tokenizer options of the processor.
+        """
+
+        if self._make_number is not None:
+            from .raw_numbers import basic_parse_raw_numbers
+
+            return basic_parse_raw_numbers( source_file, self._make_number, **kwargs )
+
+        if self._use_float:
+            kwargs[ "use_float" ] = True
+
+        return _basic_parse( source_file, **kwargs )
+
+    def process( self, input_source: Union[ TextIO, BinaryIO, str, bytes ] ) -> None:
+        """
+        Tokenizes the input and processes the tokens, pushing the walk sequence through the adapters in the scope walker.
+
+        Parameters:
+            `input_source`: text or binary file-object, string or UTF-8 encoded bytes containing the input to process.
+
+        Returns:
+            None
+        """
+
+        source_file = self._get_source_file( input_source )
+
+        if self._collect_statistics:
+            self._process_with_statistics( source_file )
+        else:
+            self.process_tokens( self._tokenize( source_file ) )
+
+    def process_documents( self, input_source: Union[ TextIO, BinaryIO, str, bytes ] ) -> None:
+        """
+        Tokenizes an input containing a sequence of JSON documents, such as JSON Lines (NDJSON), and processes the tokens; each top-level value is published as a separate document.
+
+        Parameters:
+            `input_source`: text or binary file-object, string or UTF-8 encoded bytes containing the input to process.
+
+        Returns:
+            None
+        """
+
+        source_file = self._get_source_file( input_source )
+
+        if self._collect_statistics:
+            self._process_with_statistics( source_file, multiple_documents = True )
+        else:
+            self.process_tokens( self._tokenize( source_file, multiple_values = True ), multiple_documents = True )
+
+    def process_tokens( self, tokens: Iterable[ Tuple[ str, Any ] ], multiple_documents: bool = False ) -> None:
+        """
+        Processes a sequence of tokens in the `ijson.basic_parse` format, pushing the walk sequence through the adapters in the scope walker.
+
+        Parameters:
+            `tokens`: iterable of `( event, value )` tuples.
+            `multiple_documents`: `True` if the tokens contain a sequence of documents, each top-level value being published as a separate document; `False` if the tokens contain a single document.
+
+        Returns:
+            None
+        """
+
+        scope_walker = self._internal_scope_walker
+        event_handlers = self._event_handlers
+
+        if not multiple_documents:
+            scope_walker.process_document_start()
+
+            for event, value in tokens:
+                handler = event_handlers.get( event, None )
+                if handler is not None:
+                    handler( value )
+
+            scope_walker.process_document_end()
+        else:
+            depth: int = 0
+
+            for event, value in tokens:
+                if depth == 0:
+                    scope_walker.process_document_start()
+
+                handler = event_handlers.get( event, None )
+                if handler is not None:
+                    handler( value )
+
+                if event == "start_map" or event == "start_array":
+                    depth += 1
+                elif event == "end_map" or event == "end_array":
+                    depth -= 1
+
+                if depth == 0:
+                    scope_walker.process_document_end()
+
+    def _process_with_statistics( self, source_file: Any, multiple_documents: bool = False ) -> None:
+        """
+        Processes the input like `process`, or like `process_documents` with `multiple_documents`, attributing the elapsed time to the tokenizer, walker and adapter stages.
+
+        The uninstrumented loop in `process_tokens` is kept separate so the statistics cost nothing when they are not collected.
+        """
+
+        statistics = StageStatistics()
+        self._statistics = statistics
+
+        scope_walker = self._internal_scope_walker
+        adapters = scope_walker._adapters
+        scope_walker._adapters = tuple( _TimedAdapter( adapter, scope_walker, statistics ) for adapter in adapters )
+
+        token_counts: Dict[ str, int ] = statistics.token_counts
+        depth: int = 0
+
+        try:
+            processing_start = perf_counter_ns()
+
+            # The tokenizer setup, which imports ijson and its backend on first use, is tokenizer time.
+            reader = _CountingReader( source_file, statistics )
+            tokens = iter( self._tokenize( reader, multiple_values = True ) if multiple_documents else self._tokenize( reader ) )
+            tokenizer_ns: int = perf_counter_ns() - processing_start
+
+            if not multiple_documents:
+                scope_walker.process_document_start()
+
+            while True:
+                start = perf_counter_ns()
+                try:
+                    event, value = next( tokens )
+                except StopIteration:
+                    tokenizer_ns += perf_counter_ns() - start
+                    break
+                tokenizer_ns += perf_counter_ns() - start
+
+                if multiple_documents and depth == 0:
+                    scope_walker.process_document_start()
+
+                handler = self._event_handlers.get( event, None )
+                if handler is not None:
+                    handler( value )
+
+                token_counts[ event ] = token_counts.get( event, 0 ) + 1
+
+                if multiple_documents:
+                    if event == "start_map" or event == "start_array":
+                        depth += 1
+                    elif event == "end_map" or event == "end_array":
+                        depth -= 1
+
+                    if depth == 0:
+                        scope_walker.process_document_end()
 
-        self._internal_scope_walker.process_document_start()
+            if not multiple_documents:
+                scope_walker.process_document_end()
 
-        for event, value in ijson.basic_parse( source_file ):
-            handler = self._event_handlers.get( event, None )
-            if handler is not None:
-                handler( value )
+            processing_end = perf_counter_ns()
+        finally:
+            scope_walker._adapters = adapters
 
-        self._internal_scope_walker.process_document_end()
+        # The walker stage is everything which is neither tokenizing nor adapter work: the handler lookup, the scope stack bookkeeping and the instrumentation itself.
+        statistics.total_ns = processing_end - processing_start
+        statistics.tokenizer_ns = tokenizer_ns
+        statistics.walker_ns = max( statistics.total_ns - tokenizer_ns - statistics.adapter_ns, 0 )
+        statistics.token_count = sum( token_counts.values() )